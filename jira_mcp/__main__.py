@@ -1,35 +1,107 @@
 #!/usr/bin/env python3.12
 """
 Main entry point for the Jira MCP package.
+
+usage: python -m jira_mcp [-h] [--transport {stdio}] [--debug] [--daemon] [--socket SOCKET]
+
+Jira MCP Server
+
+options:
+  -h, --help           show this help message and exit
+  --transport {stdio}  Transport type to use (currently only stdio)
+  --debug              Enable debug logging
+  --daemon             Run as a long-lived daemon on a Unix socket
+  --socket SOCKET      Daemon socket path (default: $XDG_RUNTIME_DIR/jira-mcp.sock)
+
+Examples:
+  python -m jira_mcp              # Run with stdio transport
+  python -m jira_mcp --debug      # Run with debug logging
+  python -m jira_mcp --daemon     # Keep the server warm; connect with jira-mcp-client
+
+This MCP server provides tools for interacting with Jira Cloud:
+- jira_workspace: Workspace management and connectivity testing
+- jira_issues: Issue CRUD, search, comments, attachments, links
+- jira_projects: Project discovery and metadata
 """
 
-import os
+import functools
 import sys
 import logging
-import asyncio
-import argparse
-from .server import run
+from types import SimpleNamespace
+from typing import Any, List, Optional
 
-# Let MCP framework handle logging configuration - just get our logger
+# Logging is configured in main() once arguments are parsed; until then stay silent
 logger = logging.getLogger("jira-mcp")
-logger.setLevel(logging.INFO)
+logger.addHandler(logging.NullHandler())
 
-
-def parse_args():
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(
-        description="Jira MCP Server",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_EPILOG = """
 Examples:
   python -m jira_mcp              # Run with stdio transport
   python -m jira_mcp --debug      # Run with debug logging
+  python -m jira_mcp --daemon     # Keep the server warm; connect with jira-mcp-client
 
 This MCP server provides tools for interacting with Jira Cloud:
 - jira_workspace: Workspace management and connectivity testing
 - jira_issues: Issue CRUD, search, comments, attachments, links
 - jira_projects: Project discovery and metadata
-        """,
+"""
+
+
+def parse_args(argv: Optional[List[str]] = None) -> Any:
+    """
+    Parse command line arguments.
+
+    The supported flags are matched directly against argv so the common
+    invocations never import argparse. Anything unrecognised is handed to the
+    full argparse parser, which produces the usual error message.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    transport = "stdio"
+    debug = False
+    daemon = False
+    socket_path = None
+
+    index = 0
+    while index < len(argv):
+        arg = argv[index]
+        if arg in ("-h", "--help"):
+            print((__doc__ or "").strip())
+            sys.exit(0)
+        if arg == "--debug":
+            debug = True
+        elif arg == "--transport=stdio":
+            transport = "stdio"
+        elif arg == "--transport" and argv[index + 1:index + 2] == ["stdio"]:
+            transport = "stdio"
+            index += 1
+        elif arg == "--daemon":
+            daemon = True
+        elif arg.startswith("--socket="):
+            socket_path = arg.split("=", 1)[1]
+        elif arg == "--socket" and index + 1 < len(argv):
+            socket_path = argv[index + 1]
+            index += 1
+        else:
+            return _parse_args_full(argv)
+        index += 1
+
+    return SimpleNamespace(transport=transport, debug=debug, daemon=daemon, socket=socket_path)
+
+
+def _parse_args_full(argv: List[str]) -> Any:
+    """Parse command line arguments with argparse (slow path for unknown input)."""
+    return _get_parser().parse_args(argv)
+
+
+@functools.cache
+def _get_parser() -> Any:
+    """Build the argparse parser once per process."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Jira MCP Server",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG,
     )
 
     # Transport type (currently only stdio, but future-ready)
@@ -43,26 +115,55 @@ This MCP server provides tools for interacting with Jira Cloud:
     # Debug mode
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
-    return parser.parse_args()
+    # Daemon mode (Unix socket, amortizes start-up across client invocations)
+    parser.add_argument("--daemon", action="store_true", help="Run as a long-lived daemon on a Unix socket")
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help="Daemon socket path (default: $XDG_RUNTIME_DIR/jira-mcp.sock)",
+    )
+
+    return parser
 
 
-async def main():
+async def main() -> None:
     """Main entry point for the Jira MCP package."""
     try:
         args = parse_args()
 
+        logging.basicConfig(
+            level=logging.DEBUG if args.debug else logging.INFO,
+            format="%(message)s",
+        )
+
+        # Collapse bursts of identical errors (repeated failing tool calls) to one line
+        from .utils import DuplicateErrorFilter
+
+        for handler in logging.getLogger().handlers:
+            handler.addFilter(DuplicateErrorFilter())
+
         # Set debug logging if requested
         if args.debug:
-            logging.getLogger().setLevel(logging.DEBUG)
+            from .config import set_debug
+
             logger.debug("Debug logging enabled")
-            # Also set debug in environment for other modules
-            os.environ["DEBUG"] = "true"
+            # Also expose the flag to other modules (read via config.is_debug())
+            set_debug(True)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("🚀 Starting Jira MCP Server")
+            logger.info("📡 Transport: %s", "daemon" if args.daemon else args.transport)
 
-        logger.info("🚀 Starting Jira MCP Server")
-        logger.info("📡 Transport: %s", args.transport)
+        # Import the server stack only once arguments are known, so --help stays fast
+        if args.daemon:
+            from .server import run_daemon
 
-        # Run the MCP server
-        await run()
+            await run_daemon(args.socket)
+        else:
+            from .server import run
+
+            # Run the MCP server
+            await run()
 
     except KeyboardInterrupt:
         logger.info("👋 Shutdown requested by user")
@@ -72,11 +173,13 @@ async def main():
         sys.exit(1)
 
 
-def run_main():
+def run_main() -> None:
     """
     Synchronous wrapper for the async main function.
     This function is used as the entry point for the console script.
     """
+    import asyncio
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -5,30 +5,103 @@ Configuration Loading and Validation Utilities
 Configuration management for the Jira MCP Server.
 """
 
+import functools
+import io
 import logging
 import os
 import sys
-from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Final, Mapping, Optional, Tuple, cast
 
 # Handle non-UTF-8 locales - force UTF-8 for I/O
 # This prevents UnicodeEncodeError on systems with Latin-1 or other encodings
 os.environ.setdefault('PYTHONIOENCODING', 'utf-8')
 
-# Reconfigure stdout/stderr to use UTF-8 with error handling
-if sys.stdout.encoding.lower() not in ('utf-8', 'utf8'):
-    import io
-    sys.stdout = io.TextIOWrapper(sys.stdout.detach(), encoding='utf-8', errors='replace', line_buffering=True)
-    sys.stderr = io.TextIOWrapper(sys.stderr.detach(), encoding='utf-8', errors='replace', line_buffering=True)
+# Reconfigure stdout/stderr to use UTF-8 with error handling (in place, no rewrapping)
+if (getattr(sys.stdout, 'encoding', None) or '').lower() not in ('utf-8', 'utf8'):
+    if isinstance(sys.stdout, io.TextIOWrapper):
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    if isinstance(sys.stderr, io.TextIOWrapper):
+        sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 
 # Configure logging (level set by main application)
 logger = logging.getLogger(__name__)
 
+# Process-wide debug flag, set once by main() from --debug
+_DEBUG: bool = False  # pylint: disable=invalid-name
+
+# Fallback when package metadata is unavailable (e.g. running from a source checkout)
+_FALLBACK_VERSION: Final[str] = '0.1.0'
+
 
 class ConfigurationError(Exception):
     """Custom exception for configuration errors."""
 
 
+def is_debug() -> bool:
+    """Return True if the server was started with --debug."""
+    return _DEBUG
+
+
+def set_debug(enabled: bool) -> None:
+    """
+    Set the process-wide debug flag.
+
+    Args:
+        enabled: True to enable debug behaviour in other modules
+    """
+    global _DEBUG  # pylint: disable=global-statement
+    _DEBUG = enabled
+
+
+@functools.cache
+def _server_version() -> str:
+    """Return the installed jira-mcp version, read from package metadata once per process."""
+    from importlib.metadata import PackageNotFoundError, version  # pylint: disable=import-outside-toplevel
+
+    try:
+        return version('jira-mcp')
+    except PackageNotFoundError:
+        return _FALLBACK_VERSION
+
+
+def _parse_simple_env(env_file_path: str) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Parse a plain KEY=VALUE .env file without importing python-dotenv.
+
+    Args:
+        env_file_path: Path to the .env file
+
+    Returns:
+        Dictionary of configuration values, or None if the file uses syntax
+        (multi-line quotes, escapes, interpolation, inline comments, export)
+        that needs the full python-dotenv parser
+    """
+    env_values: Dict[str, Optional[str]] = {}
+    with open(env_file_path, 'r', encoding='utf-8') as file_handle:
+        for line in file_handle:
+            stripped = line.strip()
+            if not stripped or stripped.startswith('#') or '=' not in stripped:
+                continue
+
+            key, value = stripped.split('=', 1)
+            key = key.strip()
+            value = value.strip()
+            quote = value[:1]
+
+            if key.startswith('export ') or '${' in value or '\\' in value:
+                return None
+            if quote in ('"', "'"):
+                if len(value) < 2 or value[-1] != quote:
+                    return None
+                value = value[1:-1]
+            elif '#' in value:
+                return None
+
+            env_values[key] = value
+    return env_values
+
+
 class ConfigManager:
     """
     Configuration management for Jira MCP Server.
@@ -36,7 +109,7 @@ class ConfigManager:
     Handles loading, validation, and secure storage of configuration data.
     """
 
-    def __init__(self, workspace_name: Optional[str] = None):
+    def __init__(self, workspace_name: Optional[str] = None) -> None:
         """
         Initialize configuration manager.
 
@@ -45,14 +118,20 @@ class ConfigManager:
                            If provided, loads .env.{workspace_name} instead of .env
         """
         if workspace_name:
-            self.env_file_path = Path(f'.env.{workspace_name}')
+            self.env_file_path = f'.env.{workspace_name}'
         else:
-            self.env_file_path = Path('.env')
+            self.env_file_path = '.env'
+
+        # Parsed .env contents keyed by file mtime (st_mtime_ns)
+        self._cache: Optional[Tuple[int, Dict[str, Optional[str]]]] = None
 
     def load_existing_env(self) -> Dict[str, Optional[str]]:
         """
         Load existing .env configuration.
 
+        The parsed result is cached until the file's modification time changes,
+        so repeated loads in the same process skip the file I/O.
+
         Returns:
             Dictionary of configuration values from .env file
 
@@ -60,13 +139,33 @@ class ConfigManager:
             ConfigurationError: If .env file cannot be read
         """
         try:
-            from dotenv import dotenv_values  # pylint: disable=import-outside-toplevel
-            return dict(dotenv_values(self.env_file_path))
+            mtime_ns = os.stat(self.env_file_path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        if mtime_ns is not None and self._cache and self._cache[0] == mtime_ns:
+            return self._cache[1].copy()
+
+        try:
+            env_values = _parse_simple_env(self.env_file_path) if mtime_ns is not None else None
+            if env_values is None:
+                from dotenv import dotenv_values  # pylint: disable=import-outside-toplevel
+                env_values = dict(dotenv_values(self.env_file_path))
         except Exception as error:
             raise ConfigurationError(
                 f"Failed to load .env file: {str(error)}"
             ) from error
 
+        if mtime_ns is not None:
+            self._cache = (mtime_ns, env_values)
+        return env_values.copy()
+
+
+@functools.lru_cache(maxsize=8)
+def _get_config_manager(workspace_name: Optional[str]) -> ConfigManager:
+    """Return a shared ConfigManager per workspace so its .env cache is reused."""
+    return ConfigManager(workspace_name=workspace_name)
+
 
 def load_config(workspace_name: Optional[str] = None) -> Dict[str, str]:
     """
@@ -81,36 +180,39 @@ def load_config(workspace_name: Optional[str] = None) -> Dict[str, str]:
     Raises:
         ConfigurationError: If configuration cannot be loaded
     """
-    config_manager = ConfigManager(workspace_name=workspace_name)
+    config_manager = _get_config_manager(workspace_name)
 
     # For Phase 1, allow running without .env file
     # Workspaces are now managed via ~/.config/jira-mcp/ (XDG standard)
-    if not config_manager.env_file_path.exists():
+    if not os.path.exists(config_manager.env_file_path):
         # Return default configuration - no warning needed
-        return {
-            'MCP_SERVER_NAME': 'jira-mcp',
-            'MCP_SERVER_VERSION': '0.1.0',
-            'DEBUG': 'false'
-        }
+        return dict(get_default_config())
 
     env_config = config_manager.load_existing_env()
 
-    # Convert None values to empty strings for application use
+    # Convert None values to empty strings for application use; the returned
+    # dict is already a private copy, so hand it back as-is when nothing is None
+    if not any(v is None for v in env_config.values()):
+        return cast(Dict[str, str], env_config)
     return {k: v or '' for k, v in env_config.items()}
 
 
-def get_default_config() -> Dict[str, str]:
+@functools.cache
+def get_default_config() -> Mapping[str, str]:
     """
     Get default configuration values.
 
+    Built on first call (the server version comes from package metadata) and
+    shared afterwards.
+
     Returns:
-        Dictionary with default configuration
+        Read-only mapping with default configuration (copy with dict() to modify)
     """
-    return {
+    return MappingProxyType({
         'MCP_SERVER_NAME': 'jira-mcp',
-        'MCP_SERVER_VERSION': '0.1.0',
+        'MCP_SERVER_VERSION': _server_version(),
         'DEBUG': 'false'
-    }
+    })
 
 
 if __name__ == "__main__":
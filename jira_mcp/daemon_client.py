@@ -0,0 +1,67 @@
+#!/usr/bin/env python3.12
+"""
+Jira MCP Daemon Client
+
+Lightweight STDIO bridge to a running `python -m jira_mcp --daemon` process.
+Uses only the standard library so MCP clients can spawn it without paying the
+Jira SDK / MCP import cost on every invocation.
+"""
+
+import os
+import socket
+import sys
+import threading
+
+from .utils import default_socket_path
+
+
+def _pump_stdin(conn: socket.socket) -> None:
+    """Forward stdin to the daemon until EOF, then half-close the socket."""
+    try:
+        for chunk in iter(lambda: os.read(sys.stdin.fileno(), 65536), b''):
+            conn.sendall(chunk)
+    except OSError:
+        pass
+    finally:
+        try:
+            conn.shutdown(socket.SHUT_WR)
+        except OSError:
+            pass
+
+
+def main() -> None:
+    """Connect stdin/stdout to the daemon socket."""
+    socket_path = default_socket_path()
+    args = sys.argv[1:]
+    if args[:1] == ['--socket'] and len(args) > 1:
+        socket_path = args[1]
+    elif args and args[0].startswith('--socket='):
+        socket_path = args[0].split('=', 1)[1]
+
+    # Workspace credentials travel over this socket; only talk to our own daemon
+    try:
+        owner = os.stat(socket_path).st_uid
+    except OSError as error:
+        print(f"❌ Cannot reach jira-mcp daemon at {socket_path}: {error}", file=sys.stderr)
+        sys.exit(1)
+    if owner != os.getuid():
+        print(f"❌ Refusing to use {socket_path}: it is owned by another user", file=sys.stderr)
+        sys.exit(1)
+
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(socket_path)
+    except OSError as error:
+        print(f"❌ Cannot reach jira-mcp daemon at {socket_path}: {error}", file=sys.stderr)
+        sys.exit(1)
+
+    threading.Thread(target=_pump_stdin, args=(conn,), daemon=True).start()
+
+    for chunk in iter(lambda: conn.recv(65536), b''):
+        sys.stdout.buffer.write(chunk)
+        sys.stdout.buffer.flush()
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
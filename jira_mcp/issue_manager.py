@@ -5,52 +5,369 @@ Issue Manager Module
 Handles Jira issue operations including search, create, read, update, and transitions.
 """
 
+import json
 import logging
-from typing import Any, Dict, List, Optional
-from jira import JIRA
+import random
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+from jira import JIRA, Issue
 from jira.exceptions import JIRAError
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 
-from .utils import get_user_attribute
+from .utils import wraps_jira_errors
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Available transitions depend on the workflow and the issue's current status,
+# which rarely change; cache them briefly to save a round trip per transition.
+# Kept per IssueManager, because they also depend on the caller's permissions.
+TRANSITIONS_TTL = 300  # seconds
+
+# Maximum number of issue keys per `key in (...)` JQL batch request
+BATCH_SIZE = 50
+
+# Issue keys are interpolated into `key in (...)` JQL, so each one must be a
+# plain project key and number (e.g. 'PROJ-123') before it gets there
+ISSUE_KEY_PATTERN = re.compile(r'^[A-Z][A-Z0-9_]+-\d+$')
+
+# How long a fetched issue is reused by the same IssueManager, and how many
+# issues it keeps before dropping the oldest
+ISSUE_CACHE_TTL = 30  # seconds
+ISSUE_CACHE_SIZE = 256
+
+# Fields requested by searches when the caller does not specify any (only what
+# the summary view of _format_issue reads)
+DEFAULT_SEARCH_FIELDS = 'summary,status,assignee,reporter,priority,created,updated,issuetype,project'
+
+# Page size for searches; large pages keep round trips down on big result sets
+SEARCH_BATCH_SIZE = 500
+
+# Field name -> field ID map for each site, which python-jira otherwise loads
+# with a GET /field on the first search of every JIRA client
+FIELD_MAP_TTL = 3600  # seconds
+
+# Issue GETs send If-None-Match with the last ETag seen for the same URL, so an
+# unchanged issue comes back as an empty 304; this many responses are remembered
+ETAG_CACHE_SIZE = 256
+
+# Formatted issues are reused while the issue's `updated` timestamp is unchanged;
+# the oldest entry is dropped once the cache holds this many
+FORMAT_CACHE_SIZE = 1024
+
+_TransitionsEntry = Tuple[List[Dict[str, Any]], Dict[str, str], Dict[str, str]]
+
+_field_map_cache: Dict[str, Tuple[float, Dict[str, str]]] = {}
+
+# Issue request URL (with fields) -> (ETag, raw issue JSON)
+_etag_cache: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
+# (site URL, issue key, updated, full_details, field names) -> formatted issue
+_format_cache: Dict[Tuple[str, str, str, bool, Tuple[str, ...]], Dict[str, Any]] = {}
+
+# Guards compound updates (evict + insert, scan + remove) of the bounded caches,
+# which worker threads of concurrent tool calls share
+_cache_lock = threading.Lock()
+
+
+_T = TypeVar('_T')
+_F = TypeVar('_F', bound=Callable[..., Any])
+
 
 class IssueManagerError(Exception):
     """Custom exception for issue manager errors."""
 
 
-class IssueManager:
+class _RateLimiter:
+    """
+    Sliding-window limiter that paces requests to Jira's advertised rate.
+
+    Jira Cloud reports its sustainable rate in the X-RateLimit-FillRate and
+    X-RateLimit-Interval-Seconds response headers. Until those have been seen
+    the limiter lets every request through.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an unlimited rate limiter."""
+        self._lock = threading.Lock()
+        self._calls: Deque[float] = deque()
+        self.max_per_interval: Optional[int] = None
+        self.interval = 1.0
+
+    def acquire(self) -> None:
+        """Block until another request fits in the current window."""
+        while True:
+            with self._lock:
+                if not self.max_per_interval:
+                    return
+                now = time.monotonic()
+                while self._calls and self._calls[0] <= now - self.interval:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_per_interval:
+                    self._calls.append(now)
+                    return
+                wait = self._calls[0] + self.interval - now
+            time.sleep(wait)
+
+    def observe(self, response: Any, *_args: Any, **_kwargs: Any) -> None:
+        """
+        Update the window from a response's rate-limit headers.
+
+        Registered as a requests response hook on the JIRA session.
+
+        Args:
+            response: requests.Response received from Jira
+        """
+        headers = getattr(response, 'headers', None) or {}
+        fill_rate = headers.get('X-RateLimit-FillRate')
+        if not fill_rate:
+            return
+        try:
+            max_per_interval = max(1, int(fill_rate))
+            interval = float(headers.get('X-RateLimit-Interval-Seconds') or 1)
+        except ValueError:
+            return
+        with self._lock:
+            if (max_per_interval, interval) != (self.max_per_interval, self.interval):
+                logger.debug("Pacing Jira requests to %d per %.0fs", max_per_interval, interval)
+            self.max_per_interval = max_per_interval
+            self.interval = interval
+
+
+# Shared by every IssueManager so concurrent tool calls respect one budget
+_rate_limiter = _RateLimiter()
+
+
+def _normalize_issue_keys(issue_keys: Iterable[str]) -> List[str]:
+    """
+    Strip, upper-case and de-duplicate issue keys, rejecting malformed ones.
+
+    Args:
+        issue_keys: Issue keys as given by the caller
+
+    Returns:
+        Normalized issue keys, in input order
+
+    Raises:
+        IssueManagerError: If any key is not of the form 'PROJ-123'
+    """
+    keys = list(dict.fromkeys(key.strip().upper() for key in issue_keys if key.strip()))
+    invalid = [key for key in keys if not ISSUE_KEY_PATTERN.match(key)]
+    if invalid:
+        raise IssueManagerError(f"Invalid issue key(s): {', '.join(invalid)}")
+    return keys
+
+
+def _bounded_put(cache: Dict[Any, Any], key: Any, value: Any, max_size: int) -> None:
+    """
+    Store an entry, first dropping the oldest one if the cache is full.
+
+    Handlers call in from several worker threads, so the size check, eviction
+    and insert run under _cache_lock as one step.
+
+    Args:
+        cache: Insertion-ordered cache dictionary
+        key: Entry key
+        value: Entry value
+        max_size: Maximum number of entries
+    """
+    with _cache_lock:
+        if key not in cache and len(cache) >= max_size and cache:
+            del cache[next(iter(cache))]
+        cache[key] = value
+
+
+def _pop_matching(cache: Dict[Any, Any], predicate: Callable[[Any], bool]) -> None:
+    """
+    Remove every entry whose key matches predicate.
+
+    Args:
+        cache: Cache dictionary
+        predicate: Called with each key; True removes the entry
+    """
+    with _cache_lock:
+        for key in [key for key in cache if predicate(key)]:
+            del cache[key]
+
+
+def _json_display_value(value: Dict[str, Any]) -> Any:
+    """
+    Pick the human-readable part of a raw JSON field value.
+
+    Mirrors how JIRA resources render themselves: name first, then the other
+    usual display keys, falling back to the whole value.
+
+    Args:
+        value: Raw JSON object from an issue's fields
+
+    Returns:
+        Display value
+    """
+    for name in ('name', 'value', 'displayName', 'key'):
+        if name in value:
+            return value[name]
+    return str(value)
+
+
+def _rate_limit_delay(error: JIRAError, attempt: int, base: float, cap: float) -> float:
+    """
+    Work out how long to wait after an HTTP 429 response.
+
+    Args:
+        error: The rate-limited JIRAError
+        attempt: Zero-based retry attempt
+        base: Initial backoff in seconds
+        cap: Maximum delay in seconds
+
+    Returns:
+        Delay in seconds, preferring Retry-After, then X-RateLimit-Reset,
+        then capped exponential backoff
+    """
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+
+    retry_after = headers.get('Retry-After')
+    if retry_after:
+        try:
+            return min(cap, max(0.0, float(retry_after)))
+        except ValueError:
+            pass
+
+    reset = headers.get('X-RateLimit-Reset')
+    if reset:
+        try:
+            reset_at = datetime.fromisoformat(reset.replace('Z', '+00:00'))
+            return min(cap, max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds()))
+        except (TypeError, ValueError):
+            pass
+
+    return min(cap, base * (1 << attempt))
+
+
+def _call_with_retry(
+    func: Callable[..., _T],
+    *args: Any,
+    max_attempts: int = 4,
+    base: float = 1.0,
+    cap: float = 60.0,
+    **kwargs: Any
+) -> _T:
+    """
+    Call a Jira API function, retrying when Jira Cloud rate-limits the request.
+
+    The JIRA session already retries a few times internally; this covers
+    429 responses that still get through, with jittered backoff.
+
+    Args:
+        func: Callable performing the API request
+        *args: Positional arguments for func
+        max_attempts: Maximum number of attempts, including the first
+        base: Initial backoff in seconds
+        cap: Maximum delay between attempts in seconds
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        The result of func
+
+    Raises:
+        JIRAError: If the call fails with a non-429 error or retries run out
+    """
+    attempt = 0
+    while True:
+        _rate_limiter.acquire()
+        try:
+            return func(*args, **kwargs)
+        except JIRAError as e:
+            attempt += 1
+            if e.status_code != 429 or attempt >= max_attempts:
+                raise
+            delay = _rate_limit_delay(e, attempt - 1, base, cap) + random.uniform(0, 0.5)
+            logger.warning("⏳ Jira rate limit hit, retrying in %.1fs (attempt %d/%d)", delay, attempt, max_attempts)
+            time.sleep(delay)
+
+
+def _wraps_jira_errors(failure: str, unexpected: str) -> Callable[[_F], _F]:
+    """
+    Decorate a IssueManager method so every failure surfaces as IssueManagerError.
+
+    Args:
+        failure: Message for Jira API errors, formatted with the call's arguments
+            by name (e.g. "Failed to get issue {issue_key}")
+        unexpected: Message for any other error
+
+    Returns:
+        Method decorator
+    """
+    return wraps_jira_errors(IssueManagerError, failure, unexpected)
+
+
+class IssueManager:  # pylint: disable=too-many-public-methods
     """
     Manager for Jira issue operations.
 
     Handles issue lifecycle: search, create, read, update, assign, transition.
     """
 
-    def __init__(self, jira_client: JIRA, site_url: str):
+    __slots__ = (
+        'jira', 'site_url', '_browse_prefix', '_max_workers', '_user_id_attr',
+        '_issue_cache', '_transitions_cache'
+    )
+
+    def __init__(self, jira_client: JIRA, site_url: str, max_workers: int = 5):
         """
         Initialize issue manager.
 
         Args:
             jira_client: Authenticated JIRA client instance
             site_url: Jira site URL for generating links
+            max_workers: Maximum concurrent requests for batched fetches
         """
         self.jira = jira_client
         self.site_url = site_url.rstrip('/')
+        self._browse_prefix = self.site_url + '/browse/'
+        self._max_workers = max(1, max_workers)
+
+        # Keep enough pooled connections for concurrent batch fetches; retries
+        # stay with the JIRA session, which already handles 429/503
+        session = getattr(jira_client, '_session', None)
+        if session is not None and self._max_workers > DEFAULT_POOLSIZE:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self._max_workers, max_retries=0)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+
+        # Learn Jira's advertised request rate from every response on this session
+        if session is not None and _rate_limiter.observe not in session.hooks['response']:
+            session.hooks['response'].append(_rate_limiter.observe)
+
+        # User ID attribute for this deployment ('accountId' on Cloud, 'name' on
+        # Server/Data Center), detected from the first user formatted
+        self._user_id_attr: Optional[str] = None
+
+        # Recently fetched issues keyed by (issue key, fields); cleared when this manager changes them
+        self._issue_cache: Dict[Tuple[str, Optional[str]], Tuple[float, Any]] = {}
+
+        # Available transitions keyed by (project key, issue type name, status name)
+        self._transitions_cache: Dict[Tuple[str, str, str], Tuple[float, _TransitionsEntry]] = {}
 
     def search_issues(
         self,
         jql: str,
         max_results: int = 50,
-        fields: Optional[List[str]] = None
+        fields: Optional[List[str]] = None,
+        batch_size: int = SEARCH_BATCH_SIZE
     ) -> List[Dict[str, Any]]:
         """
         Search for issues using JQL.
 
         Args:
             jql: JQL query string
-            max_results: Maximum number of results to return
+            max_results: Maximum number of results to return (0 for all matches)
             fields: Optional list of fields to retrieve
+            batch_size: Maximum number of issues requested per page
 
         Returns:
             List of issue dictionaries
@@ -58,30 +375,84 @@ class IssueManager:
         Raises:
             IssueManagerError: If search fails
         """
-        try:
-            logger.info("Searching issues with JQL: %s", jql)
-
-            # Default fields if not specified
-            if fields is None:
-                fields = [
-                    'summary', 'status', 'assignee', 'reporter',
-                    'priority', 'created', 'updated', 'issuetype',
-                    'project', 'description'
-                ]
-
-            issues = self.jira.search_issues(
-                jql,
-                maxResults=max_results,
-                fields=','.join(fields)
-            )
+        logger.debug("Searching issues with JQL: %s", jql)
 
-            issue_list = []
-            for issue in issues:
-                issue_data = self._format_issue(issue)
-                issue_list.append(issue_data)
+        issue_list = list(self.iter_issues(jql, page_size=batch_size, fields=fields, max_results=max_results))
+
+        logger.debug("Found %d issues", len(issue_list))
+        return issue_list
+
+    def iter_issues(
+        self,
+        jql: str,
+        page_size: int = SEARCH_BATCH_SIZE,
+        fields: Optional[List[str]] = None,
+        max_results: int = 0
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all issues matching a JQL query, one page at a time.
 
-            logger.info("Found %d issues", len(issue_list))
-            return issue_list
+        Only one page of results is held in memory, so callers exporting large
+        result sets can stream them. Pages are requested as raw JSON, which is
+        formatted directly without building JIRA Issue resources.
+
+        Args:
+            jql: JQL query string
+            page_size: Maximum number of issues to request per page
+            fields: Optional list of fields to retrieve
+            max_results: Stop after this many issues (0 for all matches)
+
+        Yields:
+            Issue dictionaries
+
+        Raises:
+            IssueManagerError: If search fails
+        """
+        # Default fields if not specified
+        field_list = DEFAULT_SEARCH_FIELDS if fields is None else ','.join(fields)
+
+        format_issue = self._format_issue
+        is_cloud = getattr(self.jira, '_is_cloud', False)
+
+        try:
+            self._prime_field_map()
+            start_at = 0
+            next_page_token = None
+            while True:
+                # Never ask for more than the caller still wants
+                request_size = max(1, min(page_size, max_results - start_at)) if max_results else page_size
+                if is_cloud:
+                    # Jira Cloud pages searches by token and rejects startAt offsets
+                    page_json = _call_with_retry(
+                        self.jira.enhanced_search_issues,
+                        jql,
+                        nextPageToken=next_page_token,
+                        maxResults=request_size,
+                        fields=field_list,
+                        json_result=True
+                    )
+                    next_page_token = page_json.get('nextPageToken')
+                else:
+                    page_json = _call_with_retry(
+                        self.jira.search_issues,
+                        jql,
+                        startAt=start_at,
+                        maxResults=request_size,
+                        fields=field_list,
+                        json_result=True
+                    )
+
+                page = page_json.get('issues', [])
+                for issue in page:
+                    yield format_issue(issue)
+
+                start_at += len(page)
+                if max_results and start_at >= max_results:
+                    return
+                # Cloud signals the last page by omitting the token; Server by a short page
+                done = (not next_page_token) if is_cloud else len(page) < request_size
+                if done:
+                    return
 
         except JIRAError as e:
             error_msg = f"Failed to search issues: {e.text if hasattr(e, 'text') else str(e)}"
@@ -92,6 +463,7 @@ class IssueManager:
             logger.error("❌ %s", error_msg)
             raise IssueManagerError(error_msg) from e
 
+    @_wraps_jira_errors("Failed to get issue {issue_key}", "Unexpected error getting issue")
     def get_issue(self, issue_key: str) -> Dict[str, Any]:
         """
         Get full details of a specific issue.
@@ -105,23 +477,103 @@ class IssueManager:
         Raises:
             IssueManagerError: If issue not found or access denied
         """
-        try:
-            logger.info("Getting issue: %s", issue_key)
+        logger.debug("Getting issue: %s", issue_key)
+
+        issue = self._get_issue(issue_key)
+        issue_data = self._format_issue(issue, full_details=True)
+
+        return issue_data
+
+    @_wraps_jira_errors("Failed to get issues", "Unexpected error getting issues")
+    def get_issues(self, issue_keys: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get full details of several issues with batched JQL searches.
+
+        Issues are fetched with one `key in (...)` search per BATCH_SIZE keys
+        instead of one request per issue. Keys the search does not return
+        (e.g. issues created moments ago and not yet indexed, or moved issues
+        requested by their old key) are then read directly, concurrently.
+        Keys that do not exist or are not visible are skipped.
+
+        Args:
+            issue_keys: Issue keys (e.g., ['PROJ-123', 'PROJ-124'])
+
+        Returns:
+            List of issue dictionaries with full details, in input order
+
+        Raises:
+            IssueManagerError: If any key is malformed or retrieval fails
+        """
+        keys = _normalize_issue_keys(issue_keys)
+        logger.debug("Getting %d issues in batches of %d", len(keys), BATCH_SIZE)
+
+        chunks = [keys[i:i + BATCH_SIZE] for i in range(0, len(keys), BATCH_SIZE)]
+        issues_by_key: Dict[str, Dict[str, Any]] = {}
+        if chunks:
+            self._prime_field_map()
+
+        if len(chunks) <= 1 or self._max_workers == 1:
+            for chunk in chunks:
+                issues_by_key.update(self._fetch_issue_chunk(chunk))
+        else:
+            # Overlap network latency across chunks on the shared session
+            workers = min(self._max_workers, len(chunks))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self._fetch_issue_chunk, chunk) for chunk in chunks]
+                for future in as_completed(futures):
+                    issues_by_key.update(future.result())
+
+        missing = [key for key in keys if key not in issues_by_key]
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self._max_workers, len(missing))) as executor:
+                for key, issue_data in zip(missing, executor.map(self._fetch_issue_or_none, missing)):
+                    if issue_data is not None:
+                        issues_by_key[key] = issue_data
+
+        issue_list = [issues_by_key[key] for key in keys if key in issues_by_key]
+
+        logger.debug("Found %d of %d issues", len(issue_list), len(keys))
+        return issue_list
+
+    def _fetch_issue_chunk(self, chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch and format one batch of issues by key.
+
+        Args:
+            chunk: Up to BATCH_SIZE issue keys
 
-            issue = self.jira.issue(issue_key)
-            issue_data = self._format_issue(issue, full_details=True)
+        Returns:
+            Dictionary mapping issue key to formatted issue
+        """
+        issues = _call_with_retry(
+            self.jira.search_issues,
+            f"key in ({','.join(chunk)})",
+            maxResults=len(chunk),
+            validate_query=False,
+            fields='*all'
+        )
+        format_issue = self._format_issue
+        return {issue.key: format_issue(issue, full_details=True) for issue in issues}
+
+    def _fetch_issue_or_none(self, issue_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch and format a single issue, returning None if it does not exist.
 
-            return issue_data
+        Args:
+            issue_key: Issue key (e.g., 'PROJ-123')
 
+        Returns:
+            Formatted issue dictionary, or None if the issue was not found
+        """
+        try:
+            issue = _call_with_retry(self.jira.issue, issue_key)
         except JIRAError as e:
-            error_msg = f"Failed to get issue {issue_key}: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error getting issue: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
+            if e.status_code == 404:
+                return None
+            raise
+        return self._format_issue(issue, full_details=True)
 
+    @_wraps_jira_errors("Failed to create issue", "Unexpected error creating issue")
     def create_issue(  # pylint: disable=too-many-positional-arguments
         self,
         project_key: str,
@@ -152,46 +604,37 @@ class IssueManager:
         Raises:
             IssueManagerError: If creation fails
         """
-        try:
-            logger.info("Creating issue in project %s: %s", project_key, summary)
+        logger.debug("Creating issue in project %s: %s", project_key, summary)
 
-            # Build issue fields
-            fields = {
-                'project': {'key': project_key},
-                'summary': summary,
-                'issuetype': {'name': issue_type}
-            }
+        # Build issue fields
+        fields = {
+            'project': {'key': project_key},
+            'summary': summary,
+            'issuetype': {'name': issue_type}
+        }
 
-            if description:
-                fields['description'] = description
+        if description:
+            fields['description'] = description
 
-            if assignee:
-                fields['assignee'] = {'accountId': assignee}
+        if assignee:
+            fields['assignee'] = {'accountId': assignee}
 
-            if priority:
-                fields['priority'] = {'name': priority}
+        if priority:
+            fields['priority'] = {'name': priority}
 
-            if labels:
-                fields['labels'] = labels
+        if labels:
+            fields['labels'] = labels
 
-            # Add any additional custom fields (normalize object-type fields first)
-            fields.update(self._normalize_extra_fields(kwargs))
+        # Add any additional custom fields (normalize object-type fields first)
+        fields.update(self._normalize_extra_fields(kwargs))
 
-            # Create the issue
-            issue = self.jira.create_issue(fields=fields)
+        # Create the issue
+        issue = _call_with_retry(self.jira.create_issue, fields=fields)
 
-            logger.info("✅ Created issue: %s", issue.key)
-            return self._format_issue(issue, full_details=True)
-
-        except JIRAError as e:
-            error_msg = f"Failed to create issue: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error creating issue: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
+        logger.info("✅ Created issue: %s", issue.key)
+        return self._format_issue(issue, full_details=True)
 
+    @_wraps_jira_errors("Failed to update issue {issue_key}", "Unexpected error updating issue")
     def update_issue(  # pylint: disable=too-many-positional-arguments
         self,
         issue_key: str,
@@ -220,45 +663,38 @@ class IssueManager:
         Raises:
             IssueManagerError: If update fails
         """
-        try:
-            logger.info("Updating issue: %s", issue_key)
-
-            issue = self.jira.issue(issue_key)
-            fields = {}
+        logger.info("Updating issue: %s", issue_key)
 
-            if summary is not None:
-                fields['summary'] = summary
+        fields = {}
 
-            if description is not None:
-                fields['description'] = description
+        if summary is not None:
+            fields['summary'] = summary
 
-            if assignee is not None:
-                fields['assignee'] = {'accountId': assignee}
+        if description is not None:
+            fields['description'] = description
 
-            if priority is not None:
-                fields['priority'] = {'name': priority}
+        if assignee is not None:
+            fields['assignee'] = {'accountId': assignee}
 
-            if labels is not None:
-                fields['labels'] = labels
+        if priority is not None:
+            fields['priority'] = {'name': priority}
 
-            # Add any additional custom fields (normalize object-type fields first)
-            fields.update(self._normalize_extra_fields(kwargs))
+        if labels is not None:
+            fields['labels'] = labels
 
-            # Update the issue
-            issue.update(fields=fields)
+        # Add any additional custom fields (normalize object-type fields first)
+        fields.update(self._normalize_extra_fields(kwargs))
 
-            logger.info("✅ Updated issue: %s", issue_key)
-            return self._format_issue(issue, full_details=True)
+        # Update the issue by key; Issue.update would need the issue loaded
+        # first and then reloads it, costing an extra GET
+        url = self.jira._get_url(f'issue/{issue_key}')  # pylint: disable=protected-access
+        _call_with_retry(self.jira._session.put, url, data=json.dumps({'fields': fields}))  # pylint: disable=protected-access
+        self._invalidate_issue(issue_key)
 
-        except JIRAError as e:
-            error_msg = f"Failed to update issue {issue_key}: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error updating issue: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
+        logger.info("✅ Updated issue: %s", issue_key)
+        return self._format_issue(self._get_issue(issue_key), full_details=True)
 
+    @_wraps_jira_errors("Failed to assign issue {issue_key}", "Unexpected error assigning issue")
     def assign_issue(self, issue_key: str, assignee: str) -> Dict[str, Any]:
         """
         Assign an issue to a user.
@@ -273,24 +709,16 @@ class IssueManager:
         Raises:
             IssueManagerError: If assignment fails
         """
-        try:
-            logger.info("Assigning issue %s to %s", issue_key, assignee)
+        logger.info("Assigning issue %s to %s", issue_key, assignee)
 
-            issue = self.jira.issue(issue_key)
-            self.jira.assign_issue(issue, assignee)
+        issue = self._get_issue(issue_key)
+        _call_with_retry(self.jira.assign_issue, issue, assignee)
+        self._invalidate_issue(issue_key)
 
-            logger.info("✅ Assigned issue %s to %s", issue_key, assignee)
-            return self._format_issue(issue, full_details=True)
-
-        except JIRAError as e:
-            error_msg = f"Failed to assign issue {issue_key}: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error assigning issue: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
+        logger.info("✅ Assigned issue %s to %s", issue_key, assignee)
+        return self._format_issue(issue, full_details=True)
 
+    @_wraps_jira_errors("Failed to transition issue {issue_key}", "Unexpected error transitioning issue")
     def transition_issue(
         self,
         issue_key: str,
@@ -311,54 +739,51 @@ class IssueManager:
         Raises:
             IssueManagerError: If transition fails
         """
-        try:
-            logger.info("Transitioning issue %s: %s", issue_key, transition)
+        logger.info("Transitioning issue %s: %s", issue_key, transition)
 
-            issue = self.jira.issue(issue_key)
+        issue = self._get_issue(issue_key)
 
-            # Get available transitions
-            transitions = self.jira.transitions(issue)
-            transition_id = None
+        # Get available transitions
+        transitions, lookup, target_status = self._get_transitions_cached(issue)
 
-            # Find transition by name or ID
-            for trans in transitions:
-                if trans['name'].lower() == transition.lower() or trans['id'] == transition:
-                    transition_id = trans['id']
-                    break
+        # Find transition by name or ID
+        transition_id = lookup.get(transition.lower())
 
-            if not transition_id:
-                available = [t['name'] for t in transitions]
-                raise IssueManagerError(
-                    f"Transition '{transition}' not found. Available: {', '.join(available)}"
-                )
-
-            # Perform transition
-            if comment:
-                self.jira.transition_issue(
-                    issue,
-                    transition_id,
-                    comment=comment
-                )
-            else:
-                self.jira.transition_issue(issue, transition_id)
-
-            logger.info("✅ Transitioned issue %s", issue_key)
-
-            # Refresh issue to get updated status
-            issue = self.jira.issue(issue_key)
-            return self._format_issue(issue, full_details=True)
-
-        except JIRAError as e:
-            error_msg = f"Failed to transition issue {issue_key}: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
-        except IssueManagerError:
-            raise
-        except Exception as e:
-            error_msg = f"Unexpected error transitioning issue: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
+        if not transition_id:
+            available = [t['name'] for t in transitions]
+            raise IssueManagerError(
+                f"Transition '{transition}' not found. Available: {', '.join(available)}"
+            )
 
+        # Perform transition
+        if comment:
+            _call_with_retry(
+                self.jira.transition_issue,
+                issue,
+                transition_id,
+                comment=comment
+            )
+        else:
+            _call_with_retry(self.jira.transition_issue, issue, transition_id)
+
+        logger.info("✅ Transitioned issue %s", issue_key)
+        # The transitions cache is keyed by workflow state, not by issue, so
+        # the entry stays valid for the next issue leaving the same status
+        self._invalidate_issue(issue_key)
+
+        # Reflect the new status without re-reading the whole issue. Only the
+        # status (and at most `updated`) is fresh; the other fields are from
+        # before the transition, so the result must not go through (or into)
+        # the format cache, which is keyed on `updated`
+        if target_status[transition_id]:
+            issue.fields.status.name = target_status[transition_id]
+        else:
+            refreshed = _call_with_retry(self.jira.issue, issue_key, fields='status,updated')
+            issue.fields.status = refreshed.fields.status
+            issue.fields.updated = refreshed.fields.updated
+        return self._build_issue_dict(issue, full_details=True)
+
+    @_wraps_jira_errors("Failed to get transitions for {issue_key}", "Unexpected error getting transitions")
     def get_transitions(self, issue_key: str) -> List[Dict[str, str]]:
         """
         Get available transitions for an issue.
@@ -372,23 +797,147 @@ class IssueManager:
         Raises:
             IssueManagerError: If retrieval fails
         """
-        try:
-            issue = self.jira.issue(issue_key)
-            transitions = self.jira.transitions(issue)
+        issue = self._get_issue(issue_key, 'project,issuetype,status')
+        transitions = self._get_transitions_cached(issue)[0]
 
-            return [
-                {'id': t['id'], 'name': t['name']}
-                for t in transitions
-            ]
+        return [
+            {'id': t['id'], 'name': t['name']}
+            for t in transitions
+        ]
 
-        except JIRAError as e:
-            error_msg = f"Failed to get transitions for {issue_key}: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error getting transitions: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
+    def _get_issue(self, issue_key: str, fields: Optional[str] = None) -> Any:
+        """
+        Fetch an issue, reusing a copy fetched within the last ISSUE_CACHE_TTL seconds.
+
+        Args:
+            issue_key: Issue key (e.g., 'PROJ-123')
+            fields: Optional comma-separated list of fields to retrieve
+
+        Returns:
+            JIRA issue object
+        """
+        key = (issue_key, fields)
+        now = time.monotonic()
+
+        cached = self._issue_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        issue = _call_with_retry(self._fetch_issue_conditional, issue_key, fields)
+        _bounded_put(self._issue_cache, key, (now + ISSUE_CACHE_TTL, issue), ISSUE_CACHE_SIZE)
+        return issue
+
+    def _fetch_issue_conditional(self, issue_key: str, fields: Optional[str]) -> Issue:
+        """
+        GET an issue, revalidating a previously seen copy with its ETag.
+
+        Args:
+            issue_key: Issue key (e.g., 'PROJ-123')
+            fields: Optional comma-separated list of fields to retrieve
+
+        Returns:
+            JIRA issue object
+        """
+        session = self.jira._session  # pylint: disable=protected-access
+        url = self.jira._get_url(f'issue/{issue_key}')  # pylint: disable=protected-access
+        params = {'fields': fields} if fields else None
+        cache_key = f"{url}?fields={fields or ''}"
+
+        cached = _etag_cache.get(cache_key)
+        headers = {'If-None-Match': cached[0]} if cached else {}
+        response = session.get(url, params=params, headers=headers)
+
+        if response.status_code == 304 and cached:
+            logger.debug("Issue %s not modified (ETag match)", issue_key)
+            raw = cached[1]
+        else:
+            raw = response.json()
+            etag = response.headers.get('ETag')
+            if etag:
+                _bounded_put(_etag_cache, cache_key, (etag, raw), ETAG_CACHE_SIZE)
+
+        return Issue(self.jira._options, session, raw=raw)  # pylint: disable=protected-access
+
+    def _invalidate_issue(self, issue_key: str) -> None:
+        """
+        Drop cached copies of an issue after it has been changed.
+
+        Args:
+            issue_key: Issue key (e.g., 'PROJ-123')
+        """
+        _pop_matching(self._issue_cache, lambda key: key[0] == issue_key)
+        _pop_matching(_format_cache, lambda key: key[1] == issue_key and key[0] == self.site_url)
+
+    def _transitions_cache_key(self, issue: Any) -> Tuple[str, str, str]:
+        """
+        Build the transitions cache key for an issue.
+
+        Args:
+            issue: JIRA issue object
+
+        Returns:
+            Tuple of (project key, issue type name, status name)
+        """
+        fields = issue.fields
+        return (fields.project.key, fields.issuetype.name, fields.status.name)
+
+    def _get_transitions_cached(self, issue: Any) -> _TransitionsEntry:
+        """
+        Get available transitions for an issue, cached for TRANSITIONS_TTL seconds.
+
+        Args:
+            issue: JIRA issue object
+
+        Returns:
+            Tuple of (raw transition dictionaries from the Jira API,
+            lowercase name or id -> id lookup, id -> destination status name)
+        """
+        key = self._transitions_cache_key(issue)
+        now = time.monotonic()
+
+        cached = self._transitions_cache.get(key)
+        if cached and cached[0] > now:
+            logger.debug("Using cached transitions for %s", issue.key)
+            return cached[1]
+
+        transitions: List[Dict[str, Any]] = _call_with_retry(self.jira.transitions, issue)
+        # IDs first so a transition name wins if it happens to equal another's ID
+        lookup = {t['id'].lower(): t['id'] for t in transitions}
+        lookup.update({t['name'].lower(): t['id'] for t in transitions})
+        target_status = {t['id']: t.get('to', {}).get('name', '') for t in transitions}
+        entry = (transitions, lookup, target_status)
+        self._transitions_cache[key] = (now + TRANSITIONS_TTL, entry)
+        return entry
+
+    def _get_field_map(self) -> Dict[str, str]:
+        """
+        Get the field name -> field ID map for this site, cached for FIELD_MAP_TTL seconds.
+
+        Returns:
+            Dictionary mapping every JQL clause name of a field to its ID
+        """
+        now = time.monotonic()
+        cached = _field_map_cache.get(self.site_url)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        field_map: Dict[str, str] = {}
+        for field in _call_with_retry(self.jira.fields):
+            for name in field.get('clauseNames', []):
+                field_map[name] = field['id']
+        _field_map_cache[self.site_url] = (now + FIELD_MAP_TTL, field_map)
+        return field_map
+
+    def _prime_field_map(self) -> None:
+        """
+        Hand the cached field map to the JIRA client before it searches.
+
+        python-jira translates field names in every search and loads the map
+        with a GET /field the first time; a fresh client per tool call would
+        pay that on every search.
+        """
+        if getattr(self.jira, '_fields_cache_value', None) == {}:
+            self.jira._fields_cache_value = self._get_field_map()  # pylint: disable=protected-access
 
     def _normalize_extra_fields(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -417,9 +966,116 @@ class IssueManager:
         """
         if not user:
             return None
+        if isinstance(user, dict):
+            if self._user_id_attr is None:
+                self._user_id_attr = 'accountId' if 'accountId' in user else 'name'
+            return {
+                'name': user.get('displayName', 'Unknown'),
+                'account_id': user.get(self._user_id_attr, 'N/A')
+            }
+        if self._user_id_attr is None:
+            self._user_id_attr = 'accountId' if hasattr(user, 'accountId') else 'name'
+        return {
+            'name': getattr(user, 'displayName', 'Unknown'),
+            'account_id': getattr(user, self._user_id_attr, 'N/A')
+        }
+
+    def _format_author(self, user: Any) -> Dict[str, str]:
+        """
+        Format the author of a comment or attachment.
+
+        Args:
+            user: JIRA user object (may be None for deleted or anonymous users)
+
+        Returns:
+            User dictionary, with placeholder values if there is no user
+        """
+        return self._format_user(user) or {'name': 'Unknown', 'account_id': 'N/A'}
+
+    def _format_comment(self, comment: Any) -> Dict[str, Any]:
+        """
+        Format comment object into dictionary.
+
+        Args:
+            comment: JIRA comment object
+
+        Returns:
+            Comment dictionary
+        """
+        return {
+            'id': comment.id,
+            'body': comment.body,
+            'author': self._format_author(getattr(comment, 'author', None)),
+            'created': str(comment.created),
+            'updated': str(comment.updated)
+        }
+
+    def _format_attachment(self, attachment: Any) -> Dict[str, Any]:
+        """
+        Format attachment object into dictionary.
+
+        Args:
+            attachment: JIRA attachment object
+
+        Returns:
+            Attachment dictionary
+        """
+        return {
+            'id': attachment.id,
+            'filename': attachment.filename,
+            'size': attachment.size,
+            'mime_type': getattr(attachment, 'mimeType', 'unknown'),
+            'created': str(attachment.created),
+            'author': self._format_author(getattr(attachment, 'author', None)),
+            'content_url': attachment.content
+        }
+
+    def _format_link(self, link: Any) -> Dict[str, Any]:
+        """
+        Format issue link object into dictionary.
+
+        Args:
+            link: JIRA issue link object
+
+        Returns:
+            Link dictionary
+        """
+        link_data = {
+            'id': link.id,
+            'type': link.type.name
+        }
+
+        # Determine if this is an inward or outward link
+        outward = getattr(link, 'outwardIssue', None)
+        inward = getattr(link, 'inwardIssue', None) if outward is None else None
+        if outward is not None:
+            link_data['direction'] = 'outward'
+            link_data['related_issue'] = outward.key
+            link_data['related_summary'] = outward.fields.summary
+        elif inward is not None:
+            link_data['direction'] = 'inward'
+            link_data['related_issue'] = inward.key
+            link_data['related_summary'] = inward.fields.summary
+
+        return link_data
+
+    def _format_subtask(self, subtask: Any) -> Dict[str, Any]:
+        """
+        Format subtask object into dictionary.
+
+        Args:
+            subtask: JIRA issue object (or subtask stub) for the subtask
+
+        Returns:
+            Subtask dictionary
+        """
         return {
-            'name': get_user_attribute(user, 'displayName', 'displayName', 'Unknown'),
-            'account_id': get_user_attribute(user, 'accountId', 'name', 'N/A')
+            'key': subtask.key,
+            'id': subtask.id,
+            'summary': subtask.fields.summary,
+            'status': subtask.fields.status.name,
+            'url': self._browse_prefix + subtask.key,
+            'assignee': self._format_user(getattr(subtask.fields, 'assignee', None))
         }
 
     def _format_field_value(self, field_value: Any) -> Any:
@@ -427,16 +1083,20 @@ class IssueManager:
         Format a field value based on its type.
 
         Args:
-            field_value: Field value to format
+            field_value: Field value to format (JIRA resource or raw JSON)
 
         Returns:
             Formatted field value
         """
+        if isinstance(field_value, dict):
+            return _json_display_value(field_value)
         if hasattr(field_value, 'name'):
             return field_value.name
         if isinstance(field_value, (str, int, float, bool)):
             return field_value
         if isinstance(field_value, list) and len(field_value) > 0:
+            if isinstance(field_value[0], dict):
+                return [_json_display_value(item) for item in field_value]
             if hasattr(field_value[0], 'name'):
                 return [item.name for item in field_value]
             return [str(item) for item in field_value]
@@ -447,7 +1107,7 @@ class IssueManager:
         Extract additional fields dynamically from issue.
 
         Args:
-            fields: JIRA fields object
+            fields: JIRA fields object or raw JSON fields dictionary
 
         Returns:
             Dictionary of additional fields
@@ -459,13 +1119,18 @@ class IssueManager:
             'worklog', 'issuelinks', 'subtasks', 'watches', 'votes'
         }
 
+        field_items: Iterable[Tuple[str, Any]]
+        if isinstance(fields, dict):
+            field_items = fields.items()
+        else:
+            field_items = ((name, getattr(fields, name, None)) for name in dir(fields))
+
         additional_fields = {}
-        for field_name in dir(fields):
+        for field_name, field_value in field_items:
             if field_name.startswith('_') or field_name in skip_fields:
                 continue
 
             try:
-                field_value = getattr(fields, field_name, None)
                 if field_value is None or callable(field_value):
                     continue
 
@@ -486,27 +1151,18 @@ class IssueManager:
         issue_data['description'] = getattr(fields, 'description', None) or ''
         issue_data['labels'] = getattr(fields, 'labels', [])
 
-        issue_data['components'] = (
-            [c.name for c in fields.components]
-            if hasattr(fields, 'components') and fields.components
-            else []
-        )
+        components = getattr(fields, 'components', None)
+        issue_data['components'] = [c.name for c in components] if components else []
 
-        issue_data['fix_versions'] = (
-            [v.name for v in fields.fixVersions]
-            if hasattr(fields, 'fixVersions') and fields.fixVersions
-            else []
-        )
+        fix_versions = getattr(fields, 'fixVersions', None)
+        issue_data['fix_versions'] = [v.name for v in fix_versions] if fix_versions else []
 
-        issue_data['affected_versions'] = (
-            [v.name for v in fields.versions]
-            if hasattr(fields, 'versions') and fields.versions
-            else []
-        )
+        versions = getattr(fields, 'versions', None)
+        issue_data['affected_versions'] = [v.name for v in versions] if versions else []
 
     def _format_issue(self, issue: Any, full_details: bool = False) -> Dict[str, Any]:
         """
-        Format issue data into a dictionary.
+        Format issue data into a dictionary, reusing the result for an unchanged issue.
 
         Args:
             issue: JIRA issue object
@@ -515,22 +1171,63 @@ class IssueManager:
         Returns:
             Formatted issue dictionary
         """
+        if isinstance(issue, dict):
+            key = issue['key']
+            fields = issue['fields']
+            updated = fields.get('updated')
+            field_names = tuple(fields)
+        else:
+            key = issue.key
+            fields = issue.fields
+            updated = getattr(fields, 'updated', None)
+            field_names = tuple(vars(fields))
+        if not updated:
+            return self._build_issue_dict(issue, full_details)
+
+        # The field names are part of the key: the same issue fetched with a
+        # narrower field list formats differently
+        cache_key = (self.site_url, key, str(updated), full_details, field_names)
+        cached = _format_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+        issue_data = self._build_issue_dict(issue, full_details)
+        _bounded_put(_format_cache, cache_key, issue_data, FORMAT_CACHE_SIZE)
+        return dict(issue_data)
+
+    def _build_issue_dict(self, issue: Any, full_details: bool) -> Dict[str, Any]:
+        """
+        Build the formatted dictionary for an issue.
+
+        Args:
+            issue: JIRA issue object or raw JSON issue dictionary
+            full_details: Whether to include full details
+
+        Returns:
+            Formatted issue dictionary
+        """
+        if isinstance(issue, dict):
+            return self._build_issue_dict_from_json(issue, full_details)
+
+        key = issue.key
         fields = issue.fields
+        format_user = self._format_user
+        priority = getattr(fields, 'priority', None)
 
         # Basic issue data (always included)
         issue_data = {
-            'key': issue.key,
+            'key': key,
             'id': issue.id,
             'summary': fields.summary,
             'status': fields.status.name,
             'issue_type': fields.issuetype.name,
             'project': fields.project.key,
-            'url': f"{self.site_url}/browse/{issue.key}",
+            'url': self._browse_prefix + key,
             'created': str(fields.created),
             'updated': str(fields.updated),
-            'assignee': self._format_user(getattr(fields, 'assignee', None)),
-            'reporter': self._format_user(getattr(fields, 'reporter', None)),
-            'priority': fields.priority.name if hasattr(fields, 'priority') and fields.priority else None,
+            'assignee': format_user(getattr(fields, 'assignee', None)),
+            'reporter': format_user(getattr(fields, 'reporter', None)),
+            'priority': priority.name if priority else None,
             'additional_fields': self._extract_additional_fields(fields)
         }
 
@@ -540,6 +1237,50 @@ class IssueManager:
 
         return issue_data
 
+    def _build_issue_dict_from_json(self, issue: Dict[str, Any], full_details: bool) -> Dict[str, Any]:
+        """
+        Build the formatted dictionary for a raw JSON issue from a search.
+
+        Args:
+            issue: Raw JSON issue dictionary
+            full_details: Whether to include full details
+
+        Returns:
+            Formatted issue dictionary
+        """
+        key = issue['key']
+        fields = issue['fields']
+        format_user = self._format_user
+        priority = fields.get('priority')
+
+        # Basic issue data (always included)
+        issue_data = {
+            'key': key,
+            'id': issue['id'],
+            'summary': fields['summary'],
+            'status': fields['status']['name'],
+            'issue_type': fields['issuetype']['name'],
+            'project': fields['project']['key'],
+            'url': self._browse_prefix + key,
+            'created': str(fields['created']),
+            'updated': str(fields['updated']),
+            'assignee': format_user(fields.get('assignee')),
+            'reporter': format_user(fields.get('reporter')),
+            'priority': priority['name'] if priority else None,
+            'additional_fields': self._extract_additional_fields(fields)
+        }
+
+        # Add full details if requested
+        if full_details:
+            issue_data['description'] = fields.get('description') or ''
+            issue_data['labels'] = fields.get('labels') or []
+            issue_data['components'] = [c['name'] for c in fields.get('components') or []]
+            issue_data['fix_versions'] = [v['name'] for v in fields.get('fixVersions') or []]
+            issue_data['affected_versions'] = [v['name'] for v in fields.get('versions') or []]
+
+        return issue_data
+
+    @_wraps_jira_errors("Failed to get comments for {issue_key}", "Unexpected error getting comments")
     def list_comments(self, issue_key: str) -> List[Dict[str, Any]]:
         """
         Get all comments for an issue.
@@ -553,38 +1294,18 @@ class IssueManager:
         Raises:
             IssueManagerError: If retrieval fails
         """
-        try:
-            logger.info("Getting comments for issue: %s", issue_key)
-
-            issue = self.jira.issue(issue_key)
-            comments = issue.fields.comment.comments
-
-            comment_list = []
-            for comment in comments:
-                comment_data = {
-                    'id': comment.id,
-                    'body': comment.body,
-                    'author': {
-                        'name': get_user_attribute(comment.author, 'displayName', 'displayName', 'Unknown'),
-                        'account_id': get_user_attribute(comment.author, 'accountId', 'name', 'N/A')
-                    },
-                    'created': str(comment.created),
-                    'updated': str(comment.updated)
-                }
-                comment_list.append(comment_data)
-
-            logger.info("Found %d comments", len(comment_list))
-            return comment_list
+        logger.debug("Getting comments for issue: %s", issue_key)
 
-        except JIRAError as e:
-            error_msg = f"Failed to get comments for {issue_key}: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error getting comments: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
+        issue = self._get_issue(issue_key, 'comment')
+        comments = issue.fields.comment.comments
+
+        format_comment = self._format_comment
+        comment_list = [format_comment(comment) for comment in comments]
+
+        logger.debug("Found %d comments", len(comment_list))
+        return comment_list
 
+    @_wraps_jira_errors("Failed to add comment to {issue_key}", "Unexpected error adding comment")
     def add_comment(self, issue_key: str, body: str) -> Dict[str, Any]:
         """
         Add a comment to an issue.
@@ -599,35 +1320,17 @@ class IssueManager:
         Raises:
             IssueManagerError: If comment creation fails
         """
-        try:
-            logger.info("Adding comment to issue: %s", issue_key)
-
-            issue = self.jira.issue(issue_key)
-            comment = self.jira.add_comment(issue, body)
-
-            comment_data = {
-                'id': comment.id,
-                'body': comment.body,
-                'author': {
-                    'name': get_user_attribute(comment.author, 'displayName', 'displayName', 'Unknown'),
-                    'account_id': get_user_attribute(comment.author, 'accountId', 'name', 'N/A')
-                },
-                'created': str(comment.created),
-                'updated': str(comment.updated)
-            }
+        logger.info("Adding comment to issue: %s", issue_key)
 
-            logger.info("✅ Added comment to %s", issue_key)
-            return comment_data
+        comment = _call_with_retry(self.jira.add_comment, issue_key, body)
+        self._invalidate_issue(issue_key)
 
-        except JIRAError as e:
-            error_msg = f"Failed to add comment to {issue_key}: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error adding comment: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
+        comment_data = self._format_comment(comment)
 
+        logger.info("✅ Added comment to %s", issue_key)
+        return comment_data
+
+    @_wraps_jira_errors("Failed to update comment {comment_id}", "Unexpected error updating comment")
     def update_comment(
         self,
         issue_key: str,
@@ -648,38 +1351,19 @@ class IssueManager:
         Raises:
             IssueManagerError: If comment update fails
         """
-        try:
-            logger.info("Updating comment %s on issue %s", comment_id, issue_key)
-
-            comment = self.jira.comment(issue_key, comment_id)
-            comment.update(body=body)
-
-            # Refresh comment to get updated data
-            comment = self.jira.comment(issue_key, comment_id)
-
-            comment_data = {
-                'id': comment.id,
-                'body': comment.body,
-                'author': {
-                    'name': get_user_attribute(comment.author, 'displayName', 'displayName', 'Unknown'),
-                    'account_id': get_user_attribute(comment.author, 'accountId', 'name', 'N/A')
-                },
-                'created': str(comment.created),
-                'updated': str(comment.updated)
-            }
+        logger.info("Updating comment %s on issue %s", comment_id, issue_key)
 
-            logger.info("✅ Updated comment %s", comment_id)
-            return comment_data
+        comment = _call_with_retry(self.jira.comment, issue_key, comment_id)
+        # Comment.update reloads the resource after the PUT, so it is already current
+        _call_with_retry(comment.update, body=body)
+        self._invalidate_issue(issue_key)
 
-        except JIRAError as e:
-            error_msg = f"Failed to update comment {comment_id}: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error updating comment: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
+        comment_data = self._format_comment(comment)
+
+        logger.info("✅ Updated comment %s", comment_id)
+        return comment_data
 
+    @_wraps_jira_errors("Failed to delete comment {comment_id}", "Unexpected error deleting comment")
     def delete_comment(self, issue_key: str, comment_id: str) -> None:
         """
         Delete a comment from an issue.
@@ -691,23 +1375,15 @@ class IssueManager:
         Raises:
             IssueManagerError: If comment deletion fails
         """
-        try:
-            logger.info("Deleting comment %s from issue %s", comment_id, issue_key)
+        logger.info("Deleting comment %s from issue %s", comment_id, issue_key)
 
-            comment = self.jira.comment(issue_key, comment_id)
-            comment.delete()
+        comment = _call_with_retry(self.jira.comment, issue_key, comment_id)
+        _call_with_retry(comment.delete)
+        self._invalidate_issue(issue_key)
 
-            logger.info("✅ Deleted comment %s", comment_id)
-
-        except JIRAError as e:
-            error_msg = f"Failed to delete comment {comment_id}: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error deleting comment: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
+        logger.info("✅ Deleted comment %s", comment_id)
 
+    @_wraps_jira_errors("Failed to get attachments for {issue_key}", "Unexpected error getting attachments")
     def list_attachments(self, issue_key: str) -> List[Dict[str, Any]]:
         """
         Get all attachments for an issue.
@@ -721,40 +1397,18 @@ class IssueManager:
         Raises:
             IssueManagerError: If retrieval fails
         """
-        try:
-            logger.info("Getting attachments for issue: %s", issue_key)
-
-            issue = self.jira.issue(issue_key)
-            attachments = issue.fields.attachment
-
-            attachment_list = []
-            for attachment in attachments:
-                attachment_data = {
-                    'id': attachment.id,
-                    'filename': attachment.filename,
-                    'size': attachment.size,
-                    'mime_type': getattr(attachment, 'mimeType', 'unknown'),
-                    'created': str(attachment.created),
-                    'author': {
-                        'name': get_user_attribute(attachment.author, 'displayName', 'displayName', 'Unknown'),
-                        'account_id': get_user_attribute(attachment.author, 'accountId', 'name', 'N/A')
-                    },
-                    'content_url': attachment.content
-                }
-                attachment_list.append(attachment_data)
-
-            logger.info("Found %d attachments", len(attachment_list))
-            return attachment_list
+        logger.debug("Getting attachments for issue: %s", issue_key)
 
-        except JIRAError as e:
-            error_msg = f"Failed to get attachments for {issue_key}: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error getting attachments: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
+        issue = self._get_issue(issue_key, 'attachment')
+        attachments = issue.fields.attachment
+
+        format_attachment = self._format_attachment
+        attachment_list = [format_attachment(attachment) for attachment in attachments]
 
+        logger.debug("Found %d attachments", len(attachment_list))
+        return attachment_list
+
+    @_wraps_jira_errors("Failed to add attachment to {issue_key}", "Unexpected error adding attachment")
     def add_attachment(self, issue_key: str, filepath: str) -> Dict[str, Any]:
         """
         Upload an attachment to an issue.
@@ -769,44 +1423,25 @@ class IssueManager:
         Raises:
             IssueManagerError: If upload fails
         """
-        try:
-            logger.info("Adding attachment to issue %s: %s", issue_key, filepath)
+        logger.info("Adding attachment to issue %s: %s", issue_key, filepath)
 
-            issue = self.jira.issue(issue_key)
-
-            # Upload the attachment
+        # Upload the attachment; the client streams the open file with a multipart
+        # encoder and rewinds it before every attempt, so retries re-send it whole
+        try:
             with open(filepath, 'rb') as file:
-                attachment = self.jira.add_attachment(issue, file)
-
-            attachment_data = {
-                'id': attachment.id,
-                'filename': attachment.filename,
-                'size': attachment.size,
-                'mime_type': getattr(attachment, 'mimeType', 'unknown'),
-                'created': str(attachment.created),
-                'author': {
-                    'name': get_user_attribute(attachment.author, 'displayName', 'displayName', 'Unknown'),
-                    'account_id': get_user_attribute(attachment.author, 'accountId', 'name', 'N/A')
-                },
-                'content_url': attachment.content
-            }
-
-            logger.info("✅ Added attachment to %s", issue_key)
-            return attachment_data
-
+                attachment = _call_with_retry(self.jira.add_attachment, issue_key, file)
         except FileNotFoundError as e:
             error_msg = f"File not found: {filepath}"
             logger.error("❌ %s", error_msg)
             raise IssueManagerError(error_msg) from e
-        except JIRAError as e:
-            error_msg = f"Failed to add attachment to {issue_key}: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error adding attachment: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
+        self._invalidate_issue(issue_key)
+
+        attachment_data = self._format_attachment(attachment)
+
+        logger.info("✅ Added attachment to %s", issue_key)
+        return attachment_data
 
+    @_wraps_jira_errors("Failed to delete attachment {attachment_id}", "Unexpected error deleting attachment")
     def delete_attachment(self, attachment_id: str) -> None:
         """
         Delete an attachment.
@@ -817,23 +1452,15 @@ class IssueManager:
         Raises:
             IssueManagerError: If deletion fails
         """
-        try:
-            logger.info("Deleting attachment: %s", attachment_id)
-
-            attachment = self.jira.attachment(attachment_id)
-            attachment.delete()
+        logger.info("Deleting attachment: %s", attachment_id)
 
-            logger.info("✅ Deleted attachment %s", attachment_id)
+        attachment = _call_with_retry(self.jira.attachment, attachment_id)
+        _call_with_retry(attachment.delete)
+        self._issue_cache.clear()
 
-        except JIRAError as e:
-            error_msg = f"Failed to delete attachment {attachment_id}: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error deleting attachment: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
+        logger.info("✅ Deleted attachment %s", attachment_id)
 
+    @_wraps_jira_errors("Failed to create link", "Unexpected error creating link")
     def create_link(
         self,
         inward_issue: str,
@@ -854,33 +1481,68 @@ class IssueManager:
         Raises:
             IssueManagerError: If link creation fails
         """
-        try:
-            logger.info("Creating link: %s %s %s", inward_issue, link_type, outward_issue)
+        logger.info("Creating link: %s %s %s", inward_issue, link_type, outward_issue)
+
+        _call_with_retry(
+            self.jira.create_issue_link,
+            type=link_type,
+            inwardIssue=inward_issue,
+            outwardIssue=outward_issue
+        )
+        self._invalidate_issue(inward_issue)
+        self._invalidate_issue(outward_issue)
+
+        result = {
+            'inward_issue': inward_issue,
+            'outward_issue': outward_issue,
+            'link_type': link_type
+        }
+
+        logger.info("✅ Created link between %s and %s", inward_issue, outward_issue)
+        return result
+
+    @_wraps_jira_errors("Failed to create links", "Unexpected error creating links")
+    def create_links(self, links: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+        """
+        Create several issue links concurrently.
 
-            self.jira.create_issue_link(
+        Args:
+            links: List of (inward issue key, outward issue key, link type name) tuples
+
+        Returns:
+            List of link creation results, in input order
+
+        Raises:
+            IssueManagerError: If any link creation fails
+        """
+        logger.info("Creating %d links", len(links))
+
+        def create(link: Tuple[str, str, str]) -> Dict[str, Any]:
+            inward_issue, outward_issue, link_type = link
+            _call_with_retry(
+                self.jira.create_issue_link,
                 type=link_type,
                 inwardIssue=inward_issue,
                 outwardIssue=outward_issue
             )
-
-            result = {
+            return {
                 'inward_issue': inward_issue,
                 'outward_issue': outward_issue,
                 'link_type': link_type
             }
 
-            logger.info("✅ Created link between %s and %s", inward_issue, outward_issue)
-            return result
+        try:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                results = list(executor.map(create, links))
+        finally:
+            for inward_issue, outward_issue, _ in links:
+                self._invalidate_issue(inward_issue)
+                self._invalidate_issue(outward_issue)
 
-        except JIRAError as e:
-            error_msg = f"Failed to create link: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error creating link: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
+        logger.info("✅ Created %d links", len(results))
+        return results
 
+    @_wraps_jira_errors("Failed to delete link {link_id}", "Unexpected error deleting link")
     def delete_link(self, link_id: str) -> None:
         """
         Delete an issue link.
@@ -891,23 +1553,40 @@ class IssueManager:
         Raises:
             IssueManagerError: If link deletion fails
         """
-        try:
-            logger.info("Deleting link: %s", link_id)
+        logger.info("Deleting link: %s", link_id)
 
-            link = self.jira.issue_link(link_id)
-            link.delete()
+        link = _call_with_retry(self.jira.issue_link, link_id)
+        _call_with_retry(link.delete)
+        self._issue_cache.clear()
 
-            logger.info("✅ Deleted link %s", link_id)
+        logger.info("✅ Deleted link %s", link_id)
 
-        except JIRAError as e:
-            error_msg = f"Failed to delete link {link_id}: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error deleting link: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
+    @_wraps_jira_errors("Failed to delete links", "Unexpected error deleting links")
+    def delete_links(self, link_ids: List[str]) -> None:
+        """
+        Delete several issue links concurrently.
+
+        Args:
+            link_ids: Link IDs to delete
+
+        Raises:
+            IssueManagerError: If any link deletion fails
+        """
+        logger.info("Deleting %d links", len(link_ids))
+
+        def delete(link_id: str) -> None:
+            link = _call_with_retry(self.jira.issue_link, link_id)
+            _call_with_retry(link.delete)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                list(executor.map(delete, link_ids))
+        finally:
+            self._issue_cache.clear()
 
+        logger.info("✅ Deleted %d links", len(link_ids))
+
+    @_wraps_jira_errors("Failed to get links for {issue_key}", "Unexpected error getting links")
     def list_links(self, issue_key: str) -> List[Dict[str, Any]]:
         """
         Get all issue links for an issue.
@@ -921,43 +1600,57 @@ class IssueManager:
         Raises:
             IssueManagerError: If retrieval fails
         """
-        try:
-            logger.info("Getting links for issue: %s", issue_key)
+        logger.debug("Getting links for issue: %s", issue_key)
 
-            issue = self.jira.issue(issue_key)
-            issue_links = issue.fields.issuelinks
+        issue = self._get_issue(issue_key, 'issuelinks')
+        issue_links = issue.fields.issuelinks
 
-            link_list = []
-            for link in issue_links:
-                link_data = {
-                    'id': link.id,
-                    'type': link.type.name
-                }
+        format_link = self._format_link
+        link_list = [format_link(link) for link in issue_links]
 
-                # Determine if this is an inward or outward link
-                if hasattr(link, 'outwardIssue'):
-                    link_data['direction'] = 'outward'
-                    link_data['related_issue'] = link.outwardIssue.key
-                    link_data['related_summary'] = link.outwardIssue.fields.summary
-                elif hasattr(link, 'inwardIssue'):
-                    link_data['direction'] = 'inward'
-                    link_data['related_issue'] = link.inwardIssue.key
-                    link_data['related_summary'] = link.inwardIssue.fields.summary
+        logger.debug("Found %d links", len(link_list))
+        return link_list
 
-                link_list.append(link_data)
+    @_wraps_jira_errors("Failed to get links", "Unexpected error getting links")
+    def list_links_bulk(self, issue_keys: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the issue links of several issues with batched JQL searches.
 
-            logger.info("Found %d links", len(link_list))
-            return link_list
+        Args:
+            issue_keys: Issue keys (e.g., ['PROJ-123', 'PROJ-124'])
 
-        except JIRAError as e:
-            error_msg = f"Failed to get links for {issue_key}: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error getting links: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
+        Returns:
+            Dictionary mapping each requested issue key to its list of link
+            dictionaries (empty if the issue has no links or was not found)
 
+        Raises:
+            IssueManagerError: If any key is malformed or retrieval fails
+        """
+        keys = _normalize_issue_keys(issue_keys)
+        logger.debug("Getting links for %d issues", len(keys))
+
+        links_by_key: Dict[str, List[Dict[str, Any]]] = {key: [] for key in keys}
+        format_link = self._format_link
+        if keys:
+            self._prime_field_map()
+        for chunk in (keys[i:i + BATCH_SIZE] for i in range(0, len(keys), BATCH_SIZE)):
+            issues = _call_with_retry(
+                self.jira.search_issues,
+                f"key in ({','.join(chunk)})",
+                maxResults=len(chunk),
+                validate_query=False,
+                fields='issuelinks'
+            )
+            for issue in issues:
+                # Only report the issues that were asked for
+                if issue.key not in links_by_key:
+                    continue
+                links = getattr(issue.fields, 'issuelinks', None) or []
+                links_by_key[issue.key] = [format_link(link) for link in links]
+
+        return links_by_key
+
+    @_wraps_jira_errors("Failed to create subtask", "Unexpected error creating subtask")
     def create_subtask(
         self,
         parent_key: str,
@@ -982,45 +1675,119 @@ class IssueManager:
         Raises:
             IssueManagerError: If subtask creation fails
         """
+        logger.debug("Creating subtask under %s: %s", parent_key, summary)
+
+        fields = self._subtask_fields(parent_key, summary, description, assignee, kwargs)
+
+        # Create the subtask
+        subtask = _call_with_retry(self.jira.create_issue, fields=fields)
+        self._invalidate_issue(parent_key)
+
+        logger.info("✅ Created subtask: %s", subtask.key)
+        return self._format_issue(subtask, full_details=True)
+
+    @_wraps_jira_errors("Failed to create subtasks under {parent_key}", "Unexpected error creating subtasks")
+    def create_subtasks(self, parent_key: str, subtasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create several subtasks under one parent with Jira's bulk create endpoint.
+
+        Subtasks are sent BATCH_SIZE at a time, one POST per batch, and the
+        created issues are then read back with batched searches.
+
+        Args:
+            parent_key: Parent issue key (e.g., 'PROJ-123')
+            subtasks: Subtask specs, each with a 'summary' and optional
+                'description', 'assignee' and additional custom fields
+
+        Returns:
+            List of created subtask dictionaries, in input order
+
+        Raises:
+            IssueManagerError: If the parent key is invalid or any subtask fails to be created
+        """
+        logger.info("Creating %d subtasks under %s", len(subtasks), parent_key)
+
+        field_list = []
+        for spec in subtasks:
+            extra = {name: value for name, value in spec.items() if name not in ('summary', 'description', 'assignee')}
+            field_list.append(self._subtask_fields(
+                parent_key, spec['summary'], spec.get('description'), spec.get('assignee'), extra
+            ))
+
+        created_keys: List[str] = []
+        failures: List[str] = []
         try:
-            logger.info("Creating subtask under %s: %s", parent_key, summary)
-
-            # Get parent issue to extract project
-            parent_issue = self.jira.issue(parent_key)
-            project_key = parent_issue.fields.project.key
-
-            # Build subtask fields
-            fields = {
-                'project': {'key': project_key},
-                'summary': summary,
-                'issuetype': {'name': 'Sub-task'},
-                'parent': {'key': parent_key}
-            }
+            for start in range(0, len(field_list), BATCH_SIZE):
+                results = _call_with_retry(
+                    self.jira.create_issues,
+                    field_list=field_list[start:start + BATCH_SIZE],
+                    prefetch=False
+                )
+                for offset, result in enumerate(results):
+                    if result['issue'] is not None:
+                        created_keys.append(result['issue'].key)
+                    else:
+                        failures.append(f"#{start + offset + 1} ({subtasks[start + offset]['summary']}): {result['error']}")
+        finally:
+            self._invalidate_issue(parent_key)
+
+        if failures:
+            created = f" Created: {', '.join(created_keys)}." if created_keys else ""
+            raise IssueManagerError(f"Failed to create {len(failures)} subtask(s): {'; '.join(failures)}.{created}")
+
+        logger.info("✅ Created %d subtasks under %s", len(created_keys), parent_key)
+        return self.get_issues(created_keys)
+
+    def _subtask_fields(
+        self,
+        parent_key: str,
+        summary: str,
+        description: Optional[str],
+        assignee: Optional[str],
+        extra_fields: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Build the create-issue fields for a subtask.
 
-            if description:
-                fields['description'] = description
+        The project key is the prefix of the parent's issue key, so the parent
+        does not need to be fetched.
 
-            if assignee:
-                fields['assignee'] = {'accountId': assignee}
+        Args:
+            parent_key: Parent issue key (e.g., 'PROJ-123')
+            summary: Subtask summary/title
+            description: Optional subtask description
+            assignee: Optional assignee account ID
+            extra_fields: Additional custom fields
 
-            # Add any additional fields
-            fields.update(kwargs)
+        Returns:
+            Fields dictionary for create_issue / create_issues
 
-            # Create the subtask
-            subtask = self.jira.create_issue(fields=fields)
+        Raises:
+            IssueManagerError: If the parent key is not a valid issue key
+        """
+        project_key, _, issue_number = parent_key.rpartition('-')
+        if not project_key or not issue_number.isdigit():
+            raise IssueManagerError(f"Invalid parent key: {parent_key}")
+
+        # Build subtask fields
+        fields = {
+            'project': {'key': project_key},
+            'summary': summary,
+            'issuetype': {'name': 'Sub-task'},
+            'parent': {'key': parent_key}
+        }
 
-            logger.info("✅ Created subtask: %s", subtask.key)
-            return self._format_issue(subtask, full_details=True)
+        if description:
+            fields['description'] = description
 
-        except JIRAError as e:
-            error_msg = f"Failed to create subtask: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error creating subtask: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
+        if assignee:
+            fields['assignee'] = {'accountId': assignee}
 
+        # Add any additional fields
+        fields.update(extra_fields)
+        return fields
+
+    @_wraps_jira_errors("Failed to get subtasks for {issue_key}", "Unexpected error getting subtasks")
     def list_subtasks(self, issue_key: str) -> List[Dict[str, Any]]:
         """
         Get all subtasks for an issue.
@@ -1034,44 +1801,52 @@ class IssueManager:
         Raises:
             IssueManagerError: If retrieval fails
         """
-        try:
-            logger.info("Getting subtasks for issue: %s", issue_key)
+        logger.debug("Getting subtasks for issue: %s", issue_key)
 
-            issue = self.jira.issue(issue_key)
-            subtasks = getattr(issue.fields, 'subtasks', [])
+        issue = self._get_issue(issue_key, 'subtasks')
+        subtasks = getattr(issue.fields, 'subtasks', [])
 
-            subtask_list = []
-            for subtask in subtasks:
-                subtask_data = {
-                    'key': subtask.key,
-                    'id': subtask.id,
-                    'summary': subtask.fields.summary,
-                    'status': subtask.fields.status.name,
-                    'url': f"{self.site_url}/browse/{subtask.key}"
-                }
-
-                # Add assignee if present
-                if hasattr(subtask.fields, 'assignee') and subtask.fields.assignee:
-                    subtask_data['assignee'] = {
-                        'name': get_user_attribute(subtask.fields.assignee, 'displayName', 'displayName', 'Unknown'),
-                        'account_id': get_user_attribute(subtask.fields.assignee, 'accountId', 'name', 'N/A')
-                    }
-                else:
-                    subtask_data['assignee'] = None
+        format_subtask = self._format_subtask
+        subtask_list = [format_subtask(subtask) for subtask in subtasks]
+
+        logger.debug("Found %d subtasks", len(subtask_list))
+        return subtask_list
 
-                subtask_list.append(subtask_data)
+    @_wraps_jira_errors("Failed to get subtasks", "Unexpected error getting subtasks")
+    def list_subtasks_bulk(self, parent_keys: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the subtasks of several parent issues with batched JQL searches.
 
-            logger.info("Found %d subtasks", len(subtask_list))
-            return subtask_list
+        Args:
+            parent_keys: Parent issue keys (e.g., ['PROJ-123', 'PROJ-124'])
 
-        except JIRAError as e:
-            error_msg = f"Failed to get subtasks for {issue_key}: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error getting subtasks: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise IssueManagerError(error_msg) from e
+        Returns:
+            Dictionary mapping each requested parent key to its list of
+            subtask dictionaries (empty if it has none or was not found)
+
+        Raises:
+            IssueManagerError: If any key is malformed or retrieval fails
+        """
+        keys = _normalize_issue_keys(parent_keys)
+        logger.debug("Getting subtasks for %d issues", len(keys))
+
+        subtasks_by_parent: Dict[str, List[Dict[str, Any]]] = {key: [] for key in keys}
+        format_subtask = self._format_subtask
+        if keys:
+            self._prime_field_map()
+        for chunk in (keys[i:i + BATCH_SIZE] for i in range(0, len(keys), BATCH_SIZE)):
+            subtasks = _call_with_retry(
+                self.jira.search_issues,
+                f"parent in ({','.join(chunk)}) AND issuetype in subTaskIssueTypes() ORDER BY created ASC",
+                maxResults=False,
+                validate_query=False,
+                fields='summary,status,assignee,parent'
+            )
+            for subtask in subtasks:
+                parent_key = subtask.fields.parent.key
+                subtasks_by_parent.setdefault(parent_key, []).append(format_subtask(subtask))
+
+        return subtasks_by_parent
 
     def __repr__(self) -> str:
         """String representation of IssueManager."""
@@ -7,28 +7,156 @@ error handling, and logging.
 """
 
 import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 import requests
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union, cast
 from jira import JIRA
-from jira.exceptions import JIRAError
+from requests.adapters import HTTPAdapter
 
-from .utils import get_user_attribute
+from .utils import get_user_attribute, wraps_jira_errors
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections held per host by the JIRA session (requests defaults to 10)
+HTTP_POOL_MAXSIZE = 32
+
+# Server info and the authenticated user rarely change, so they are reused for a
+# few minutes. Module-level because a JiraClient is created per tool call.
+SESSION_INFO_TTL = 300  # seconds
+
+_server_info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_current_user_cache: Dict[Tuple[str, str, str], Tuple[float, Dict[str, Any]]] = {}
+
+# The project list only changes when projects are created or permissions change
+PROJECTS_TTL = 300  # seconds
+
+# Page size for GET /project/search (the Cloud maximum)
+PROJECT_PAGE_SIZE = 50
+
+_projects_cache: Dict[Tuple[str, str, str], Tuple[float, List[Dict[str, Any]]]] = {}
+
+# Requests currently in flight, so concurrent identical lookups share one call
+_inflight_lock = threading.Lock()
+_inflight: Dict[Tuple[Any, ...], 'Future[Any]'] = {}
+
+_T = TypeVar('_T')
+_F = TypeVar('_F', bound=Callable[..., Any])
+
 
 class JiraClientError(Exception):
     """Custom exception for Jira client errors."""
 
 
+def _wraps_jira_errors(failure: str, unexpected: str) -> Callable[[_F], _F]:
+    """
+    Decorate a JiraClient method so every failure surfaces as JiraClientError.
+
+    Args:
+        failure: Message for Jira API errors, formatted with the call's arguments
+            by name (e.g. "Failed to get issue {issue_key}")
+        unexpected: Message for any other error
+
+    Returns:
+        Method decorator
+    """
+    return wraps_jira_errors(JiraClientError, failure, unexpected)
+
+
+def _coalesced(key: Tuple[Any, ...], fetch: Callable[[], _T]) -> _T:
+    """
+    Run fetch once for concurrent callers asking for the same key.
+
+    The first caller performs the request; callers arriving while it is in
+    flight wait for and share its result (or its exception).
+
+    Args:
+        key: Identifies the request, including the credentials it runs as
+        fetch: Performs the request
+
+    Returns:
+        The result of fetch
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if future is None:
+            future = Future()
+            _inflight[key] = future
+
+    if not leader:
+        return cast(_T, future.result())
+
+    try:
+        result = fetch()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+    future.set_result(result)
+    return result
+
+
+def _format_user(user: Any) -> Dict[str, Any]:
+    """
+    Format a Jira user resource into a dictionary.
+
+    Only the account ID differs between Cloud ('accountId') and Server
+    ('name'); the other attributes share a name and are read directly.
+
+    Args:
+        user: JIRA user object, or the raw JSON user from GET /myself
+
+    Returns:
+        User dictionary
+    """
+    if isinstance(user, dict):
+        return {
+            'account_id': user.get('accountId', user.get('name', 'N/A')),
+            'email': user.get('emailAddress', 'N/A'),
+            'display_name': user.get('displayName', 'Unknown'),
+            'active': user.get('active', True)
+        }
+    return {
+        'account_id': get_user_attribute(user, 'accountId', 'name', 'N/A'),
+        'email': getattr(user, 'emailAddress', 'N/A'),
+        'display_name': getattr(user, 'displayName', 'Unknown'),
+        'active': getattr(user, 'active', True)
+    }
+
+
+def _format_project(project: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Format a raw project JSON object into a dictionary.
+
+    Args:
+        project: Project JSON from the Jira API
+
+    Returns:
+        Project dictionary
+    """
+    return {
+        'key': project['key'],
+        'name': project['name'],
+        'id': project['id'],
+        'project_type': project.get('projectTypeKey', 'Unknown')
+    }
+
+
 class JiraClient:
     """
     Jira API client wrapper with authentication and error handling.
 
     Supports both Jira Cloud (email + API token) and Jira Server/Data Center (PAT).
+    The connection is opened on first use of the ``jira`` property.
     """
 
+    __slots__ = ('site_url', 'email', '_api_token', 'auth_type', '_jira', '_connect_lock')
+
     def __init__(self, site_url: str, email: str, api_token: str, auth_type: str = 'cloud'):
         """
         Initialize Jira client.
@@ -38,54 +166,81 @@ class JiraClient:
             email: Email address for authentication (Cloud) or username (Server with basic auth)
             api_token: Jira API token (Cloud) or Personal Access Token (Server)
             auth_type: Authentication type - 'cloud' (email+token) or 'pat' (Personal Access Token)
-
-        Raises:
-            JiraClientError: If initialization fails
         """
         self.site_url = site_url
         self.email = email
         self._api_token = api_token  # Keep private
         self.auth_type = auth_type
         self._jira: Optional[JIRA] = None
+        self._connect_lock = threading.Lock()
 
-        # Initialize connection
-        self._connect()
-
-    def _connect(self) -> None:
+    @_wraps_jira_errors("Failed to connect to Jira", "Unexpected error connecting to Jira")
+    def _connect(self) -> JIRA:
         """
         Establish connection to Jira instance.
 
+        Returns:
+            Connected JIRA client instance
+
         Raises:
             JiraClientError: If connection fails
         """
-        try:
-            logger.info("Connecting to Jira: %s (auth_type: %s)", self.site_url, self.auth_type)
-
-            if self.auth_type == 'pat':
-                # Jira Server/Data Center with Personal Access Token
-                # PAT uses Bearer token authentication
-                self._jira = JIRA(
-                    server=self.site_url,
-                    token_auth=self._api_token
-                )
-                logger.info("✅ Connected to Jira Server/Data Center with PAT")
-            else:
-                # Jira Cloud with email + API token (basic auth)
-                self._jira = JIRA(
-                    server=self.site_url,
-                    basic_auth=(self.email, self._api_token)
-                )
-                logger.info("✅ Connected to Jira Cloud with API token")
-
-        except JIRAError as e:
-            error_msg = f"Failed to connect to Jira: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise JiraClientError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error connecting to Jira: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise JiraClientError(error_msg) from e
+        logger.info("Connecting to Jira: %s (auth_type: %s)", self.site_url, self.auth_type)
+
+        if self.auth_type == 'pat':
+            # Jira Server/Data Center with Personal Access Token
+            # PAT uses Bearer token authentication
+            client = JIRA(
+                server=self.site_url,
+                token_auth=self._api_token,
+                get_server_info=False
+            )
+            logger.info("✅ Connected to Jira Server/Data Center with PAT")
+        else:
+            # Jira Cloud with email + API token (basic auth)
+            client = JIRA(
+                server=self.site_url,
+                basic_auth=(self.email, self._api_token),
+                get_server_info=False
+            )
+            logger.info("✅ Connected to Jira Cloud with API token")
+
+        # Reuse connections across concurrent requests instead of reconnecting;
+        # retries stay with the JIRA session, which already handles 429/503
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=0)
+        client._session.mount('https://', adapter)  # pylint: disable=protected-access
+        client._session.mount('http://', adapter)  # pylint: disable=protected-access
+
+        # JIRA() would fetch server info on every construction; apply the
+        # cached copy for this site instead (it decides Cloud vs Server APIs)
+        server_info = self._get_server_info(client)
+        client._version = tuple(server_info.get('versionNumbers', (0, 0, 0)))  # pylint: disable=protected-access
+        client.deploymentType = server_info.get('deploymentType')
+
+        self._jira = client
+        return client
+
+    def _get_server_info(self, client: JIRA, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get server info for this site, cached for SESSION_INFO_TTL seconds.
+
+        Args:
+            client: JIRA client used when the cache has no fresh entry
+            refresh: Always request it with this client's credentials
 
+        Returns:
+            Server info dictionary from the Jira API
+        """
+        now = time.monotonic()
+        cached = _server_info_cache.get(self.site_url)
+        if cached and cached[0] > now and not refresh:
+            return cached[1]
+
+        server_info = client.server_info()
+        _server_info_cache[self.site_url] = (now + SESSION_INFO_TTL, server_info)
+        return server_info
+
+    @_wraps_jira_errors("Connection test failed", "Unexpected error during connection test")
     def test_connection(self) -> Dict[str, Any]:
         """
         Test Jira connection and retrieve server info.
@@ -96,28 +251,37 @@ class JiraClient:
         Raises:
             JiraClientError: If connection test fails
         """
+        # Always ask the server: the cached copy only describes the site and
+        # says nothing about whether these credentials are accepted
+        server_info = self._get_server_info(self.jira, refresh=True)
+
+        logger.info("✅ Jira connection test successful: %s", server_info.get('serverTitle', 'Unknown'))
+
+        return {
+            'success': True,
+            'server_title': server_info.get('serverTitle', 'Unknown'),
+            'version': server_info.get('version', 'Unknown'),
+            'base_url': server_info.get('baseUrl', self.site_url)
+        }
+
+    def test_connection_safe(self) -> Tuple[bool, Union[Dict[str, Any], str]]:
+        """
+        Test Jira connection, reporting failure as a value instead of raising.
+
+        A failed connectivity check is an expected outcome for callers such as
+        the hello and add_workspace handlers, so it is returned rather than
+        propagated through them.
+
+        Returns:
+            (True, connection test results) on success, or
+            (False, error message) if the connection test failed
+        """
         try:
-            # Get server info
-            server_info = self._jira.server_info()
-
-            logger.info("✅ Jira connection test successful: %s", server_info.get('serverTitle', 'Unknown'))
-
-            return {
-                'success': True,
-                'server_title': server_info.get('serverTitle', 'Unknown'),
-                'version': server_info.get('version', 'Unknown'),
-                'base_url': server_info.get('baseUrl', self.site_url)
-            }
-
-        except JIRAError as e:
-            error_msg = f"Connection test failed: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise JiraClientError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error during connection test: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise JiraClientError(error_msg) from e
+            return True, self.test_connection()
+        except JiraClientError as error:
+            return False, str(error)
 
+    @_wraps_jira_errors("Failed to get current user", "Unexpected error getting current user")
     def get_current_user(self) -> Dict[str, Any]:
         """
         Get current authenticated user information.
@@ -128,29 +292,19 @@ class JiraClient:
         Raises:
             JiraClientError: If request fails
         """
-        try:
-            # Get current user
-            user = self._jira.current_user()
-
-            # Get user details
-            user_info = self._jira.user(user)
-
-            return {
-                'account_id': get_user_attribute(user_info, 'accountId', 'name', 'N/A'),
-                'email': get_user_attribute(user_info, 'emailAddress', 'emailAddress', 'N/A'),
-                'display_name': get_user_attribute(user_info, 'displayName', 'displayName', 'Unknown'),
-                'active': get_user_attribute(user_info, 'active', 'active', True)
-            }
-
-        except JIRAError as e:
-            error_msg = f"Failed to get current user: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise JiraClientError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error getting current user: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise JiraClientError(error_msg) from e
-
+        # Reuse a recent answer for the same credentials
+        now = time.monotonic()
+        cached = _current_user_cache.get(self._cache_key)
+        if cached and cached[0] > now:
+            logger.debug("Current user cache hit for %s", self.site_url)
+            return dict(cached[1])
+
+        # GET /myself already returns the full user, so no second lookup is needed
+        current_user = _format_user(self.jira.myself())
+        _current_user_cache[self._cache_key] = (now + SESSION_INFO_TTL, current_user)
+        return dict(current_user)
+
+    @_wraps_jira_errors("Failed to search users", "Unexpected error searching users")
     def search_users(self, query: str, max_results: int = 50) -> list:
         """
         Search for users by name or email.
@@ -165,31 +319,49 @@ class JiraClient:
         Raises:
             JiraClientError: If search fails
         """
-        try:
-            # Search users
-            users = self._jira.search_users(query, maxResults=max_results)
-
-            # Format user information
-            user_list = []
-            for user in users:
-                user_list.append({
-                    'account_id': get_user_attribute(user, 'accountId', 'name', 'N/A'),
-                    'email': get_user_attribute(user, 'emailAddress', 'emailAddress', 'N/A'),
-                    'display_name': get_user_attribute(user, 'displayName', 'displayName', 'Unknown'),
-                    'active': get_user_attribute(user, 'active', 'active', True)
-                })
-
-            return user_list
-
-        except JIRAError as e:
-            error_msg = f"Failed to search users: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise JiraClientError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error searching users: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise JiraClientError(error_msg) from e
+        def search() -> List[Dict[str, Any]]:
+            # Read the raw JSON rather than building a User resource per match;
+            # Cloud searches by 'query', Server/Data Center by 'username'
+            params: Dict[str, Any] = {'maxResults': max_results}
+            if self.jira._is_cloud:  # pylint: disable=protected-access
+                params['query'] = query
+            else:
+                params.update(username=query, includeActive=True, includeInactive=False)
+            users = self.jira._get_json('user/search', params=params)  # pylint: disable=protected-access
+            return [_format_user(user) for user in users]
+
+        # Identical searches already in flight (e.g. typeahead bursts) share one request
+        user_list = _coalesced(('search_users', *self._cache_key, query, max_results), search)
+        return [dict(user) for user in user_list]
+
+    def search_users_multi(
+        self,
+        queries: List[str],
+        max_results: int = 50,
+        max_workers: int = 8
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several user searches concurrently.
+
+        Args:
+            queries: Search queries (names or emails)
+            max_results: Maximum number of results per query
+            max_workers: Maximum concurrent requests (kept within HTTP_POOL_MAXSIZE)
+
+        Returns:
+            One list of user dictionaries per query, in input order
 
+        Raises:
+            JiraClientError: If any search fails
+        """
+        if not queries:
+            return []
+
+        workers = max(1, min(max_workers, HTTP_POOL_MAXSIZE, len(queries)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda query: self.search_users(query, max_results), queries))
+
+    @_wraps_jira_errors("Failed to get projects", "Unexpected error getting projects")
     def get_projects(self) -> list:
         """
         Get all accessible projects.
@@ -200,44 +372,95 @@ class JiraClient:
         Raises:
             JiraClientError: If request fails
         """
-        try:
-            projects = self._jira.projects()
-
-            # Format project information
-            project_list = []
-            for project in projects:
-                project_list.append({
-                    'key': project.key,
-                    'name': project.name,
-                    'id': project.id,
-                    'project_type': getattr(project, 'projectTypeKey', 'Unknown')
-                })
-
-            return project_list
-
-        except JIRAError as e:
-            error_msg = f"Failed to get projects: {e.text if hasattr(e, 'text') else str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise JiraClientError(error_msg) from e
-        except Exception as e:
-            error_msg = f"Unexpected error getting projects: {str(e)}"
-            logger.error("❌ %s", error_msg)
-            raise JiraClientError(error_msg) from e
+        # Projects visible to these credentials, reused for PROJECTS_TTL seconds
+        now = time.monotonic()
+        cached = _projects_cache.get(self._cache_key)
+        if cached and cached[0] > now:
+            logger.debug("Projects cache hit for %s", self.site_url)
+            return [dict(project) for project in cached[1]]
+
+        def fetch() -> List[Dict[str, Any]]:
+            # Only four fields are kept, so read the raw JSON instead of
+            # building a Project resource (and its nested resources) per row
+            if self.jira._is_cloud:  # pylint: disable=protected-access
+                projects = self._search_projects()
+            else:
+                # Server/Data Center has no /project/search; /project is not deprecated there
+                projects = self.jira._get_json('project')  # pylint: disable=protected-access
+            return [_format_project(project) for project in projects]
+
+        # Concurrent cache misses share one request
+        project_list = _coalesced(('projects', *self._cache_key), fetch)
+        _projects_cache[self._cache_key] = (now + PROJECTS_TTL, project_list)
+        return [dict(project) for project in project_list]
+
+    def _search_projects(self) -> List[Dict[str, Any]]:
+        """
+        Read every page of GET /project/search.
+
+        The first page reports the total, so the remaining pages are known
+        up front and fetched concurrently.
+
+        Returns:
+            Raw project JSON objects, in server order
+        """
+        def page(start_at: int) -> Dict[str, Any]:
+            params = {'startAt': start_at, 'maxResults': PROJECT_PAGE_SIZE}
+            result = self.jira._get_json('project/search', params=params)  # pylint: disable=protected-access
+            return cast(Dict[str, Any], result)
+
+        first = page(0)
+        projects: List[Dict[str, Any]] = list(first.get('values', []))
+        if first.get('isLast', True):
+            return projects
+
+        starts = range(len(projects), first.get('total', 0), PROJECT_PAGE_SIZE)
+        if not projects or not starts:
+            return projects
+
+        workers = max(1, min(HTTP_POOL_MAXSIZE, len(starts)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(page, starts):
+                projects.extend(result.get('values', []))
+        return projects
+
+    def invalidate_cache(self) -> None:
+        """
+        Drop the cached current user and project list for this client's credentials.
+        """
+        _current_user_cache.pop(self._cache_key, None)
+        _projects_cache.pop(self._cache_key, None)
+
+    @property
+    def _cache_key(self) -> Tuple[str, str, str]:
+        """Key for caches whose contents depend on who is authenticated."""
+        return (self.site_url, self.email, self._api_token)
+
+    def close(self) -> None:
+        """
+        Close the underlying JIRA session and its pooled keep-alive connections.
+        """
+        if self._jira is not None:
+            self._jira.close()
+            self._jira = None
 
     @property
     def jira(self) -> JIRA:
         """
-        Get the underlying JIRA client instance.
+        Get the underlying JIRA client instance, connecting on first access.
 
         Returns:
             JIRA client instance
 
         Raises:
-            JiraClientError: If not connected
+            JiraClientError: If the connection cannot be established
         """
-        if self._jira is None:
-            raise JiraClientError("Jira client not connected")
-        return self._jira
+        jira = self._jira
+        if jira is None:
+            # Clients are shared across worker threads; connect only once
+            with self._connect_lock:
+                jira = self._jira if self._jira is not None else self._connect()
+        return jira
 
     def __repr__(self) -> str:
         """String representation of client."""
@@ -6,8 +6,11 @@ Model Context Protocol server for Jira Cloud integration.
 Implements STDIO transport and tool registration.
 """
 
+import asyncio
+import functools
 import logging
-from typing import Any, Dict, List
+from typing import Any, Awaitable, Callable, Dict, List, Tuple, cast
+import jsonschema
 from mcp import types
 from mcp.server.lowlevel import Server
 
@@ -19,12 +22,457 @@ from .issue_manager import IssueManager, IssueManagerError
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Operation lists shown when an operation is missing or unknown
+WORKSPACE_OPERATIONS = (
+    "hello, create_workspace_skeleton, add_workspace, list_workspaces, "
+    "get_active_workspace, switch_workspace, validate_workspace, "
+    "remove_workspace, get_current_user, search_users"
+)
+PROJECTS_OPERATIONS = "list, get, get_issue_types"
+BATCHABLE_ISSUES_OPERATIONS = (
+    "search, read, create, update, assign, transition, get_transitions, "
+    "list_comments, add_comment, update_comment, delete_comment, "
+    "list_attachments, add_attachment, delete_attachment, "
+    "create_link, delete_link, list_links, create_subtask, list_subtasks"
+)
+ISSUES_OPERATIONS = f"{BATCHABLE_ISSUES_OPERATIONS}, batch_execute"
+
+# batch_execute limits: calls per batch, and default number running at once
+BATCH_MAX_CALLS = 50
+BATCH_DEFAULT_CONCURRENCY = 8
+
+
+def _text(message: str) -> List[types.TextContent]:
+    """
+    Wrap a message as a tool result.
+
+    Args:
+        message: Markdown text to return
+
+    Returns:
+        Single-element list of text content
+    """
+    return [types.TextContent(type="text", text=message)]
+
+
+def _operation_error(operation: Any, available: str) -> List[types.TextContent]:
+    """
+    Build the response for an operation a tool does not support.
+
+    Args:
+        operation: Operation name the caller asked for
+        available: Comma-separated list of the tool's operations
+
+    Returns:
+        Single-element list of text content
+    """
+    return _text(
+        f"❌ **Invalid Operation**: '{operation}'\n\n"
+        f"Available operations: {available}"
+    )
+
+
+# Static responses (missing parameters, empty results), built once at import
+_MISSING_WORKSPACE_OPERATION_MSG = _text(
+    "❌ **Parameter Error**: Missing required parameter 'operation'\n\n"
+    f"Available operations: {WORKSPACE_OPERATIONS}"
+)
+
+_MISSING_PROJECTS_OPERATION_MSG = _text(
+    "❌ **Parameter Error**: Missing required parameter 'operation'\n\n"
+    f"Available operations: {PROJECTS_OPERATIONS}"
+)
+
+_MISSING_ISSUES_OPERATION_MSG = _text(
+    "❌ **Parameter Error**: Missing required parameter 'operation'\n\n"
+    f"Available operations: {ISSUES_OPERATIONS}"
+)
+
+_MISSING_SKELETON_PARAMS_MSG = _text(
+    "❌ **Missing Required Parameters**\n\n"
+    "Required: workspace_name\n"
+    "Optional: auth_type ('cloud' or 'pat', default: 'cloud')\n\n"
+    "Example:\n"
+    "```\n"
+    "jira_workspace(operation=\"create_workspace_skeleton\", "
+    "workspace_name=\"example\", "
+    "auth_type=\"pat\")\n"
+    "```"
+)
+
+_MISSING_ADD_WORKSPACE_PARAMS_MSG = _text(
+    "❌ **Missing Required Parameters**\n\n"
+    "Required: workspace_name, site_url, email, api_token\n"
+    "Optional: auth_type ('cloud' or 'pat', default: 'cloud')\n\n"
+    "Example (Jira Cloud):\n"
+    "```\n"
+    "jira_workspace(operation=\"add_workspace\", "
+    "workspace_name=\"mycompany\", "
+    "site_url=\"mycompany.atlassian.net\", "
+    "email=\"your.email@company.com\", "
+    "api_token=\"YOUR_API_TOKEN\")\n"
+    "```\n\n"
+    "Example (Jira Server/Data Center with PAT):\n"
+    "```\n"
+    "jira_workspace(operation=\"add_workspace\", "
+    "workspace_name=\"mycompany\", "
+    "site_url=\"jira.company.com\", "
+    "email=\"username\", "
+    "api_token=\"YOUR_PERSONAL_ACCESS_TOKEN\", "
+    "auth_type=\"pat\")\n"
+    "```\n\n"
+    "Get your API token from: https://id.atlassian.com/manage-profile/security/api-tokens"
+)
+
+_NO_WORKSPACES_MSG = _text(
+    "ℹ️ **No Workspaces Configured**\n\n"
+    "Add a workspace to get started:\n"
+    "```\n"
+    "jira_workspace(operation=\"add_workspace\", workspace_name=\"mycompany\", "
+    "site_url=\"mycompany.atlassian.net\", email=\"your.email@company.com\", "
+    "api_token=\"YOUR_API_TOKEN\")\n"
+    "```"
+)
+
+_NO_ACTIVE_WORKSPACE_MSG = _text(
+    "⚠️ **No Active Workspace**\n\n"
+    "No workspace is currently active. Add a workspace or switch to an existing one:\n"
+    "```\n"
+    "jira_workspace(operation=\"list_workspaces\")\n"
+    "jira_workspace(operation=\"switch_workspace\", workspace_name=\"<name>\")\n"
+    "```"
+)
+
+_MISSING_SWITCH_WORKSPACE_NAME_MSG = _text(
+    "❌ **Missing Required Parameter**: workspace_name\n\n"
+    "Example: jira_workspace(operation=\"switch_workspace\", workspace_name=\"mycompany\")"
+)
+
+_MISSING_REMOVE_WORKSPACE_NAME_MSG = _text(
+    "❌ **Missing Required Parameter**: workspace_name\n\n"
+    "Example: jira_workspace(operation=\"remove_workspace\", workspace_name=\"mycompany\")"
+)
+
+_MISSING_QUERY_MSG = _text(
+    "❌ **Missing Required Parameter**: query\n\n"
+    "Example: jira_workspace(operation=\"search_users\", query=\"john\")"
+)
+
+_Handler = Callable[[Dict[str, Any]], Awaitable[List[types.TextContent]]]
+
+
+# Tool input schemas, shared by the tool definitions and the argument validators
+_WORKSPACE_INPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["operation"],
+    "properties": {
+        "operation": {
+            "type": "string",
+            "enum": [
+                "hello",
+                "create_workspace_skeleton",
+                "add_workspace",
+                "list_workspaces",
+                "get_active_workspace",
+                "switch_workspace",
+                "validate_workspace",
+                "remove_workspace",
+                "get_current_user",
+                "search_users"
+            ],
+            "description": "Operation to perform"
+        },
+        "workspace_name": {
+            "type": "string",
+            "description": "Workspace name (for add_workspace, switch_workspace, validate_workspace, remove_workspace)"
+        },
+        "site_url": {
+            "type": "string",
+            "description": "Jira site URL (for add_workspace) - e.g., company.atlassian.net or https://company.atlassian.net"
+        },
+        "email": {
+            "type": "string",
+            "description": "Email address for Jira authentication (for add_workspace)"
+        },
+        "api_token": {
+            "type": "string",
+            "description": "Jira API token (for add_workspace) - get from https://id.atlassian.com/manage-profile/security/api-tokens"
+        },
+        "auth_type": {
+            "type": "string",
+            "enum": ["cloud", "pat"],
+            "description": (
+                "Authentication type (for add_workspace) - 'cloud' for Jira Cloud (email+token), "
+                "'pat' for Jira Server/Data Center (Personal Access Token). Default: 'cloud'"
+            )
+        },
+        "skip_validation": {
+            "type": "boolean",
+            "description": "Save without testing the Jira connection (for add_workspace). Default: false"
+        },
+        "query": {
+            "type": "string",
+            "description": "Search query for users (for search_users)"
+        },
+        "max_results": {
+            "type": "integer",
+            "description": "Maximum number of results (for search_users). Default: 50"
+        }
+    },
+    "additionalProperties": False
+}
+
+_PROJECTS_INPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["operation"],
+    "properties": {
+        "operation": {
+            "type": "string",
+            "enum": ["list", "get", "get_issue_types"],
+            "description": "Operation to perform"
+        },
+        "project_key": {
+            "type": "string",
+            "description": "Project key (for get, get_issue_types) - e.g., 'PROJ', 'DEV'"
+        }
+    },
+    "additionalProperties": False
+}
+
+_ISSUES_INPUT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["operation"],
+    "properties": {
+        "operation": {
+            "type": "string",
+            "enum": [
+                "search", "read", "create", "update", "assign", "transition",
+                "get_transitions", "list_comments", "add_comment",
+                "update_comment", "delete_comment", "list_attachments",
+                "add_attachment", "delete_attachment", "create_link",
+                "delete_link", "list_links", "create_subtask", "list_subtasks",
+                "batch_execute"
+            ],
+            "description": "Operation to perform"
+        },
+        "jql": {
+            "type": "string",
+            "description": "JQL query string (for search) - e.g., 'project = ENG AND status = Open'"
+        },
+        "calls": {
+            "type": "array",
+            "description": f"Operations to run (for batch_execute), at most {BATCH_MAX_CALLS}",
+            "items": {
+                "type": "object",
+                "required": ["operation"],
+                "properties": {
+                    "operation": {
+                        "type": "string",
+                        "description": "Any jira_issues operation except batch_execute"
+                    },
+                    "arguments": {
+                        "type": "object",
+                        "description": "Parameters for that operation (as for a single call, without 'operation')"
+                    }
+                }
+            }
+        },
+        "max_concurrent": {
+            "type": "integer",
+            "description": f"Calls run at the same time (for batch_execute). Default: {BATCH_DEFAULT_CONCURRENCY}"
+        },
+        "stop_on_error": {
+            "type": "boolean",
+            "description": "Skip calls not yet started once one fails (for batch_execute). Default: false"
+        },
+        "issue_key": {
+            "type": "string",
+            "description": "Issue key (for read, update, assign, transition, get_transitions) - e.g., 'ENG-123'"
+        },
+        "project_key": {
+            "type": "string",
+            "description": "Project key (for create) - e.g., 'ENG'"
+        },
+        "summary": {
+            "type": "string",
+            "description": "Issue summary/title (for create, update)"
+        },
+        "description": {
+            "type": "string",
+            "description": "Issue description (for create, update). MUST use Jira wiki markup syntax (e.g. h2. Heading, *bold*, _italic_, {code}...{code}, [text|url]) — NOT standard Markdown."
+        },
+        "issue_type": {
+            "type": "string",
+            "description": "Issue type name (for create) - e.g., 'Task', 'Bug', 'Story'"
+        },
+        "assignee": {
+            "type": "string",
+            "description": "Assignee account ID or username (for create, update, assign)"
+        },
+        "priority": {
+            "type": "string",
+            "description": "Priority name (for create, update) - e.g., 'High', 'Medium', 'Low'"
+        },
+        "labels": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "List of labels (for create, update)"
+        },
+        "transition": {
+            "type": "string",
+            "description": "Transition name or ID (for transition) - e.g., 'In Progress', 'Done'"
+        },
+        "comment": {
+            "type": "string",
+            "description": "Optional comment (for transition). MUST use Jira wiki markup syntax — NOT standard Markdown."
+        },
+        "max_results": {
+            "type": "integer",
+            "description": "Maximum number of results (for search). Default: 50"
+        },
+        "body": {
+            "type": "string",
+            "description": "Comment text body (for add_comment, update_comment). MUST use Jira wiki markup syntax (e.g. h2. Heading, *bold*, _italic_, {code}...{code}, [text|url]) — NOT standard Markdown."
+        },
+        "comment_id": {
+            "type": "string",
+            "description": "Comment ID (for update_comment, delete_comment)"
+        },
+        "filepath": {
+            "type": "string",
+            "description": "File path (for add_attachment) - local path to file to upload"
+        },
+        "attachment_id": {
+            "type": "string",
+            "description": "Attachment ID (for delete_attachment)"
+        },
+        "inward_issue": {
+            "type": "string",
+            "description": "Inward issue key (for create_link) - e.g., 'ENG-123'"
+        },
+        "outward_issue": {
+            "type": "string",
+            "description": "Outward issue key (for create_link) - e.g., 'ENG-456'"
+        },
+        "link_type": {
+            "type": "string",
+            "description": "Link type (for create_link) - e.g., 'Relates', 'Blocks', 'Duplicate'. Default: 'Relates'"
+        },
+        "link_id": {
+            "type": "string",
+            "description": "Link ID (for delete_link)"
+        },
+        "parent_key": {
+            "type": "string",
+            "description": "Parent issue key (for create_subtask) - e.g., 'ENG-123'"
+        }
+    },
+    "additionalProperties": True
+}
+
+
+# Tool definitions, built once at import and served as-is by list_tools
+_TOOLS = [
+    types.Tool(
+        name="jira_workspace",
+        description=(
+            "Perform Jira workspace operations: workspace management and connectivity testing.\n\n"
+            "**Configuration Location**: ~/.config/jira-mcp/workspaces/\n\n"
+            "Workspace Management:\n"
+            "- create_workspace_skeleton: Create skeleton config file for user to fill in (RECOMMENDED)\n"
+            "- add_workspace: Directly add workspace with credentials (programmatic use)\n"
+            "- list_workspaces: Show all configured workspaces with active indicator\n"
+            "- get_active_workspace: Display current workspace details\n"
+            "- switch_workspace: Change active workspace\n"
+            "- validate_workspace: Test credentials and API connectivity\n"
+            "- remove_workspace: Delete workspace configuration\n\n"
+            "Connectivity & User:\n"
+            "- hello: Test MCP server and Jira API connectivity\n"
+            "- get_current_user: Get authenticated user info from active workspace\n"
+            "- search_users: Find users by name/email for assignment\n\n"
+            "**Recommended Workflow**: Use create_workspace_skeleton to generate a config file, "
+            "then manually edit it with credentials rather than passing sensitive data through tool calls."
+        ),
+        inputSchema=_WORKSPACE_INPUT_SCHEMA
+    ),
+    types.Tool(
+        name="jira_projects",
+        description=(
+            "Perform Jira project operations: list projects and get project details.\n\n"
+            "Operations:\n"
+            "- list: List all accessible projects\n"
+            "- get: Get detailed information about a specific project\n"
+            "- get_issue_types: Get available issue types for a project\n\n"
+            "Use this tool to discover available projects and their configuration."
+        ),
+        inputSchema=_PROJECTS_INPUT_SCHEMA
+    ),
+    types.Tool(
+        name="jira_issues",
+        description=(
+            "Perform Jira issue operations: search, create, read, update, assign, transition, and manage comments.\n\n"
+            "Core Operations:\n"
+            "- search: Search issues using JQL (Jira Query Language)\n"
+            "- read: Get full details of a specific issue\n"
+            "- create: Create a new issue with fields\n"
+            "- update: Update issue fields\n"
+            "- assign: Assign issue to a user\n"
+            "- transition: Move issue through workflow (e.g., 'To Do' → 'In Progress')\n"
+            "- get_transitions: Get available transitions for an issue\n\n"
+            "Comment Operations:\n"
+            "- list_comments: Get all comments on an issue\n"
+            "- add_comment: Add a new comment to an issue\n"
+            "- update_comment: Update an existing comment\n"
+            "- delete_comment: Delete a comment\n\n"
+            "Attachment Operations:\n"
+            "- list_attachments: Get all attachments on an issue\n"
+            "- add_attachment: Upload a file attachment to an issue\n"
+            "- delete_attachment: Remove an attachment\n\n"
+            "Link Operations:\n"
+            "- create_link: Link two issues with a relationship type\n"
+            "- delete_link: Remove a link between issues\n"
+            "- list_links: Get all links for an issue\n\n"
+            "Subtask Operations:\n"
+            "- create_subtask: Create a subtask under a parent issue\n"
+            "- list_subtasks: Get all subtasks for an issue\n\n"
+            "Batch Operations:\n"
+            "- batch_execute: Run several of the operations above in one call, "
+            "e.g. calls=[{'operation': 'read', 'arguments': {'issue_key': 'ENG-1'}}, ...]\n\n"
+            "**Jira Markdown (Wiki Markup)**: ALL text content written to Jira (descriptions, comments) MUST use "
+            "Jira wiki markup syntax — NOT standard Markdown, GitHub Markdown, or any other format.\n"
+            "Key Jira wiki markup syntax:\n"
+            "- Headings: h1. h2. h3. (not # ## ###)\n"
+            "- Bold: *bold* (not **bold**)\n"
+            "- Italic: _italic_ (not *italic*)\n"
+            "- Bullet list: * item (not - item)\n"
+            "- Numbered list: # item (not 1. item)\n"
+            "- Code block: {code}...{code} or {code:python}...{code} (not ```)\n"
+            "- Inline code: {{monospace}} (not `backticks`)\n"
+            "- Links: [text|https://url] (not [text](url))\n"
+            "- Horizontal rule: ---- (not ---)\n\n"
+            "**Additional Fields**: For create/update operations, you can pass ANY Jira field as additional parameters:\n"
+            "- Standard fields: duedate='2026-04-30', environment='Production', resolution='Fixed'\n"
+            "- Custom fields: customfield_12001='value', customfield_24320='Yes'\n"
+            "- Time tracking: timeoriginalestimate='3600', timeestimate='1800'\n"
+            "Example: jira_issues(operation='update', issue_key='HIW-144', duedate='2026-04-30', environment='Staging')\n\n"
+            "Use this tool for complete issue lifecycle management."
+        ),
+        inputSchema=_ISSUES_INPUT_SCHEMA
+    )
+]
+
+# Argument validators, compiled once per schema instead of on every tool call
+_VALIDATORS = {
+    tool.name: jsonschema.validators.validator_for(tool.inputSchema)(tool.inputSchema)
+    for tool in _TOOLS
+}
+
 
 class MCPServerError(Exception):
     """Custom exception for MCP server errors."""
 
 
-class JiraMCPServer:
+class JiraMCPServer:  # pylint: disable=too-many-instance-attributes
     """
     MCP server for Jira Cloud integration.
 
@@ -45,8 +493,137 @@ class JiraMCPServer:
         # Initialize MCP server
         self.app = Server(self.server_name)
 
-        # Initialize workspace manager
-        self.workspace_manager = WorkspaceManager()
+        # Jira clients by credentials, kept so their HTTP sessions stay warm between calls
+        self._clients: Dict[Tuple[str, str, str, str], JiraClient] = {}
+
+        # Issue managers by the same key, so their per-manager caches outlive a single call
+        self._issue_managers: Dict[Tuple[str, str, str, str], IssueManager] = {}
+
+        # Tool and operation routing tables, built once per server
+        self._tool_routers: Dict[str, _Handler] = {
+            "jira_workspace": self._route_workspace_operation,
+            "jira_projects": self._route_projects_operation,
+            "jira_issues": self._route_issues_operation,
+        }
+        self._workspace_handlers: Dict[str, _Handler] = {
+            "hello": self._handle_hello,
+            "create_workspace_skeleton": self._handle_create_workspace_skeleton,
+            "add_workspace": self._handle_add_workspace,
+            "list_workspaces": self._handle_list_workspaces,
+            "get_active_workspace": self._handle_get_active_workspace,
+            "switch_workspace": self._handle_switch_workspace,
+            "validate_workspace": self._handle_validate_workspace,
+            "remove_workspace": self._handle_remove_workspace,
+            "get_current_user": self._handle_get_current_user,
+            "search_users": self._handle_search_users,
+        }
+        self._projects_handlers: Dict[str, _Handler] = {
+            "list": self._handle_list_projects,
+            "get": self._handle_get_project,
+            "get_issue_types": self._handle_get_issue_types,
+        }
+        self._issues_handlers: Dict[str, _Handler] = {
+            "search": self._handle_search_issues,
+            "read": self._handle_read_issue,
+            "create": self._handle_create_issue,
+            "update": self._handle_update_issue,
+            "assign": self._handle_assign_issue,
+            "transition": self._handle_transition_issue,
+            "get_transitions": self._handle_get_transitions,
+            "list_comments": self._handle_list_comments,
+            "add_comment": self._handle_add_comment,
+            "update_comment": self._handle_update_comment,
+            "delete_comment": self._handle_delete_comment,
+            "list_attachments": self._handle_list_attachments,
+            "add_attachment": self._handle_add_attachment,
+            "delete_attachment": self._handle_delete_attachment,
+            "create_link": self._handle_create_link,
+            "delete_link": self._handle_delete_link,
+            "list_links": self._handle_list_links,
+            "create_subtask": self._handle_create_subtask,
+            "list_subtasks": self._handle_list_subtasks,
+            "batch_execute": self._handle_batch_execute,
+        }
+
+    @functools.cached_property
+    def workspace_manager(self) -> WorkspaceManager:
+        """
+        Workspace manager, created on the first workspace lookup.
+
+        Loading the workspace registry touches the config directory, so it is
+        left out of server start-up and the initial tools/list handshake.
+        """
+        return WorkspaceManager()
+
+    def _get_client(self, credentials: Dict[str, str]) -> JiraClient:
+        """
+        Get a Jira client for workspace credentials, reusing an existing one.
+
+        Clients connect on first use and keep their session, so later calls
+        skip the TCP/TLS handshake.
+
+        Args:
+            credentials: Workspace credentials (site_url, email, api_token, auth_type)
+
+        Returns:
+            JiraClient for these credentials
+        """
+        key = self._client_key(credentials)
+        client = self._clients.get(key)
+        if client is None:
+            client = self._clients[key] = JiraClient(*key)
+        return client
+
+    @staticmethod
+    def _client_key(credentials: Dict[str, str]) -> Tuple[str, str, str, str]:
+        """
+        Build the key that clients and issue managers are cached under.
+
+        Args:
+            credentials: Workspace credentials (site_url, email, api_token, auth_type)
+
+        Returns:
+            Tuple of (site URL, email, API token, auth type)
+        """
+        return (credentials['site_url'], credentials['email'], credentials['api_token'], credentials['auth_type'])
+
+    def _drop_clients(self, site_url: str) -> None:
+        """
+        Close and forget cached Jira clients and issue managers for a site.
+
+        Args:
+            site_url: Jira site URL whose clients should be discarded
+        """
+        for key in [key for key in self._issue_managers if key[0] == site_url]:
+            del self._issue_managers[key]
+        for key in [key for key in self._clients if key[0] == site_url]:
+            self._clients.pop(key).close()
+
+    async def _get_issue_manager(self, credentials: Dict[str, str]) -> IssueManager:
+        """
+        Get an IssueManager for workspace credentials, reusing an existing one.
+
+        Reusing the manager keeps its issue and transitions caches across
+        tool calls, e.g. an update followed by a transition of the same issue.
+
+        Args:
+            credentials: Workspace credentials (site_url, email, api_token, auth_type)
+
+        Returns:
+            IssueManager bound to the cached Jira client
+
+        Raises:
+            JiraClientError: If the client cannot connect
+        """
+        jira_client = self._get_client(credentials)
+        # The first use of a client opens its session; keep that off the event loop too
+        jira = await asyncio.to_thread(lambda: jira_client.jira)
+
+        key = self._client_key(credentials)
+        issue_manager = self._issue_managers.get(key)
+        if issue_manager is None or issue_manager.jira is not jira:
+            issue_manager = self._issue_managers[key] = IssueManager(jira, credentials['site_url'])
+        return issue_manager
 
     def register_tools(self) -> None:
         """
@@ -57,264 +634,10 @@ class JiraMCPServer:
         @self.app.list_tools()
         async def list_tools() -> List[types.Tool]:
             """List all available MCP tools."""
-            return [
-                types.Tool(
-                    name="jira_workspace",
-                    description=(
-                        "Perform Jira workspace operations: workspace management and connectivity testing.\n\n"
-                        "**Configuration Location**: ~/.config/jira-mcp/workspaces/\n\n"
-                        "Workspace Management:\n"
-                        "- create_workspace_skeleton: Create skeleton config file for user to fill in (RECOMMENDED)\n"
-                        "- add_workspace: Directly add workspace with credentials (programmatic use)\n"
-                        "- list_workspaces: Show all configured workspaces with active indicator\n"
-                        "- get_active_workspace: Display current workspace details\n"
-                        "- switch_workspace: Change active workspace\n"
-                        "- validate_workspace: Test credentials and API connectivity\n"
-                        "- remove_workspace: Delete workspace configuration\n\n"
-                        "Connectivity & User:\n"
-                        "- hello: Test MCP server and Jira API connectivity\n"
-                        "- get_current_user: Get authenticated user info from active workspace\n"
-                        "- search_users: Find users by name/email for assignment\n\n"
-                        "**Recommended Workflow**: Use create_workspace_skeleton to generate a config file, "
-                        "then manually edit it with credentials rather than passing sensitive data through tool calls."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "required": ["operation"],
-                        "properties": {
-                            "operation": {
-                                "type": "string",
-                                "enum": [
-                                    "hello",
-                                    "create_workspace_skeleton",
-                                    "add_workspace",
-                                    "list_workspaces",
-                                    "get_active_workspace",
-                                    "switch_workspace",
-                                    "validate_workspace",
-                                    "remove_workspace",
-                                    "get_current_user",
-                                    "search_users"
-                                ],
-                                "description": "Operation to perform"
-                            },
-                            "workspace_name": {
-                                "type": "string",
-                                "description": "Workspace name (for add_workspace, switch_workspace, validate_workspace, remove_workspace)"
-                            },
-                            "site_url": {
-                                "type": "string",
-                                "description": "Jira site URL (for add_workspace) - e.g., company.atlassian.net or https://company.atlassian.net"
-                            },
-                            "email": {
-                                "type": "string",
-                                "description": "Email address for Jira authentication (for add_workspace)"
-                            },
-                            "api_token": {
-                                "type": "string",
-                                "description": "Jira API token (for add_workspace) - get from https://id.atlassian.com/manage-profile/security/api-tokens"
-                            },
-                            "auth_type": {
-                                "type": "string",
-                                "enum": ["cloud", "pat"],
-                                "description": (
-                                    "Authentication type (for add_workspace) - 'cloud' for Jira Cloud (email+token), "
-                                    "'pat' for Jira Server/Data Center (Personal Access Token). Default: 'cloud'"
-                                )
-                            },
-                            "query": {
-                                "type": "string",
-                                "description": "Search query for users (for search_users)"
-                            },
-                            "max_results": {
-                                "type": "integer",
-                                "description": "Maximum number of results (for search_users). Default: 50"
-                            }
-                        },
-                        "additionalProperties": False
-                    }
-                ),
-                types.Tool(
-                    name="jira_projects",
-                    description=(
-                        "Perform Jira project operations: list projects and get project details.\n\n"
-                        "Operations:\n"
-                        "- list: List all accessible projects\n"
-                        "- get: Get detailed information about a specific project\n"
-                        "- get_issue_types: Get available issue types for a project\n\n"
-                        "Use this tool to discover available projects and their configuration."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "required": ["operation"],
-                        "properties": {
-                            "operation": {
-                                "type": "string",
-                                "enum": ["list", "get", "get_issue_types"],
-                                "description": "Operation to perform"
-                            },
-                            "project_key": {
-                                "type": "string",
-                                "description": "Project key (for get, get_issue_types) - e.g., 'PROJ', 'DEV'"
-                            }
-                        },
-                        "additionalProperties": False
-                    }
-                ),
-                types.Tool(
-                    name="jira_issues",
-                    description=(
-                        "Perform Jira issue operations: search, create, read, update, assign, transition, and manage comments.\n\n"
-                        "Core Operations:\n"
-                        "- search: Search issues using JQL (Jira Query Language)\n"
-                        "- read: Get full details of a specific issue\n"
-                        "- create: Create a new issue with fields\n"
-                        "- update: Update issue fields\n"
-                        "- assign: Assign issue to a user\n"
-                        "- transition: Move issue through workflow (e.g., 'To Do' → 'In Progress')\n"
-                        "- get_transitions: Get available transitions for an issue\n\n"
-                        "Comment Operations:\n"
-                        "- list_comments: Get all comments on an issue\n"
-                        "- add_comment: Add a new comment to an issue\n"
-                        "- update_comment: Update an existing comment\n"
-                        "- delete_comment: Delete a comment\n\n"
-                        "Attachment Operations:\n"
-                        "- list_attachments: Get all attachments on an issue\n"
-                        "- add_attachment: Upload a file attachment to an issue\n"
-                        "- delete_attachment: Remove an attachment\n\n"
-                        "Link Operations:\n"
-                        "- create_link: Link two issues with a relationship type\n"
-                        "- delete_link: Remove a link between issues\n"
-                        "- list_links: Get all links for an issue\n\n"
-                        "Subtask Operations:\n"
-                        "- create_subtask: Create a subtask under a parent issue\n"
-                        "- list_subtasks: Get all subtasks for an issue\n\n"
-                        "**Jira Markdown (Wiki Markup)**: ALL text content written to Jira (descriptions, comments) MUST use "
-                        "Jira wiki markup syntax — NOT standard Markdown, GitHub Markdown, or any other format.\n"
-                        "Key Jira wiki markup syntax:\n"
-                        "- Headings: h1. h2. h3. (not # ## ###)\n"
-                        "- Bold: *bold* (not **bold**)\n"
-                        "- Italic: _italic_ (not *italic*)\n"
-                        "- Bullet list: * item (not - item)\n"
-                        "- Numbered list: # item (not 1. item)\n"
-                        "- Code block: {code}...{code} or {code:python}...{code} (not ```)\n"
-                        "- Inline code: {{monospace}} (not `backticks`)\n"
-                        "- Links: [text|https://url] (not [text](url))\n"
-                        "- Horizontal rule: ---- (not ---)\n\n"
-                        "**Additional Fields**: For create/update operations, you can pass ANY Jira field as additional parameters:\n"
-                        "- Standard fields: duedate='2026-04-30', environment='Production', resolution='Fixed'\n"
-                        "- Custom fields: customfield_12001='value', customfield_24320='Yes'\n"
-                        "- Time tracking: timeoriginalestimate='3600', timeestimate='1800'\n"
-                        "Example: jira_issues(operation='update', issue_key='HIW-144', duedate='2026-04-30', environment='Staging')\n\n"
-                        "Use this tool for complete issue lifecycle management."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "required": ["operation"],
-                        "properties": {
-                            "operation": {
-                                "type": "string",
-                                "enum": [
-                                    "search", "read", "create", "update", "assign", "transition",
-                                    "get_transitions", "list_comments", "add_comment",
-                                    "update_comment", "delete_comment", "list_attachments",
-                                    "add_attachment", "delete_attachment", "create_link",
-                                    "delete_link", "list_links", "create_subtask", "list_subtasks"
-                                ],
-                                "description": "Operation to perform"
-                            },
-                            "jql": {
-                                "type": "string",
-                                "description": "JQL query string (for search) - e.g., 'project = ENG AND status = Open'"
-                            },
-                            "issue_key": {
-                                "type": "string",
-                                "description": "Issue key (for read, update, assign, transition, get_transitions) - e.g., 'ENG-123'"
-                            },
-                            "project_key": {
-                                "type": "string",
-                                "description": "Project key (for create) - e.g., 'ENG'"
-                            },
-                            "summary": {
-                                "type": "string",
-                                "description": "Issue summary/title (for create, update)"
-                            },
-                            "description": {
-                                "type": "string",
-                                "description": "Issue description (for create, update). MUST use Jira wiki markup syntax (e.g. h2. Heading, *bold*, _italic_, {code}...{code}, [text|url]) — NOT standard Markdown."
-                            },
-                            "issue_type": {
-                                "type": "string",
-                                "description": "Issue type name (for create) - e.g., 'Task', 'Bug', 'Story'"
-                            },
-                            "assignee": {
-                                "type": "string",
-                                "description": "Assignee account ID or username (for create, update, assign)"
-                            },
-                            "priority": {
-                                "type": "string",
-                                "description": "Priority name (for create, update) - e.g., 'High', 'Medium', 'Low'"
-                            },
-                            "labels": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "List of labels (for create, update)"
-                            },
-                            "transition": {
-                                "type": "string",
-                                "description": "Transition name or ID (for transition) - e.g., 'In Progress', 'Done'"
-                            },
-                            "comment": {
-                                "type": "string",
-                                "description": "Optional comment (for transition). MUST use Jira wiki markup syntax — NOT standard Markdown."
-                            },
-                            "max_results": {
-                                "type": "integer",
-                                "description": "Maximum number of results (for search). Default: 50"
-                            },
-                            "body": {
-                                "type": "string",
-                                "description": "Comment text body (for add_comment, update_comment). MUST use Jira wiki markup syntax (e.g. h2. Heading, *bold*, _italic_, {code}...{code}, [text|url]) — NOT standard Markdown."
-                            },
-                            "comment_id": {
-                                "type": "string",
-                                "description": "Comment ID (for update_comment, delete_comment)"
-                            },
-                            "filepath": {
-                                "type": "string",
-                                "description": "File path (for add_attachment) - local path to file to upload"
-                            },
-                            "attachment_id": {
-                                "type": "string",
-                                "description": "Attachment ID (for delete_attachment)"
-                            },
-                            "inward_issue": {
-                                "type": "string",
-                                "description": "Inward issue key (for create_link) - e.g., 'ENG-123'"
-                            },
-                            "outward_issue": {
-                                "type": "string",
-                                "description": "Outward issue key (for create_link) - e.g., 'ENG-456'"
-                            },
-                            "link_type": {
-                                "type": "string",
-                                "description": "Link type (for create_link) - e.g., 'Relates', 'Blocks', 'Duplicate'. Default: 'Relates'"
-                            },
-                            "link_id": {
-                                "type": "string",
-                                "description": "Link ID (for delete_link)"
-                            },
-                            "parent_key": {
-                                "type": "string",
-                                "description": "Parent issue key (for create_subtask) - e.g., 'ENG-123'"
-                            }
-                        },
-                        "additionalProperties": True
-                    }
-                )
-            ]
+            return _TOOLS
 
-        @self.app.call_tool()
+        # Arguments are checked against the precompiled _VALIDATORS in _dispatch_tool_call
+        @self.app.call_tool(validate_input=False)
         async def call_tool(name: str, arguments: Dict[str, Any]) -> List[types.TextContent]:
             """Handle MCP tool calls with parameter validation."""
             try:
@@ -322,12 +645,7 @@ class JiraMCPServer:
 
             except (ValueError, KeyError, OSError, RuntimeError) as tool_error:
                 logger.error("❌ Tool call error for %s: %s", name, tool_error)
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"❌ **Tool Error**: {str(tool_error)}"
-                    )
-                ]
+                return _text(f"❌ **Tool Error**: {str(tool_error)}")
 
         logger.info("✅ MCP tools registered successfully")
 
@@ -344,28 +662,19 @@ class JiraMCPServer:
         Returns:
             List of text content blocks with tool results
         """
-        # Handle jira_workspace tool
-        if name == "jira_workspace":
-            return await self._route_workspace_operation(arguments)
-
-        # Handle jira_projects tool
-        if name == "jira_projects":
-            return await self._route_projects_operation(arguments)
-
-        # Handle jira_issues tool
-        if name == "jira_issues":
-            return await self._route_issues_operation(arguments)
+        router = self._tool_routers.get(name)
+        if router is not None:
+            try:
+                _VALIDATORS[name].validate(arguments)
+            except jsonschema.ValidationError as validation_error:
+                return _text(f"❌ **Invalid Arguments**: {validation_error.message}")
+            return await router(arguments)
 
         # Unknown tool
-        return [
-            types.TextContent(
-                type="text",
-                text=(
-                    f"❌ **Unknown Tool**: '{name}'\n\n"
-                    "✅ **Available tools**: jira_workspace, jira_projects, jira_issues"
-                ),
-            )
-        ]
+        return _text(
+            f"❌ **Unknown Tool**: '{name}'\n\n"
+            "✅ **Available tools**: jira_workspace, jira_projects, jira_issues"
+        )
 
     async def _route_workspace_operation(
         self, arguments: Dict[str, Any]
@@ -373,129 +682,61 @@ class JiraMCPServer:
         """Route jira_workspace operations to appropriate handlers."""
         operation = arguments.get("operation")
         if not operation:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Parameter Error**: Missing required parameter 'operation'\n\n"
-                        "Available operations: hello, create_workspace_skeleton, add_workspace, list_workspaces, "
-                        "get_active_workspace, switch_workspace, validate_workspace, "
-                        "remove_workspace, get_current_user, search_users"
-                    )
-                )
-            ]
-
-        # Route to handlers
-        if operation == "hello":
-            return await self._handle_hello(arguments)
-        if operation == "create_workspace_skeleton":
-            return await self._handle_create_workspace_skeleton(arguments)
-        if operation == "add_workspace":
-            return await self._handle_add_workspace(arguments)
-        if operation == "list_workspaces":
-            return await self._handle_list_workspaces(arguments)
-        if operation == "get_active_workspace":
-            return await self._handle_get_active_workspace(arguments)
-        if operation == "switch_workspace":
-            return await self._handle_switch_workspace(arguments)
-        if operation == "validate_workspace":
-            return await self._handle_validate_workspace(arguments)
-        if operation == "remove_workspace":
-            return await self._handle_remove_workspace(arguments)
-        if operation == "get_current_user":
-            return await self._handle_get_current_user(arguments)
-        if operation == "search_users":
-            return await self._handle_search_users(arguments)
-
-        return [
-            types.TextContent(
-                type="text",
-                text=f"❌ **Invalid Operation**: '{operation}'\n\n"
-                     "Available operations: hello, create_workspace_skeleton, add_workspace, list_workspaces, "
-                     "get_active_workspace, switch_workspace, validate_workspace, "
-                     "remove_workspace, get_current_user, search_users"
-            )
-        ]
+            return _MISSING_WORKSPACE_OPERATION_MSG
+
+        handler = self._workspace_handlers.get(operation)
+        if handler is not None:
+            return await handler(arguments)
+
+        return _operation_error(operation, WORKSPACE_OPERATIONS)
 
     async def _handle_hello(self, _arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle hello operation - test connectivity."""
+        # Get active workspace
         try:
-            # Get active workspace
-            active_workspace = self.workspace_manager.get_active_workspace()
-
-            if not active_workspace:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=(
-                            "✅ **Jira MCP Server Status**\n\n"
-                            f"**Server**: {self.server_name} v{self.server_version}\n"
-                            "**Status**: Running\n"
-                            "**Workspaces**: No workspaces configured\n\n"
-                            "ℹ️ Add a workspace to get started:\n"
-                            "```\n"
-                            "jira_workspace(operation=\"add_workspace\", workspace_name=\"mycompany\", "
-                            "site_url=\"mycompany.atlassian.net\", email=\"your.email@company.com\", "
-                            "api_token=\"YOUR_API_TOKEN\")\n"
-                            "```"
-                        )
-                    )
-                ]
-
-            # Test Jira connection
-            try:
-                credentials = self.workspace_manager.get_workspace_credentials()
-                jira_client = JiraClient(
-                    credentials['site_url'],
-                    credentials['email'],
-                    credentials['api_token'],
-                    credentials['auth_type']
-                )
+            active_workspace, credentials = self.workspace_manager.get_active_workspace_with_credentials()
+        except WorkspaceError:
+            return _text(
+                "✅ **Jira MCP Server Status**\n\n"
+                f"**Server**: {self.server_name} v{self.server_version}\n"
+                "**Status**: Running\n"
+                "**Workspaces**: No workspaces configured\n\n"
+                "ℹ️ Add a workspace to get started:\n"
+                "```\n"
+                "jira_workspace(operation=\"add_workspace\", workspace_name=\"mycompany\", "
+                "site_url=\"mycompany.atlassian.net\", email=\"your.email@company.com\", "
+                "api_token=\"YOUR_API_TOKEN\")\n"
+                "```"
+            )
 
-                server_info = jira_client.test_connection()
-
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=(
-                            "✅ **Jira MCP Server Status**\n\n"
-                            f"**Server**: {self.server_name} v{self.server_version}\n"
-                            "**Status**: Running\n\n"
-                            f"**Active Workspace**: {active_workspace['name']}\n"
-                            f"**Jira Site**: {active_workspace['site_url']}\n"
-                            f"**Jira Server**: {server_info['server_title']}\n"
-                            f"**Jira Version**: {server_info['version']}\n"
-                            f"**Email**: {active_workspace['email']}\n\n"
-                            "✅ Jira API connection: OK"
-                        )
-                    )
-                ]
-
-            except JiraClientError as e:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=(
-                            "⚠️ **Jira MCP Server Status**\n\n"
-                            f"**Server**: {self.server_name} v{self.server_version}\n"
-                            "**Status**: Running\n\n"
-                            f"**Active Workspace**: {active_workspace['name']}\n"
-                            f"**Jira Site**: {active_workspace['site_url']}\n"
-                            f"**Email**: {active_workspace['email']}\n\n"
-                            f"❌ Jira API connection failed: {str(e)}\n\n"
-                            "Check your credentials and network connectivity."
-                        )
-                    )
-                ]
+        # Test Jira connection
+        jira_client = self._get_client(credentials)
+        ok, outcome = await asyncio.to_thread(jira_client.test_connection_safe)
+
+        if not ok:
+            return _text(
+                "⚠️ **Jira MCP Server Status**\n\n"
+                f"**Server**: {self.server_name} v{self.server_version}\n"
+                "**Status**: Running\n\n"
+                f"**Active Workspace**: {active_workspace['name']}\n"
+                f"**Jira Site**: {active_workspace['site_url']}\n"
+                f"**Email**: {active_workspace['email']}\n\n"
+                f"❌ Jira API connection failed: {outcome}\n\n"
+                "Check your credentials and network connectivity."
+            )
 
-        except Exception as error:
-            logger.error("Error in hello operation: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+        server_info = cast(Dict[str, Any], outcome)
+        return _text(
+            "✅ **Jira MCP Server Status**\n\n"
+            f"**Server**: {self.server_name} v{self.server_version}\n"
+            "**Status**: Running\n\n"
+            f"**Active Workspace**: {active_workspace['name']}\n"
+            f"**Jira Site**: {active_workspace['site_url']}\n"
+            f"**Jira Server**: {server_info['server_title']}\n"
+            f"**Jira Version**: {server_info['version']}\n"
+            f"**Email**: {active_workspace['email']}\n\n"
+            "✅ Jira API connection: OK"
+        )
 
     async def _handle_create_workspace_skeleton(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle create_workspace_skeleton operation - create skeleton config file."""
@@ -505,65 +746,32 @@ class JiraMCPServer:
 
             # Validate required parameters
             if not workspace_name:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=(
-                            "❌ **Missing Required Parameters**\n\n"
-                            "Required: workspace_name\n"
-                            "Optional: auth_type ('cloud' or 'pat', default: 'cloud')\n\n"
-                            "Example:\n"
-                            "```\n"
-                            "jira_workspace(operation=\"create_workspace_skeleton\", "
-                            "workspace_name=\"example\", "
-                            "auth_type=\"pat\")\n"
-                            "```"
-                        )
-                    )
-                ]
+                return _MISSING_SKELETON_PARAMS_MSG
 
             # Create skeleton configuration
             result = self.workspace_manager.create_workspace_skeleton(
                 workspace_name, auth_type
             )
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        f"📝 **Skeleton Configuration Created**\n\n"
-                        f"**Workspace**: {result['workspace_name']}\n"
-                        f"**Auth Type**: {result['auth_type']}\n"
-                        f"**Config File**: `{result['config_file']}`\n\n"
-                        "**Next Steps**:\n"
-                        "1. Edit the configuration file with your credentials:\n"
-                        f"   ```\n"
-                        f"   {result['config_file']}\n"
-                        f"   ```\n"
-                        "2. Replace placeholder values with your actual credentials\n"
-                        "3. Remove the `_instructions` section from the file\n"
-                        "4. The workspace will be automatically loaded on next server restart\n\n"
-                        "**Security**: The file has been created with 600 permissions (owner read/write only)."
-                    )
-                )
-            ]
+            return _text(
+                f"📝 **Skeleton Configuration Created**\n\n"
+                f"**Workspace**: {result['workspace_name']}\n"
+                f"**Auth Type**: {result['auth_type']}\n"
+                f"**Config File**: `{result['config_file']}`\n\n"
+                "**Next Steps**:\n"
+                "1. Edit the configuration file with your credentials:\n"
+                f"   ```\n"
+                f"   {result['config_file']}\n"
+                f"   ```\n"
+                "2. Replace placeholder values with your actual credentials\n"
+                "3. Remove the `_instructions` section from the file\n"
+                "4. The workspace will be automatically loaded on next server restart\n\n"
+                "**Security**: The file has been created with 600 permissions (owner read/write only)."
+            )
 
         except WorkspaceError as e:
             logger.error("Workspace error in create_workspace_skeleton: %s", e)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Workspace Error**: {str(e)}"
-                )
-            ]
-        except Exception as error:
-            logger.error("Error in create_workspace_skeleton operation: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Workspace Error**: {str(e)}")
 
     async def _handle_add_workspace(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle add_workspace operation."""
@@ -576,237 +784,123 @@ class JiraMCPServer:
 
             # Validate required parameters
             if not all([workspace_name, site_url, email, api_token]):
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=(
-                            "❌ **Missing Required Parameters**\n\n"
-                            "Required: workspace_name, site_url, email, api_token\n"
-                            "Optional: auth_type ('cloud' or 'pat', default: 'cloud')\n\n"
-                            "Example (Jira Cloud):\n"
-                            "```\n"
-                            "jira_workspace(operation=\"add_workspace\", "
-                            "workspace_name=\"mycompany\", "
-                            "site_url=\"mycompany.atlassian.net\", "
-                            "email=\"your.email@company.com\", "
-                            "api_token=\"YOUR_API_TOKEN\")\n"
-                            "```\n\n"
-                            "Example (Jira Server/Data Center with PAT):\n"
-                            "```\n"
-                            "jira_workspace(operation=\"add_workspace\", "
-                            "workspace_name=\"mycompany\", "
-                            "site_url=\"jira.company.com\", "
-                            "email=\"username\", "
-                            "api_token=\"YOUR_PERSONAL_ACCESS_TOKEN\", "
-                            "auth_type=\"pat\")\n"
-                            "```\n\n"
-                            "Get your API token from: https://id.atlassian.com/manage-profile/security/api-tokens"
-                        )
-                    )
-                ]
+                return _MISSING_ADD_WORKSPACE_PARAMS_MSG
 
             # Add workspace
             result = self.workspace_manager.add_workspace(
                 workspace_name, site_url, email, api_token, auth_type
             )
+            # Credentials for this site may have changed; don't keep serving old clients
+            self._drop_clients(result['site_url'])
+
+            # Bulk setups can save now and validate later, skipping the extra round-trip
+            if arguments.get("skip_validation", False):
+                return _text(
+                    f"✅ **Workspace '{workspace_name}' Added**\n\n"
+                    f"**Site URL**: {result['site_url']}\n"
+                    f"**Email**: {result['email']}\n"
+                    f"**Active**: {'Yes' if result['active'] else 'No'}\n\n"
+                    "**Jira Connection**: not tested (skip_validation)\n\n"
+                    "Use validate_workspace to test the credentials."
+                )
 
             # Test connection
-            try:
-                jira_client = JiraClient(result['site_url'], result['email'], api_token, auth_type)
-                server_info = jira_client.test_connection()
-
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=(
-                            f"✅ **Workspace '{workspace_name}' Added Successfully**\n\n"
-                            f"**Site URL**: {result['site_url']}\n"
-                            f"**Email**: {result['email']}\n"
-                            f"**Active**: {'Yes' if result['active'] else 'No'}\n\n"
-                            f"**Jira Connection**: ✅ OK\n"
-                            f"**Server**: {server_info['server_title']}\n"
-                            f"**Version**: {server_info['version']}\n\n"
-                            "You can now use Jira operations with this workspace."
-                        )
-                    )
-                ]
-
-            except JiraClientError as e:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=(
-                            f"⚠️ **Workspace '{workspace_name}' Added (with warnings)**\n\n"
-                            f"**Site URL**: {result['site_url']}\n"
-                            f"**Email**: {result['email']}\n"
-                            f"**Active**: {'Yes' if result['active'] else 'No'}\n\n"
-                            f"⚠️ **Jira Connection Test Failed**: {str(e)}\n\n"
-                            "The workspace was saved, but the connection test failed. "
-                            "Please verify your credentials and network connectivity."
-                        )
-                    )
-                ]
+            jira_client = self._get_client({
+                'site_url': result['site_url'],
+                'email': result['email'],
+                'api_token': api_token,
+                'auth_type': auth_type
+            })
+            ok, outcome = await asyncio.to_thread(jira_client.test_connection_safe)
+
+            if not ok:
+                return _text(
+                    f"⚠️ **Workspace '{workspace_name}' Added (with warnings)**\n\n"
+                    f"**Site URL**: {result['site_url']}\n"
+                    f"**Email**: {result['email']}\n"
+                    f"**Active**: {'Yes' if result['active'] else 'No'}\n\n"
+                    f"⚠️ **Jira Connection Test Failed**: {outcome}\n\n"
+                    "The workspace was saved, but the connection test failed. "
+                    "Please verify your credentials and network connectivity."
+                )
+
+            server_info = cast(Dict[str, Any], outcome)
+            return _text(
+                f"✅ **Workspace '{workspace_name}' Added Successfully**\n\n"
+                f"**Site URL**: {result['site_url']}\n"
+                f"**Email**: {result['email']}\n"
+                f"**Active**: {'Yes' if result['active'] else 'No'}\n\n"
+                f"**Jira Connection**: ✅ OK\n"
+                f"**Server**: {server_info['server_title']}\n"
+                f"**Version**: {server_info['version']}\n\n"
+                "You can now use Jira operations with this workspace."
+            )
 
         except WorkspaceError as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Workspace Error**: {str(error)}"
-                )
-            ]
-        except Exception as error:
-            logger.error("Error adding workspace: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Workspace Error**: {str(error)}")
 
     async def _handle_list_workspaces(self, _arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle list_workspaces operation."""
-        try:
-            workspaces = self.workspace_manager.list_workspaces()
-
-            if not workspaces:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=(
-                            "ℹ️ **No Workspaces Configured**\n\n"
-                            "Add a workspace to get started:\n"
-                            "```\n"
-                            "jira_workspace(operation=\"add_workspace\", workspace_name=\"mycompany\", "
-                            "site_url=\"mycompany.atlassian.net\", email=\"your.email@company.com\", "
-                            "api_token=\"YOUR_API_TOKEN\")\n"
-                            "```"
-                        )
-                    )
-                ]
-
-            # Format workspace list
-            result_lines = ["📋 **Configured Jira Workspaces**\n"]
-
-            for workspace in workspaces:
-                status_icon = "✓" if workspace['active'] else "○"
-                active_label = " (ACTIVE)" if workspace['active'] else ""
-
-                result_lines.append(f"{status_icon} **{workspace['name']}**{active_label}")
-                result_lines.append(f"  └─ Site: {workspace['site_url']}")
-                result_lines.append(f"  └─ Email: {workspace['email']}")
-
-                if workspace.get('created'):
-                    result_lines.append(f"  └─ Created: {workspace['created']}")
+        workspaces = self.workspace_manager.list_workspaces()
 
-                result_lines.append("")
+        if not workspaces:
+            return _NO_WORKSPACES_MSG
 
-            result_lines.append(f"**Total workspaces**: {len(workspaces)}")
+        # Format workspace list
+        result_lines = ["📋 **Configured Jira Workspaces**\n"]
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text="\n".join(result_lines)
-                )
-            ]
+        # One string per workspace entry (trailing newline leaves the blank separator line)
+        for workspace in workspaces:
+            status_icon = "✓" if workspace['active'] else "○"
+            active_label = " (ACTIVE)" if workspace['active'] else ""
+            created = f"\n  └─ Created: {workspace['created']}" if workspace.get('created') else ""
 
-        except Exception as error:
-            logger.error("Error listing workspaces: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            result_lines.append(
+                f"{status_icon} **{workspace['name']}**{active_label}\n"
+                f"  └─ Site: {workspace['site_url']}\n"
+                f"  └─ Email: {workspace['email']}{created}\n"
+            )
+
+        result_lines.append(f"**Total workspaces**: {len(workspaces)}")
+
+        return _text("\n".join(result_lines))
 
     async def _handle_get_active_workspace(self, _arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle get_active_workspace operation."""
-        try:
-            active_workspace = self.workspace_manager.get_active_workspace()
-
-            if not active_workspace:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=(
-                            "⚠️ **No Active Workspace**\n\n"
-                            "No workspace is currently active. Add a workspace or switch to an existing one:\n"
-                            "```\n"
-                            "jira_workspace(operation=\"list_workspaces\")\n"
-                            "jira_workspace(operation=\"switch_workspace\", workspace_name=\"<name>\")\n"
-                            "```"
-                        )
-                    )
-                ]
+        active_workspace = self.workspace_manager.get_active_workspace()
 
-            result = (
-                f"✓ **Active Workspace**: {active_workspace['name']}\n\n"
-                f"**Site URL**: {active_workspace['site_url']}\n"
-                f"**Email**: {active_workspace['email']}\n"
-            )
+        if not active_workspace:
+            return _NO_ACTIVE_WORKSPACE_MSG
 
-            if active_workspace.get('created'):
-                result += f"**Created**: {active_workspace['created']}\n"
+        result = (
+            f"✓ **Active Workspace**: {active_workspace['name']}\n\n"
+            f"**Site URL**: {active_workspace['site_url']}\n"
+            f"**Email**: {active_workspace['email']}\n"
+        )
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text=result
-                )
-            ]
+        if active_workspace.get('created'):
+            result += f"**Created**: {active_workspace['created']}\n"
 
-        except Exception as error:
-            logger.error("Error getting active workspace: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+        return _text(result)
 
     async def _handle_switch_workspace(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle switch_workspace operation."""
         workspace_name = arguments.get("workspace_name")
 
         if not workspace_name:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameter**: workspace_name\n\n"
-                        "Example: jira_workspace(operation=\"switch_workspace\", workspace_name=\"mycompany\")"
-                    )
-                )
-            ]
+            return _MISSING_SWITCH_WORKSPACE_NAME_MSG
 
         try:
             result = self.workspace_manager.switch_workspace(workspace_name)
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        f"✅ **{result['message']}**\n\n"
-                        f"**Workspace**: {result['workspace_name']}\n"
-                        f"**Site URL**: {result.get('site_url', 'N/A')}"
-                    )
-                )
-            ]
+            return _text(
+                f"✅ **{result['message']}**\n\n"
+                f"**Workspace**: {result['workspace_name']}\n"
+                f"**Site URL**: {result.get('site_url', 'N/A')}"
+            )
 
         except WorkspaceError as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Workspace Error**: {str(error)}"
-                )
-            ]
-        except Exception as error:
-            logger.error("Error switching workspace: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Workspace Error**: {str(error)}")
 
     async def _handle_validate_workspace(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle validate_workspace operation."""
@@ -817,138 +911,69 @@ class JiraMCPServer:
             if workspace_name:
                 credentials = self.workspace_manager.get_workspace_credentials(workspace_name)
             else:
-                credentials = self.workspace_manager.get_workspace_credentials()
-                active = self.workspace_manager.get_active_workspace()
-                workspace_name = active['name'] if active else "Unknown"
+                active, credentials = self.workspace_manager.get_active_workspace_with_credentials()
+                workspace_name = active['name']
 
             # Test connection
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
+            jira_client = self._get_client(credentials)
+
+            # Independent requests: run them side by side, off the event loop
+            server_info, user_info = await asyncio.gather(
+                asyncio.to_thread(jira_client.test_connection),
+                asyncio.to_thread(jira_client.get_current_user)
             )
 
-            server_info = jira_client.test_connection()
-            user_info = jira_client.get_current_user()
-
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        f"✅ **Workspace '{workspace_name}' Validation Successful**\n\n"
-                        f"**Site**: {credentials['site_url']}\n"
-                        f"**Server**: {server_info['server_title']}\n"
-                        f"**Version**: {server_info['version']}\n\n"
-                        f"**Authenticated User**: {user_info['display_name']}\n"
-                        f"**Email**: {user_info['email']}\n"
-                        f"**Account ID**: {user_info['account_id']}\n"
-                        f"**Status**: {'Active' if user_info['active'] else 'Inactive'}\n\n"
-                        "✅ All connectivity tests passed"
-                    )
-                )
-            ]
+            return _text(
+                f"✅ **Workspace '{workspace_name}' Validation Successful**\n\n"
+                f"**Site**: {credentials['site_url']}\n"
+                f"**Server**: {server_info['server_title']}\n"
+                f"**Version**: {server_info['version']}\n\n"
+                f"**Authenticated User**: {user_info['display_name']}\n"
+                f"**Email**: {user_info['email']}\n"
+                f"**Account ID**: {user_info['account_id']}\n"
+                f"**Status**: {'Active' if user_info['active'] else 'Inactive'}\n\n"
+                "✅ All connectivity tests passed"
+            )
 
         except (WorkspaceError, JiraClientError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Validation Failed**: {str(error)}"
-                )
-            ]
-        except Exception as error:
-            logger.error("Error validating workspace: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Validation Failed**: {str(error)}")
 
     async def _handle_remove_workspace(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle remove_workspace operation."""
         workspace_name = arguments.get("workspace_name")
 
         if not workspace_name:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameter**: workspace_name\n\n"
-                        "Example: jira_workspace(operation=\"remove_workspace\", workspace_name=\"mycompany\")"
-                    )
-                )
-            ]
+            return _MISSING_REMOVE_WORKSPACE_NAME_MSG
 
         try:
+            credentials = self.workspace_manager.get_workspace_credentials(workspace_name)
             result = self.workspace_manager.remove_workspace(workspace_name)
+            self._drop_clients(credentials['site_url'])
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"✅ **{result['message']}**"
-                )
-            ]
+            return _text(f"✅ **{result['message']}**")
 
         except WorkspaceError as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Workspace Error**: {str(error)}"
-                )
-            ]
-        except Exception as error:
-            logger.error("Error removing workspace: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Workspace Error**: {str(error)}")
 
     async def _handle_get_current_user(self, _arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle get_current_user operation."""
         try:
-            credentials = self.workspace_manager.get_workspace_credentials()
-            active = self.workspace_manager.get_active_workspace()
+            active, credentials = self.workspace_manager.get_active_workspace_with_credentials()
 
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
+            jira_client = self._get_client(credentials)
 
-            user_info = jira_client.get_current_user()
-
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        f"👤 **Current User** ({active['name'] if active else 'Unknown'})\n\n"
-                        f"**Name**: {user_info['display_name']}\n"
-                        f"**Email**: {user_info['email']}\n"
-                        f"**Account ID**: {user_info['account_id']}\n"
-                        f"**Status**: {'Active' if user_info['active'] else 'Inactive'}"
-                    )
-                )
-            ]
+            user_info = await asyncio.to_thread(jira_client.get_current_user)
+
+            return _text(
+                f"👤 **Current User** ({active['name']})\n\n"
+                f"**Name**: {user_info['display_name']}\n"
+                f"**Email**: {user_info['email']}\n"
+                f"**Account ID**: {user_info['account_id']}\n"
+                f"**Status**: {'Active' if user_info['active'] else 'Inactive'}"
+            )
 
         except (WorkspaceError, JiraClientError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
-        except Exception as error:
-            logger.error("Error getting current user: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     async def _handle_search_users(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle search_users operation."""
@@ -956,70 +981,37 @@ class JiraMCPServer:
         max_results = arguments.get("max_results", 50)
 
         if not query:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameter**: query\n\n"
-                        "Example: jira_workspace(operation=\"search_users\", query=\"john\")"
-                    )
-                )
-            ]
+            return _MISSING_QUERY_MSG
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
 
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
+            jira_client = self._get_client(credentials)
 
-            users = jira_client.search_users(query, max_results)
+            users = await asyncio.to_thread(jira_client.search_users, query, max_results)
 
             if not users:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"ℹ️ **No users found** matching '{query}'"
-                    )
-                ]
+                return _text(f"ℹ️ **No users found** matching '{query}'")
 
             # Format user list
             result_lines = [f"👥 **User Search Results** (query: '{query}')\n"]
 
-            for user in users[:max_results]:
+            # One string per user entry (trailing newline leaves the blank separator line);
+            # the API already capped the result at max_results
+            for user in users:
                 status = "✓" if user['active'] else "○"
-                result_lines.append(f"{status} **{user['display_name']}**")
-                result_lines.append(f"  └─ Email: {user['email']}")
-                result_lines.append(f"  └─ Account ID: {user['account_id']}")
-                result_lines.append("")
+                result_lines.append(
+                    f"{status} **{user['display_name']}**\n"
+                    f"  └─ Email: {user['email']}\n"
+                    f"  └─ Account ID: {user['account_id']}\n"
+                )
 
             result_lines.append(f"**Total results**: {len(users)}")
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text="\n".join(result_lines)
-                )
-            ]
+            return _text("\n".join(result_lines))
 
         except (WorkspaceError, JiraClientError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
-        except Exception as error:
-            logger.error("Error searching users: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     async def _route_projects_operation(
         self, arguments: Dict[str, Any]
@@ -1027,57 +1019,28 @@ class JiraMCPServer:
         """Route jira_projects operations to appropriate handlers."""
         operation = arguments.get("operation")
         if not operation:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Parameter Error**: Missing required parameter 'operation'\n\n"
-                        "Available operations: list, get, get_issue_types"
-                    )
-                )
-            ]
-
-        # Route to handlers
-        if operation == "list":
-            return await self._handle_list_projects(arguments)
-        if operation == "get":
-            return await self._handle_get_project(arguments)
-        if operation == "get_issue_types":
-            return await self._handle_get_issue_types(arguments)
-
-        return [
-            types.TextContent(
-                type="text",
-                text=f"❌ **Invalid Operation**: '{operation}'\n\n"
-                     "Available operations: list, get, get_issue_types"
-            )
-        ]
+            return _MISSING_PROJECTS_OPERATION_MSG
+
+        handler = self._projects_handlers.get(operation)
+        if handler is not None:
+            return await handler(arguments)
+
+        return _operation_error(operation, PROJECTS_OPERATIONS)
 
     async def _handle_list_projects(self, _arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle list projects operation."""
         try:
-            credentials = self.workspace_manager.get_workspace_credentials()
-            active = self.workspace_manager.get_active_workspace()
+            active, credentials = self.workspace_manager.get_active_workspace_with_credentials()
 
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
+            jira_client = self._get_client(credentials)
 
-            projects = jira_client.get_projects()
+            projects = await asyncio.to_thread(jira_client.get_projects)
 
             if not projects:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text="ℹ️ **No projects found**\n\nYou may not have access to any projects."
-                    )
-                ]
+                return _text("ℹ️ **No projects found**\n\nYou may not have access to any projects.")
 
             # Format project list
-            result_lines = [f"📋 **Projects** ({active['name'] if active else 'Unknown'})\n"]
+            result_lines = [f"📋 **Projects** ({active['name']})\n"]
 
             for project in projects:
                 result_lines.append(f"**{project['key']}** - {project['name']}")
@@ -1087,56 +1050,31 @@ class JiraMCPServer:
 
             result_lines.append(f"**Total projects**: {len(projects)}")
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text="\n".join(result_lines)
-                )
-            ]
+            return _text("\n".join(result_lines))
 
         except (WorkspaceError, JiraClientError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error listing projects: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     async def _handle_get_project(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle get project details operation."""
         project_key = arguments.get("project_key")
 
         if not project_key:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameter**: project_key\n\n"
-                        "Example: jira_projects(operation=\"get\", project_key=\"PROJ\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameter**: project_key\n\n"
+                "Example: jira_projects(operation=\"get\", project_key=\"PROJ\")"
+            )
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
 
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
+            jira_client = self._get_client(credentials)
 
             # Get project details
-            project = jira_client.jira.project(project_key)
+            project = await asyncio.to_thread(lambda: jira_client.jira.project(project_key))
 
             result = (
                 f"📊 **Project: {project.key}**\n\n"
@@ -1147,65 +1085,35 @@ class JiraMCPServer:
                 f"**Lead**: {getattr(project.lead, 'displayName', 'Unknown') if hasattr(project, 'lead') else 'Unknown'}\n"
             )
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text=result
-                )
-            ]
+            return _text(result)
 
         except (WorkspaceError, JiraClientError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error getting project details: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: Project '{project_key}' not found or access denied"
-                )
-            ]
+            return _text(f"❌ **Error**: Project '{project_key}' not found or access denied")
 
     async def _handle_get_issue_types(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle get issue types for project operation."""
         project_key = arguments.get("project_key")
 
         if not project_key:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameter**: project_key\n\n"
-                        "Example: jira_projects(operation=\"get_issue_types\", project_key=\"PROJ\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameter**: project_key\n\n"
+                "Example: jira_projects(operation=\"get_issue_types\", project_key=\"PROJ\")"
+            )
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
 
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
+            jira_client = self._get_client(credentials)
 
             # Get project to access issue types
-            project = jira_client.jira.project(project_key)
+            project = await asyncio.to_thread(lambda: jira_client.jira.project(project_key))
             issue_types = project.issueTypes
 
             if not issue_types:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"ℹ️ **No issue types found** for project '{project_key}'"
-                    )
-                ]
+                return _text(f"ℹ️ **No issue types found** for project '{project_key}'")
 
             # Format issue types list
             result_lines = [f"🎫 **Issue Types for {project_key}**\n"]
@@ -1219,172 +1127,75 @@ class JiraMCPServer:
 
             result_lines.append(f"**Total issue types**: {len(issue_types)}")
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text="\n".join(result_lines)
-                )
-            ]
+            return _text("\n".join(result_lines))
 
         except (WorkspaceError, JiraClientError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error getting issue types: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: Project '{project_key}' not found or access denied"
-                )
-            ]
+            return _text(f"❌ **Error**: Project '{project_key}' not found or access denied")
 
-    async def _route_issues_operation(  # pylint: disable=too-many-branches
+    async def _route_issues_operation(
         self, arguments: Dict[str, Any]
     ) -> List[types.TextContent]:
         """Route jira_issues operations to appropriate handlers."""
         operation = arguments.get("operation")
         if not operation:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Parameter Error**: Missing required parameter 'operation'\n\n"
-                        "Available operations: search, read, create, update, assign, transition, get_transitions, "
-                        "list_comments, add_comment, update_comment, delete_comment, "
-                        "list_attachments, add_attachment, delete_attachment, "
-                        "create_link, delete_link, list_links, create_subtask, list_subtasks"
-                    )
-                )
-            ]
-
-        # Route to handlers
-        if operation == "search":
-            return await self._handle_search_issues(arguments)
-        if operation == "read":
-            return await self._handle_read_issue(arguments)
-        if operation == "create":
-            return await self._handle_create_issue(arguments)
-        if operation == "update":
-            return await self._handle_update_issue(arguments)
-        if operation == "assign":
-            return await self._handle_assign_issue(arguments)
-        if operation == "transition":
-            return await self._handle_transition_issue(arguments)
-        if operation == "get_transitions":
-            return await self._handle_get_transitions(arguments)
-        if operation == "list_comments":
-            return await self._handle_list_comments(arguments)
-        if operation == "add_comment":
-            return await self._handle_add_comment(arguments)
-        if operation == "update_comment":
-            return await self._handle_update_comment(arguments)
-        if operation == "delete_comment":
-            return await self._handle_delete_comment(arguments)
-        if operation == "list_attachments":
-            return await self._handle_list_attachments(arguments)
-        if operation == "add_attachment":
-            return await self._handle_add_attachment(arguments)
-        if operation == "delete_attachment":
-            return await self._handle_delete_attachment(arguments)
-        if operation == "create_link":
-            return await self._handle_create_link(arguments)
-        if operation == "delete_link":
-            return await self._handle_delete_link(arguments)
-        if operation == "list_links":
-            return await self._handle_list_links(arguments)
-        if operation == "create_subtask":
-            return await self._handle_create_subtask(arguments)
-        if operation == "list_subtasks":
-            return await self._handle_list_subtasks(arguments)
-
-        return [
-            types.TextContent(
-                type="text",
-                text=f"❌ **Invalid Operation**: '{operation}'\n\n"
-                     "Available operations: search, read, create, update, assign, transition, get_transitions, "
-                     "list_comments, add_comment, update_comment, delete_comment, "
-                     "list_attachments, add_attachment, delete_attachment, "
-                     "create_link, delete_link, list_links, create_subtask, list_subtasks"
-            )
-        ]
+            return _MISSING_ISSUES_OPERATION_MSG
+
+        handler = self._issues_handlers.get(operation)
+        if handler is not None:
+            return await handler(arguments)
+
+        return _operation_error(operation, ISSUES_OPERATIONS)
 
     async def _handle_search_issues(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle search issues operation."""
         jql = arguments.get("jql")
         if not jql:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameter**: jql\n\n"
-                        "Example: jira_issues(operation=\"search\", jql=\"project = ENG AND status = Open\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameter**: jql\n\n"
+                "Example: jira_issues(operation=\"search\", jql=\"project = ENG AND status = Open\")"
+            )
 
         max_results = arguments.get("max_results", 50)
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
+            issue_manager = await self._get_issue_manager(credentials)
 
-            issue_manager = IssueManager(jira_client.jira, credentials['site_url'])
-            issues = issue_manager.search_issues(jql, max_results)
+            # Render issues as pages arrive rather than collecting them first
+            result_lines = [f"🔍 **Search Results**\n\nJQL: `{jql}`\n"]
 
-            if not issues:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"ℹ️ **No issues found**\n\nJQL: `{jql}`"
-                    )
-                ]
+            def render() -> int:
+                # Runs in a worker thread: each page is fetched when the loop reaches it
+                total = 0
+                for issue in issue_manager.iter_issues(jql, max_results=max_results):
+                    total += 1
+                    status_emoji = "✓" if issue['status'] == "Done" else "○"
+                    result_lines.append(f"{status_emoji} **{issue['key']}**: {issue['summary']}")
+                    result_lines.append(f"  └─ Status: {issue['status']}")
+                    result_lines.append(f"  └─ Type: {issue['issue_type']}")
+                    if issue['assignee']:
+                        result_lines.append(f"  └─ Assignee: {issue['assignee']['name']}")
+                    result_lines.append(f"  └─ URL: {issue['url']}")
+                    result_lines.append("")
+                return total
 
-            # Format issue list
-            result_lines = [f"🔍 **Search Results**\n\nJQL: `{jql}`\n"]
+            total = await asyncio.to_thread(render)
 
-            for issue in issues:
-                status_emoji = "✓" if issue['status'] == "Done" else "○"
-                result_lines.append(f"{status_emoji} **{issue['key']}**: {issue['summary']}")
-                result_lines.append(f"  └─ Status: {issue['status']}")
-                result_lines.append(f"  └─ Type: {issue['issue_type']}")
-                if issue['assignee']:
-                    result_lines.append(f"  └─ Assignee: {issue['assignee']['name']}")
-                result_lines.append(f"  └─ URL: {issue['url']}")
-                result_lines.append("")
+            if not total:
+                return _text(f"ℹ️ **No issues found**\n\nJQL: `{jql}`")
 
-            result_lines.append(f"**Total results**: {len(issues)}")
+            result_lines.append(f"**Total results**: {total}")
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text="\n".join(result_lines)
-                )
-            ]
+            return _text("\n".join(result_lines))
 
         except (WorkspaceError, JiraClientError, IssueManagerError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error searching issues: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     def _format_field_display_name(self, field_name: str) -> str:
         """
@@ -1440,27 +1251,15 @@ class JiraMCPServer:
         """Handle read issue operation."""
         issue_key = arguments.get("issue_key")
         if not issue_key:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameter**: issue_key\n\n"
-                        "Example: jira_issues(operation=\"read\", issue_key=\"ENG-123\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameter**: issue_key\n\n"
+                "Example: jira_issues(operation=\"read\", issue_key=\"ENG-123\")"
+            )
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
-
-            issue_manager = IssueManager(jira_client.jira, credentials['site_url'])
-            issue = issue_manager.get_issue(issue_key)
+            issue_manager = await self._get_issue_manager(credentials)
+            issue = await asyncio.to_thread(issue_manager.get_issue, issue_key)
 
             # Format basic issue details
             result = (
@@ -1490,28 +1289,13 @@ class JiraMCPServer:
 
             result += f"\n**URL**: {issue['url']}"
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text=result
-                )
-            ]
+            return _text(result)
 
         except (WorkspaceError, JiraClientError, IssueManagerError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error reading issue: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     async def _handle_create_issue(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle create issue operation."""
@@ -1520,27 +1304,15 @@ class JiraMCPServer:
         issue_type = arguments.get("issue_type")
 
         if not project_key or not summary or not issue_type:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameters**: project_key, summary, issue_type\n\n"
-                        "Example: jira_issues(operation=\"create\", project_key=\"ENG\", "
-                        "summary=\"Fix bug\", issue_type=\"Bug\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameters**: project_key, summary, issue_type\n\n"
+                "Example: jira_issues(operation=\"create\", project_key=\"ENG\", "
+                "summary=\"Fix bug\", issue_type=\"Bug\")"
+            )
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
-
-            issue_manager = IssueManager(jira_client.jira, credentials['site_url'])
+            issue_manager = await self._get_issue_manager(credentials)
 
             # Extract optional fields
             description = arguments.get("description")
@@ -1552,7 +1324,8 @@ class JiraMCPServer:
             known_fields = {'operation', 'project_key', 'summary', 'issue_type', 'description', 'assignee', 'priority', 'labels'}
             additional_fields = {k: v for k, v in arguments.items() if k not in known_fields}
 
-            issue = issue_manager.create_issue(
+            issue = await asyncio.to_thread(
+                issue_manager.create_issue,
                 project_key=project_key,
                 summary=summary,
                 issue_type=issue_type,
@@ -1572,54 +1345,27 @@ class JiraMCPServer:
                 f"**URL**: {issue['url']}"
             )
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text=result
-                )
-            ]
+            return _text(result)
 
         except (WorkspaceError, JiraClientError, IssueManagerError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error creating issue: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     async def _handle_update_issue(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle update issue operation."""
         issue_key = arguments.get("issue_key")
         if not issue_key:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameter**: issue_key\n\n"
-                        "Example: jira_issues(operation=\"update\", issue_key=\"ENG-123\", "
-                        "summary=\"Updated summary\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameter**: issue_key\n\n"
+                "Example: jira_issues(operation=\"update\", issue_key=\"ENG-123\", "
+                "summary=\"Updated summary\")"
+            )
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
-
-            issue_manager = IssueManager(jira_client.jira, credentials['site_url'])
+            issue_manager = await self._get_issue_manager(credentials)
 
             # Extract optional update fields
             summary = arguments.get("summary")
@@ -1632,7 +1378,8 @@ class JiraMCPServer:
             known_fields = {'operation', 'issue_key', 'summary', 'description', 'assignee', 'priority', 'labels'}
             additional_fields = {k: v for k, v in arguments.items() if k not in known_fields}
 
-            issue = issue_manager.update_issue(
+            issue = await asyncio.to_thread(
+                issue_manager.update_issue,
                 issue_key=issue_key,
                 summary=summary,
                 description=description,
@@ -1649,28 +1396,13 @@ class JiraMCPServer:
                 f"**URL**: {issue['url']}"
             )
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text=result
-                )
-            ]
+            return _text(result)
 
         except (WorkspaceError, JiraClientError, IssueManagerError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error updating issue: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     async def _handle_assign_issue(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle assign issue operation."""
@@ -1678,28 +1410,16 @@ class JiraMCPServer:
         assignee = arguments.get("assignee")
 
         if not issue_key or not assignee:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameters**: issue_key, assignee\n\n"
-                        "Example: jira_issues(operation=\"assign\", issue_key=\"ENG-123\", "
-                        "assignee=\"user@example.com\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameters**: issue_key, assignee\n\n"
+                "Example: jira_issues(operation=\"assign\", issue_key=\"ENG-123\", "
+                "assignee=\"user@example.com\")"
+            )
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
-
-            issue_manager = IssueManager(jira_client.jira, credentials['site_url'])
-            issue = issue_manager.assign_issue(issue_key, assignee)
+            issue_manager = await self._get_issue_manager(credentials)
+            issue = await asyncio.to_thread(issue_manager.assign_issue, issue_key, assignee)
 
             result = (
                 f"✅ **Issue Assigned**: {issue['key']}\n\n"
@@ -1707,28 +1427,13 @@ class JiraMCPServer:
                 f"**URL**: {issue['url']}"
             )
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text=result
-                )
-            ]
+            return _text(result)
 
         except (WorkspaceError, JiraClientError, IssueManagerError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error assigning issue: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     async def _handle_transition_issue(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle transition issue operation."""
@@ -1736,30 +1441,18 @@ class JiraMCPServer:
         transition = arguments.get("transition")
 
         if not issue_key or not transition:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameters**: issue_key, transition\n\n"
-                        "Example: jira_issues(operation=\"transition\", issue_key=\"ENG-123\", "
-                        "transition=\"In Progress\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameters**: issue_key, transition\n\n"
+                "Example: jira_issues(operation=\"transition\", issue_key=\"ENG-123\", "
+                "transition=\"In Progress\")"
+            )
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
-
-            issue_manager = IssueManager(jira_client.jira, credentials['site_url'])
+            issue_manager = await self._get_issue_manager(credentials)
             comment = arguments.get("comment")
 
-            issue = issue_manager.transition_issue(issue_key, transition, comment)
+            issue = await asyncio.to_thread(issue_manager.transition_issue, issue_key, transition, comment)
 
             result = (
                 f"✅ **Issue Transitioned**: {issue['key']}\n\n"
@@ -1767,62 +1460,30 @@ class JiraMCPServer:
                 f"**URL**: {issue['url']}"
             )
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text=result
-                )
-            ]
+            return _text(result)
 
         except (WorkspaceError, JiraClientError, IssueManagerError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error transitioning issue: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     async def _handle_get_transitions(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle get transitions operation."""
         issue_key = arguments.get("issue_key")
         if not issue_key:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameter**: issue_key\n\n"
-                        "Example: jira_issues(operation=\"get_transitions\", issue_key=\"ENG-123\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameter**: issue_key\n\n"
+                "Example: jira_issues(operation=\"get_transitions\", issue_key=\"ENG-123\")"
+            )
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
-
-            issue_manager = IssueManager(jira_client.jira, credentials['site_url'])
-            transitions = issue_manager.get_transitions(issue_key)
+            issue_manager = await self._get_issue_manager(credentials)
+            transitions = await asyncio.to_thread(issue_manager.get_transitions, issue_key)
 
             if not transitions:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"ℹ️ **No transitions available** for {issue_key}"
-                    )
-                ]
+                return _text(f"ℹ️ **No transitions available** for {issue_key}")
 
             # Format transitions list
             result_lines = [f"🔄 **Available Transitions for {issue_key}**\n"]
@@ -1830,62 +1491,30 @@ class JiraMCPServer:
             for trans in transitions:
                 result_lines.append(f"- **{trans['name']}** (ID: {trans['id']})")
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text="\n".join(result_lines)
-                )
-            ]
+            return _text("\n".join(result_lines))
 
         except (WorkspaceError, JiraClientError, IssueManagerError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error getting transitions: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     async def _handle_list_comments(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle list comments operation."""
         issue_key = arguments.get("issue_key")
         if not issue_key:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameter**: issue_key\n\n"
-                        "Example: jira_issues(operation=\"list_comments\", issue_key=\"ENG-123\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameter**: issue_key\n\n"
+                "Example: jira_issues(operation=\"list_comments\", issue_key=\"ENG-123\")"
+            )
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
-
-            issue_manager = IssueManager(jira_client.jira, credentials['site_url'])
-            comments = issue_manager.list_comments(issue_key)
+            issue_manager = await self._get_issue_manager(credentials)
+            comments = await asyncio.to_thread(issue_manager.list_comments, issue_key)
 
             if not comments:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"ℹ️ **No comments** on {issue_key}"
-                    )
-                ]
+                return _text(f"ℹ️ **No comments** on {issue_key}")
 
             # Format comments list
             result_lines = [f"💬 **Comments on {issue_key}**\n"]
@@ -1899,28 +1528,13 @@ class JiraMCPServer:
 
             result_lines.append(f"**Total comments**: {len(comments)}")
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text="\n".join(result_lines)
-                )
-            ]
+            return _text("\n".join(result_lines))
 
         except (WorkspaceError, JiraClientError, IssueManagerError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error listing comments: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     async def _handle_add_comment(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle add comment operation."""
@@ -1928,28 +1542,16 @@ class JiraMCPServer:
         body = arguments.get("body")
 
         if not issue_key or not body:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameters**: issue_key, body\n\n"
-                        "Example: jira_issues(operation=\"add_comment\", issue_key=\"ENG-123\", "
-                        "body=\"This is my comment\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameters**: issue_key, body\n\n"
+                "Example: jira_issues(operation=\"add_comment\", issue_key=\"ENG-123\", "
+                "body=\"This is my comment\")"
+            )
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
-
-            issue_manager = IssueManager(jira_client.jira, credentials['site_url'])
-            comment = issue_manager.add_comment(issue_key, body)
+            issue_manager = await self._get_issue_manager(credentials)
+            comment = await asyncio.to_thread(issue_manager.add_comment, issue_key, body)
 
             result = (
                 f"✅ **Comment Added** to {issue_key}\n\n"
@@ -1959,28 +1561,13 @@ class JiraMCPServer:
                 f"**Body**: {comment['body']}"
             )
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text=result
-                )
-            ]
+            return _text(result)
 
         except (WorkspaceError, JiraClientError, IssueManagerError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error adding comment: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     async def _handle_update_comment(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle update comment operation."""
@@ -1989,28 +1576,16 @@ class JiraMCPServer:
         body = arguments.get("body")
 
         if not issue_key or not comment_id or not body:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameters**: issue_key, comment_id, body\n\n"
-                        "Example: jira_issues(operation=\"update_comment\", issue_key=\"ENG-123\", "
-                        "comment_id=\"12345\", body=\"Updated comment text\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameters**: issue_key, comment_id, body\n\n"
+                "Example: jira_issues(operation=\"update_comment\", issue_key=\"ENG-123\", "
+                "comment_id=\"12345\", body=\"Updated comment text\")"
+            )
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
-
-            issue_manager = IssueManager(jira_client.jira, credentials['site_url'])
-            comment = issue_manager.update_comment(issue_key, comment_id, body)
+            issue_manager = await self._get_issue_manager(credentials)
+            comment = await asyncio.to_thread(issue_manager.update_comment, issue_key, comment_id, body)
 
             result = (
                 f"✅ **Comment Updated** on {issue_key}\n\n"
@@ -2020,28 +1595,13 @@ class JiraMCPServer:
                 f"**Body**: {comment['body']}"
             )
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text=result
-                )
-            ]
+            return _text(result)
 
         except (WorkspaceError, JiraClientError, IssueManagerError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error updating comment: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     async def _handle_delete_comment(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle delete comment operation."""
@@ -2049,90 +1609,46 @@ class JiraMCPServer:
         comment_id = arguments.get("comment_id")
 
         if not issue_key or not comment_id:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameters**: issue_key, comment_id\n\n"
-                        "Example: jira_issues(operation=\"delete_comment\", issue_key=\"ENG-123\", "
-                        "comment_id=\"12345\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameters**: issue_key, comment_id\n\n"
+                "Example: jira_issues(operation=\"delete_comment\", issue_key=\"ENG-123\", "
+                "comment_id=\"12345\")"
+            )
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
-
-            issue_manager = IssueManager(jira_client.jira, credentials['site_url'])
-            issue_manager.delete_comment(issue_key, comment_id)
+            issue_manager = await self._get_issue_manager(credentials)
+            await asyncio.to_thread(issue_manager.delete_comment, issue_key, comment_id)
 
             result = (
                 f"✅ **Comment Deleted** from {issue_key}\n\n"
                 f"**Comment ID**: {comment_id}"
             )
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text=result
-                )
-            ]
+            return _text(result)
 
         except (WorkspaceError, JiraClientError, IssueManagerError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error deleting comment: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     async def _handle_list_attachments(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle list attachments operation."""
         issue_key = arguments.get("issue_key")
         if not issue_key:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameter**: issue_key\n\n"
-                        "Example: jira_issues(operation=\"list_attachments\", issue_key=\"ENG-123\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameter**: issue_key\n\n"
+                "Example: jira_issues(operation=\"list_attachments\", issue_key=\"ENG-123\")"
+            )
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
-
-            issue_manager = IssueManager(jira_client.jira, credentials['site_url'])
-            attachments = issue_manager.list_attachments(issue_key)
+            issue_manager = await self._get_issue_manager(credentials)
+            attachments = await asyncio.to_thread(issue_manager.list_attachments, issue_key)
 
             if not attachments:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"ℹ️ **No attachments** on {issue_key}"
-                    )
-                ]
+                return _text(f"ℹ️ **No attachments** on {issue_key}")
 
             # Format attachments list
             result_lines = [f"📎 **Attachments on {issue_key}**\n"]
@@ -2148,28 +1664,13 @@ class JiraMCPServer:
 
             result_lines.append(f"**Total attachments**: {len(attachments)}")
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text="\n".join(result_lines)
-                )
-            ]
+            return _text("\n".join(result_lines))
 
         except (WorkspaceError, JiraClientError, IssueManagerError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error listing attachments: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     async def _handle_add_attachment(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle add attachment operation."""
@@ -2177,28 +1678,16 @@ class JiraMCPServer:
         filepath = arguments.get("filepath")
 
         if not issue_key or not filepath:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameters**: issue_key, filepath\n\n"
-                        "Example: jira_issues(operation=\"add_attachment\", issue_key=\"ENG-123\", "
-                        "filepath=\"/path/to/file.pdf\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameters**: issue_key, filepath\n\n"
+                "Example: jira_issues(operation=\"add_attachment\", issue_key=\"ENG-123\", "
+                "filepath=\"/path/to/file.pdf\")"
+            )
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
-
-            issue_manager = IssueManager(jira_client.jira, credentials['site_url'])
-            attachment = issue_manager.add_attachment(issue_key, filepath)
+            issue_manager = await self._get_issue_manager(credentials)
+            attachment = await asyncio.to_thread(issue_manager.add_attachment, issue_key, filepath)
 
             size_kb = attachment['size'] / 1024
             result = (
@@ -2210,83 +1699,41 @@ class JiraMCPServer:
                 f"**Created**: {attachment['created']}"
             )
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text=result
-                )
-            ]
+            return _text(result)
 
         except (WorkspaceError, JiraClientError, IssueManagerError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error adding attachment: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     async def _handle_delete_attachment(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle delete attachment operation."""
         attachment_id = arguments.get("attachment_id")
 
         if not attachment_id:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameter**: attachment_id\n\n"
-                        "Example: jira_issues(operation=\"delete_attachment\", attachment_id=\"12345\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameter**: attachment_id\n\n"
+                "Example: jira_issues(operation=\"delete_attachment\", attachment_id=\"12345\")"
+            )
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
-
-            issue_manager = IssueManager(jira_client.jira, credentials['site_url'])
-            issue_manager.delete_attachment(attachment_id)
+            issue_manager = await self._get_issue_manager(credentials)
+            await asyncio.to_thread(issue_manager.delete_attachment, attachment_id)
 
             result = (
                 f"✅ **Attachment Deleted**\n\n"
                 f"**Attachment ID**: {attachment_id}"
             )
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text=result
-                )
-            ]
+            return _text(result)
 
         except (WorkspaceError, JiraClientError, IssueManagerError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error deleting attachment: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     async def _handle_create_link(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle create link operation."""
@@ -2295,28 +1742,16 @@ class JiraMCPServer:
         link_type = arguments.get("link_type", "Relates")
 
         if not inward_issue or not outward_issue:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameters**: inward_issue, outward_issue\n\n"
-                        "Example: jira_issues(operation=\"create_link\", inward_issue=\"ENG-123\", "
-                        "outward_issue=\"ENG-456\", link_type=\"Relates\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameters**: inward_issue, outward_issue\n\n"
+                "Example: jira_issues(operation=\"create_link\", inward_issue=\"ENG-123\", "
+                "outward_issue=\"ENG-456\", link_type=\"Relates\")"
+            )
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
-
-            issue_manager = IssueManager(jira_client.jira, credentials['site_url'])
-            link = issue_manager.create_link(inward_issue, outward_issue, link_type)
+            issue_manager = await self._get_issue_manager(credentials)
+            link = await asyncio.to_thread(issue_manager.create_link, inward_issue, outward_issue, link_type)
 
             result = (
                 f"✅ **Link Created**\n\n"
@@ -2325,117 +1760,58 @@ class JiraMCPServer:
                 f"**Link Type**: {link['link_type']}"
             )
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text=result
-                )
-            ]
+            return _text(result)
 
         except (WorkspaceError, JiraClientError, IssueManagerError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error creating link: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     async def _handle_delete_link(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle delete link operation."""
         link_id = arguments.get("link_id")
 
         if not link_id:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameter**: link_id\n\n"
-                        "Example: jira_issues(operation=\"delete_link\", link_id=\"12345\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameter**: link_id\n\n"
+                "Example: jira_issues(operation=\"delete_link\", link_id=\"12345\")"
+            )
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
-
-            issue_manager = IssueManager(jira_client.jira, credentials['site_url'])
-            issue_manager.delete_link(link_id)
+            issue_manager = await self._get_issue_manager(credentials)
+            await asyncio.to_thread(issue_manager.delete_link, link_id)
 
             result = (
                 f"✅ **Link Deleted**\n\n"
                 f"**Link ID**: {link_id}"
             )
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text=result
-                )
-            ]
+            return _text(result)
 
         except (WorkspaceError, JiraClientError, IssueManagerError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error deleting link: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     async def _handle_list_links(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle list links operation."""
         issue_key = arguments.get("issue_key")
         if not issue_key:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameter**: issue_key\n\n"
-                        "Example: jira_issues(operation=\"list_links\", issue_key=\"ENG-123\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameter**: issue_key\n\n"
+                "Example: jira_issues(operation=\"list_links\", issue_key=\"ENG-123\")"
+            )
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
-
-            issue_manager = IssueManager(jira_client.jira, credentials['site_url'])
-            links = issue_manager.list_links(issue_key)
+            issue_manager = await self._get_issue_manager(credentials)
+            links = await asyncio.to_thread(issue_manager.list_links, issue_key)
 
             if not links:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"ℹ️ **No links** on {issue_key}"
-                    )
-                ]
+                return _text(f"ℹ️ **No links** on {issue_key}")
 
             # Format links list
             result_lines = [f"🔗 **Links on {issue_key}**\n"]
@@ -2448,28 +1824,13 @@ class JiraMCPServer:
 
             result_lines.append(f"**Total links**: {len(links)}")
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text="\n".join(result_lines)
-                )
-            ]
+            return _text("\n".join(result_lines))
 
         except (WorkspaceError, JiraClientError, IssueManagerError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error listing links: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     async def _handle_create_subtask(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle create subtask operation."""
@@ -2477,27 +1838,15 @@ class JiraMCPServer:
         summary = arguments.get("summary")
 
         if not parent_key or not summary:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameters**: parent_key, summary\n\n"
-                        "Example: jira_issues(operation=\"create_subtask\", parent_key=\"ENG-123\", "
-                        "summary=\"Subtask title\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameters**: parent_key, summary\n\n"
+                "Example: jira_issues(operation=\"create_subtask\", parent_key=\"ENG-123\", "
+                "summary=\"Subtask title\")"
+            )
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
-
-            issue_manager = IssueManager(jira_client.jira, credentials['site_url'])
+            issue_manager = await self._get_issue_manager(credentials)
 
             # Extract optional fields
             description = arguments.get("description")
@@ -2507,7 +1856,8 @@ class JiraMCPServer:
             known_fields = {'operation', 'parent_key', 'summary', 'description', 'assignee'}
             additional_fields = {k: v for k, v in arguments.items() if k not in known_fields}
 
-            subtask = issue_manager.create_subtask(
+            subtask = await asyncio.to_thread(
+                issue_manager.create_subtask,
                 parent_key=parent_key,
                 summary=summary,
                 description=description,
@@ -2523,62 +1873,30 @@ class JiraMCPServer:
                 f"**URL**: {subtask['url']}"
             )
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text=result
-                )
-            ]
+            return _text(result)
 
         except (WorkspaceError, JiraClientError, IssueManagerError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error creating subtask: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
 
     async def _handle_list_subtasks(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
         """Handle list subtasks operation."""
         issue_key = arguments.get("issue_key")
         if not issue_key:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=(
-                        "❌ **Missing Required Parameter**: issue_key\n\n"
-                        "Example: jira_issues(operation=\"list_subtasks\", issue_key=\"ENG-123\")"
-                    )
-                )
-            ]
+            return _text(
+                "❌ **Missing Required Parameter**: issue_key\n\n"
+                "Example: jira_issues(operation=\"list_subtasks\", issue_key=\"ENG-123\")"
+            )
 
         try:
             credentials = self.workspace_manager.get_workspace_credentials()
-            jira_client = JiraClient(
-                credentials['site_url'],
-                credentials['email'],
-                credentials['api_token'],
-                credentials['auth_type']
-            )
-
-            issue_manager = IssueManager(jira_client.jira, credentials['site_url'])
-            subtasks = issue_manager.list_subtasks(issue_key)
+            issue_manager = await self._get_issue_manager(credentials)
+            subtasks = await asyncio.to_thread(issue_manager.list_subtasks, issue_key)
 
             if not subtasks:
-                return [
-                    types.TextContent(
-                        type="text",
-                        text=f"ℹ️ **No subtasks** on {issue_key}"
-                    )
-                ]
+                return _text(f"ℹ️ **No subtasks** on {issue_key}")
 
             # Format subtasks list
             result_lines = [f"📋 **Subtasks of {issue_key}**\n"]
@@ -2594,28 +1912,76 @@ class JiraMCPServer:
 
             result_lines.append(f"**Total subtasks**: {len(subtasks)}")
 
-            return [
-                types.TextContent(
-                    type="text",
-                    text="\n".join(result_lines)
-                )
-            ]
+            return _text("\n".join(result_lines))
 
         except (WorkspaceError, JiraClientError, IssueManagerError) as error:
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
         except Exception as error:
             logger.error("Error listing subtasks: %s", error)
-            return [
-                types.TextContent(
-                    type="text",
-                    text=f"❌ **Error**: {str(error)}"
-                )
-            ]
+            return _text(f"❌ **Error**: {str(error)}")
+
+    async def _handle_batch_execute(self, arguments: Dict[str, Any]) -> List[types.TextContent]:
+        """Handle batch_execute operation - run several issue operations in one call."""
+        calls = arguments.get("calls")
+        if not calls or not isinstance(calls, list):
+            return _text(
+                "❌ **Missing Required Parameter**: calls\n\n"
+                "Example: jira_issues(operation=\"batch_execute\", calls=["
+                "{\"operation\": \"read\", \"arguments\": {\"issue_key\": \"ENG-1\"}}, "
+                "{\"operation\": \"read\", \"arguments\": {\"issue_key\": \"ENG-2\"}}])"
+            )
+        if len(calls) > BATCH_MAX_CALLS:
+            return _text(f"❌ **Too Many Calls**: {len(calls)} (maximum {BATCH_MAX_CALLS} per batch)")
+
+        # Reject the whole batch up front rather than running part of it
+        batch: List[Tuple[str, Dict[str, Any]]] = []
+        for index, call in enumerate(calls, 1):
+            operation = call.get("operation") if isinstance(call, dict) else None
+            if operation == "batch_execute" or operation not in self._issues_handlers:
+                return _text(
+                    f"❌ **Invalid Operation** in call {index}: '{operation}'\n\n"
+                    f"Available operations: {BATCHABLE_ISSUES_OPERATIONS}"
+                )
+            if not isinstance(call.get("arguments") or {}, dict):
+                return _text(f"❌ **Invalid Arguments** in call {index}: 'arguments' must be an object")
+            # Sub-calls get the same schema check as a top-level jira_issues call
+            sub_arguments = {**(call.get("arguments") or {}), "operation": operation}
+            try:
+                _VALIDATORS["jira_issues"].validate(sub_arguments)
+            except jsonschema.ValidationError as validation_error:
+                return _text(f"❌ **Invalid Arguments** in call {index}: {validation_error.message}")
+            batch.append((operation, sub_arguments))
+
+        max_concurrent = max(1, int(arguments.get("max_concurrent", BATCH_DEFAULT_CONCURRENCY)))
+        stop_on_error = bool(arguments.get("stop_on_error", False))
+        semaphore = asyncio.Semaphore(max_concurrent)
+        failed = asyncio.Event()
+
+        async def run(operation: str, sub_arguments: Dict[str, Any]) -> str:
+            async with semaphore:
+                if stop_on_error and failed.is_set():
+                    return "⏭️ Skipped (an earlier call failed)"
+                try:
+                    content = await self._issues_handlers[operation](sub_arguments)
+                except Exception:
+                    # Reported by gather below; still counts as a failure for stop_on_error
+                    failed.set()
+                    raise
+                text = "\n".join(block.text for block in content)
+                if text.startswith("❌"):
+                    failed.set()
+                return text
+
+        results = await asyncio.gather(*(run(*entry) for entry in batch), return_exceptions=True)
+
+        sections = [f"📦 **Batch Results** ({len(batch)} calls)\n"]
+        for index, ((operation, _), result) in enumerate(zip(batch, results), 1):
+            if isinstance(result, BaseException):
+                logger.error("Error in batch call %d (%s): %s", index, operation, result)
+                result = f"❌ **Error**: {str(result)}"
+            sections.append(f"**[{index}] {operation}**\n{result}\n")
+
+        return _text("\n".join(sections))
 
     def get_server_info(self) -> Dict[str, Any]:
         """
@@ -7,9 +7,13 @@ import asyncio
 import logging
 import os
 import signal
+import socket
+import stat
 import sys
 from pathlib import Path
+from typing import Optional, cast
 
+from anyio import AsyncFile
 from dotenv import load_dotenv
 from mcp.server.stdio import stdio_server
 
@@ -21,6 +25,7 @@ logger = logging.getLogger("jira-mcp")
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from jira_mcp.config import load_config  # pylint: disable=wrong-import-position
 from jira_mcp.mcp_server import JiraMCPServer  # pylint: disable=wrong-import-position
+from jira_mcp.utils import default_socket_path, ensure_private_dir  # noqa: E402  # pylint: disable=wrong-import-position
 
 
 # Signal handlers for graceful shutdown
@@ -38,6 +43,64 @@ signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 
 
+def _create_mcp_server() -> JiraMCPServer:
+    """
+    Load configuration and build the MCP server with its tools registered.
+
+    Returns:
+        Initialized JiraMCPServer instance
+    """
+    logger.info("🚀 Initializing Jira MCP Server")
+    logger.info("Phase 2: MCP Server + Workspace Management")
+
+    # Check for multi-workspace mode
+    active_workspace_file = Path('.env.active')
+    active_workspace = None
+    if active_workspace_file.exists():
+        try:
+            active_workspace = active_workspace_file.read_text(encoding='utf-8').strip()
+            if active_workspace:
+                logger.info("🔑 Multi-workspace mode: Using workspace '%s'", active_workspace)
+        except (OSError, IOError) as e:
+            logger.warning("Could not read .env.active: %s", e)
+
+    # Load environment variables (with workspace-specific file if needed)
+    if active_workspace:
+        env_file = f'.env.{active_workspace}'
+        load_dotenv(env_file)
+        logger.debug("Environment variables loaded from %s", env_file)
+    else:
+        load_dotenv()
+        logger.debug("Environment variables loaded from .env file")
+
+    # Load configuration
+    config = load_config(workspace_name=active_workspace)
+    logger.info("✅ Configuration loaded successfully")
+
+    # Initialize MCP server
+    mcp_server = JiraMCPServer(config)
+    mcp_server.register_tools()
+
+    server_info = mcp_server.get_server_info()
+    logger.info(
+        "✅ MCP Server initialized: %s v%s",
+        server_info["server_name"],
+        server_info["server_version"],
+    )
+    logger.info("🔧 Registered tools: %s", ", ".join(server_info["registered_tools"]))
+
+    return mcp_server
+
+
+def _log_troubleshooting(server_error: Exception) -> None:
+    """Log a fatal server error together with troubleshooting hints."""
+    logger.error("❌ MCP server failed: %s", server_error, exc_info=True)
+    logger.error("🔧 Troubleshooting:")
+    logger.error("   1. Check your .env file configuration")
+    logger.error("   2. Verify Jira API credentials")
+    logger.error("   3. Ensure workspace is configured")
+
+
 async def run():
     """
     Main MCP server entry point.
@@ -46,44 +109,7 @@ async def run():
     with proper configuration and error handling.
     """
     try:
-        logger.info("🚀 Initializing Jira MCP Server")
-        logger.info("Phase 2: MCP Server + Workspace Management")
-
-        # Check for multi-workspace mode
-        active_workspace_file = Path('.env.active')
-        active_workspace = None
-        if active_workspace_file.exists():
-            try:
-                active_workspace = active_workspace_file.read_text(encoding='utf-8').strip()
-                if active_workspace:
-                    logger.info("🔑 Multi-workspace mode: Using workspace '%s'", active_workspace)
-            except (OSError, IOError) as e:
-                logger.warning("Could not read .env.active: %s", e)
-
-        # Load environment variables (with workspace-specific file if needed)
-        if active_workspace:
-            env_file = f'.env.{active_workspace}'
-            load_dotenv(env_file)
-            logger.debug("Environment variables loaded from %s", env_file)
-        else:
-            load_dotenv()
-            logger.debug("Environment variables loaded from .env file")
-
-        # Load configuration
-        config = load_config(workspace_name=active_workspace)
-        logger.info("✅ Configuration loaded successfully")
-
-        # Initialize MCP server
-        mcp_server = JiraMCPServer(config)
-        mcp_server.register_tools()
-
-        server_info = mcp_server.get_server_info()
-        logger.info(
-            "✅ MCP Server initialized: %s v%s",
-            server_info["server_name"],
-            server_info["server_version"],
-        )
-        logger.info("🔧 Registered tools: %s", ", ".join(server_info["registered_tools"]))
+        mcp_server = _create_mcp_server()
 
         # Start MCP server with STDIO transport
         logger.info("📡 Starting MCP server with STDIO transport")
@@ -98,11 +124,128 @@ async def run():
     except KeyboardInterrupt:
         logger.info("👋 MCP server stopped by user")
     except (ValueError, KeyError, OSError, RuntimeError) as server_error:
-        logger.error("❌ MCP server failed: %s", server_error, exc_info=True)
-        logger.error("🔧 Troubleshooting:")
-        logger.error("   1. Check your .env file configuration")
-        logger.error("   2. Verify Jira API credentials")
-        logger.error("   3. Ensure workspace is configured")
+        _log_troubleshooting(server_error)
+        raise
+
+
+class _SocketLineReader:
+    """Async line iterator over a socket, shaped like the stdin file stdio_server expects."""
+
+    def __init__(self, reader: asyncio.StreamReader) -> None:
+        self._reader = reader
+
+    def __aiter__(self) -> "_SocketLineReader":
+        return self
+
+    async def __anext__(self) -> str:
+        line = await self._reader.readline()
+        if not line:
+            raise StopAsyncIteration
+        return line.decode('utf-8', errors='replace')
+
+
+class _SocketLineWriter:
+    """Async text writer over a socket, shaped like the stdout file stdio_server expects."""
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        self._writer = writer
+
+    async def write(self, data: str) -> None:
+        """Queue text for sending."""
+        self._writer.write(data.encode('utf-8'))
+
+    async def flush(self) -> None:
+        """Wait until queued text has been handed to the socket."""
+        await self._writer.drain()
+
+
+def _prepare_socket_path(socket_path: str) -> None:
+    """
+    Remove a stale socket file left behind by a previous daemon.
+
+    Raises:
+        RuntimeError: If the path is not a socket, or another daemon is
+            already listening on it
+    """
+    try:
+        mode = os.lstat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise RuntimeError(f"Daemon socket path exists and is not a socket: {socket_path}")
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except OSError:
+        os.unlink(socket_path)
+        logger.debug("Removed stale daemon socket %s", socket_path)
+    else:
+        raise RuntimeError(f"A jira-mcp daemon is already listening on {socket_path}")
+    finally:
+        probe.close()
+
+
+async def run_daemon(socket_path: Optional[str] = None) -> None:
+    """
+    Run the MCP server as a long-lived daemon on a Unix socket.
+
+    The interpreter, Jira SDK and MCP server are initialized once; every
+    connection (normally from the jira-mcp-client shim) gets its own MCP
+    session speaking newline-delimited JSON-RPC, exactly as over STDIO.
+
+    Args:
+        socket_path: Unix socket path (defaults to $XDG_RUNTIME_DIR/jira-mcp.sock)
+    """
+    if socket_path is None:
+        socket_path = default_socket_path()
+        # The default may be under the shared temp directory; keep its directory private
+        ensure_private_dir(os.path.dirname(socket_path))
+
+    try:
+        mcp_server = _create_mcp_server()
+
+        async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            logger.debug("Daemon client connected")
+            try:
+                # stdio_server only reads lines, writes and flushes, which the
+                # adapters implement; it is typed for anyio's AsyncFile
+                async with stdio_server(
+                    cast(AsyncFile[str], _SocketLineReader(reader)),
+                    cast(AsyncFile[str], _SocketLineWriter(writer)),
+                ) as streams:
+                    await mcp_server.app.run(
+                        streams[0], streams[1], mcp_server.app.create_initialization_options()
+                    )
+            except (OSError, RuntimeError) as session_error:
+                logger.warning("Daemon session ended with error: %s", session_error)
+            finally:
+                writer.close()
+                logger.debug("Daemon client disconnected")
+
+        _prepare_socket_path(socket_path)
+
+        # Credentials are reachable through this socket - keep it owner-only
+        previous_umask = os.umask(0o177)
+        try:
+            daemon = await asyncio.start_unix_server(handle_connection, path=socket_path)
+        finally:
+            os.umask(previous_umask)
+
+        logger.info("📡 Starting MCP server daemon on %s", socket_path)
+        logger.info("🔗 Connect with: jira-mcp-client --socket %s", socket_path)
+
+        try:
+            async with daemon:
+                await daemon.serve_forever()
+        finally:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+
+    except KeyboardInterrupt:
+        logger.info("👋 MCP server daemon stopped by user")
+    except (ValueError, KeyError, OSError, RuntimeError) as server_error:
+        _log_troubleshooting(server_error)
         raise
 
 
@@ -5,7 +5,16 @@ Utility functions for Jira MCP server.
 Common helper functions shared across modules.
 """
 
-from typing import Any
+import functools
+import inspect
+import logging
+import os
+import stat
+import tempfile
+import time
+from typing import Any, Callable, Dict, Tuple, Type, TypeVar, cast
+
+_F = TypeVar('_F', bound=Callable[..., Any])
 
 
 def get_user_attribute(
@@ -36,3 +45,133 @@ def get_user_attribute(
         return getattr(user_obj, server_attr)
     # Return default
     return default
+
+
+def wraps_jira_errors(error_class: Type[Exception], failure: str, unexpected: str) -> Callable[[_F], _F]:
+    """
+    Decorate a method so every failure surfaces as error_class.
+
+    Errors are logged with the logger of the decorated function's module.
+
+    Args:
+        error_class: Exception raised in place of any other error
+        failure: Message for Jira API errors, formatted with the call's arguments
+            by name (e.g. "Failed to get issue {issue_key}")
+        unexpected: Message for any other error
+
+    Returns:
+        Method decorator
+    """
+    # Only the Jira modules use this, and they import jira anyway; keep it out
+    # of module scope so the daemon client shim stays free of the Jira SDK
+    from jira.exceptions import JIRAError
+
+    def decorator(func: _F) -> _F:
+        signature = inspect.signature(func)
+        logger = logging.getLogger(func.__module__)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except error_class:
+                raise
+            except JIRAError as e:
+                context = failure.format(**signature.bind(*args, **kwargs).arguments)
+                error_msg = f"{context}: {e.text if hasattr(e, 'text') else str(e)}"
+                logger.error("❌ %s", error_msg)
+                raise error_class(error_msg) from e
+            except Exception as e:
+                error_msg = f"{unexpected}: {str(e)}"
+                logger.error("❌ %s", error_msg)
+                raise error_class(error_msg) from e
+
+        return cast(_F, wrapper)
+
+    return decorator
+
+
+def default_socket_path() -> str:
+    """
+    Get the default Unix socket path for daemon mode.
+
+    Uses $XDG_RUNTIME_DIR when set, otherwise a per-user directory in the temp
+    directory (created owner-only by the daemon, see ensure_private_dir).
+    Kept dependency-free so the client shim can import it without the server stack.
+
+    Returns:
+        Absolute socket path
+    """
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if not runtime_dir:
+        runtime_dir = os.path.join(tempfile.gettempdir(), f'jira-mcp-{os.getuid()}')
+    return os.path.join(runtime_dir, 'jira-mcp.sock')
+
+
+def ensure_private_dir(path: str) -> None:
+    """
+    Create a directory readable only by this user, or check an existing one is.
+
+    The temp directory is shared, so another user could create the path first;
+    an existing directory is only accepted if this user owns it and no one
+    else can access it.
+
+    Args:
+        path: Directory path
+
+    Raises:
+        RuntimeError: If the path is not a private directory owned by this user
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or stat.S_IMODE(info.st_mode) & 0o077:
+        raise RuntimeError(f"{path} must be a directory owned by this user with mode 0700")
+
+
+class DuplicateErrorFilter(logging.Filter):
+    """
+    Drop repeats of the same error record within a short window.
+
+    A burst of failing calls (e.g. an agent retrying one bad request) would
+    otherwise write the same error line once per call. Records below ERROR
+    always pass.
+    """
+
+    def __init__(self, window: float = 1.0, max_entries: int = 32) -> None:
+        """
+        Initialize the filter.
+
+        Args:
+            window: Seconds during which an identical error is suppressed
+            max_entries: Number of distinct recent errors remembered
+        """
+        super().__init__()
+        self.window = window
+        self.max_entries = max_entries
+        self._last_seen: Dict[Tuple[str, int, str], float] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """
+        Decide whether a record is emitted.
+
+        Args:
+            record: Log record being handled
+
+        Returns:
+            False if an identical error was emitted within the window
+        """
+        if record.levelno < logging.ERROR:
+            return True
+
+        key = (record.name, record.levelno, record.getMessage())
+        now = time.monotonic()
+        last = self._last_seen.get(key)
+        if last is not None and now - last < self.window:
+            return False
+
+        # Remember when it was last emitted; oldest entries are evicted first
+        self._last_seen.pop(key, None)
+        self._last_seen[key] = now
+        if len(self._last_seen) > self.max_entries:
+            self._last_seen.pop(next(iter(self._last_seen)), None)
+        return True
@@ -10,7 +10,7 @@ import logging
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -328,13 +328,7 @@ class WorkspaceManager:
         if not metadata:
             return None
 
-        return {
-            'name': self._active_workspace_name,
-            'site_url': metadata.get('site_url', 'Unknown'),
-            'email': metadata.get('email', 'Unknown'),
-            'last_validated': metadata.get('last_validated'),
-            'created': metadata.get('created')
-        }
+        return self._workspace_info(self._active_workspace_name, metadata)
 
     def get_workspace_credentials(self, workspace_name: Optional[str] = None) -> Dict[str, str]:
         """
@@ -360,6 +354,42 @@ class WorkspaceManager:
         if not metadata:
             raise WorkspaceError(f"Workspace '{workspace_name}' not found")
 
+        return self._workspace_credentials(metadata)
+
+    def get_active_workspace_with_credentials(self) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Get the active workspace information and its credentials in one lookup.
+
+        Returns:
+            Tuple of (active workspace information, credentials dictionary)
+
+        Raises:
+            WorkspaceError: If no workspace is active
+        """
+        workspace_name = self._active_workspace_name
+        if not workspace_name:
+            raise WorkspaceError("No active workspace and no workspace specified")
+
+        metadata = self._workspace_registry.get(workspace_name)
+        if not metadata:
+            raise WorkspaceError(f"Workspace '{workspace_name}' not found")
+
+        return self._workspace_info(workspace_name, metadata), self._workspace_credentials(metadata)
+
+    @staticmethod
+    def _workspace_info(workspace_name: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the public (credential-free) view of a workspace."""
+        return {
+            'name': workspace_name,
+            'site_url': metadata.get('site_url', 'Unknown'),
+            'email': metadata.get('email', 'Unknown'),
+            'last_validated': metadata.get('last_validated'),
+            'created': metadata.get('created')
+        }
+
+    @staticmethod
+    def _workspace_credentials(metadata: Dict[str, Any]) -> Dict[str, str]:
+        """Extract the connection credentials from workspace metadata."""
         return {
             'site_url': metadata['site_url'],
             'email': metadata['email'],